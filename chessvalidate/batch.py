@@ -0,0 +1,17 @@
+# batch.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Chess results source document validation without a display.
+
+Usage: python -m chessvalidate.batch [-o OUTPUT] [--strict] [--extract]
+       [-j JOBS] [-s SUMMARY] [-w [SECONDS]] [--profile-rules] [-t SECONDS]
+       folder ...
+
+"""
+
+if __name__ == "__main__":
+
+    from .core.batchvalidate import main
+
+    raise SystemExit(main())
@@ -0,0 +1,16 @@
+# checkrules.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Check event extraction rules in an extracted.conf file.
+
+Usage: python -m chessvalidate.checkrules [--no-samples] [-p PROFILE]
+       configuration [extracts ...]
+
+"""
+
+if __name__ == "__main__":
+
+    from .core.checkrules import main
+
+    raise SystemExit(main())
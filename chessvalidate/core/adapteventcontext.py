@@ -3,7 +3,6 @@
 # Licence: See LICENCE (BSD licence)
 
 """Convert EventData items to style used by Report and Schedule classes."""
-import tkinter.messagebox
 from datetime import date
 
 from solentware_misc.core import utilities
@@ -15,6 +14,7 @@ from .found import (
     Score,
     Found,
 )
+from .policy import DialogPolicy
 
 # These should go in .gameresults or .constants
 ONENIL = "1-0"
@@ -58,6 +58,15 @@ class AdaptEventContext(EventContext):
         Score.error: "error",  # forces result to be not recognised
     }
 
+    def __init__(self, event_identity, policy=None):
+        """Extend with policy for reporting problems.
+
+        policy default is a DialogPolicy instance.
+
+        """
+        super().__init__(event_identity)
+        self.policy = DialogPolicy() if policy is None else policy
+
     @staticmethod
     def mangle(text):
         """Mangle lines starting with colour_rule or sectiontype keywords."""
@@ -449,7 +458,7 @@ class AdaptEventContext(EventContext):
                             )
                         )
                     elif row.is_match_and_game_result():
-                        tkinter.messagebox.showinfo(
+                        self.policy.inform(
                             message="".join(
                                 (
                                     "A tabular natch or game line is not ",
@@ -545,7 +554,7 @@ class AdaptEventContext(EventContext):
                             )
                         )
                     else:
-                        tkinter.messagebox.showinfo(
+                        self.policy.inform(
                             message="".join(
                                 ("A result line has been ignored.",)
                             ),
@@ -646,7 +655,7 @@ class AdaptEventContext(EventContext):
             # Some things which are reported as errors later are not seen as
             # errors here. Change the date in one of the rows for example, so
             # all games in a match are not given the same date.
-            tkinter.messagebox.showinfo(
+            self.policy.inform(
                 message="".join(
                     (
                         "An inconsistency has been found in the match ",
@@ -0,0 +1,559 @@
+# batchvalidate.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Validate event folders without a display.
+
+Each event folder is opened, the event is extracted, and the schedule and
+results are collated, as done by the Generate action in the Edit tab.  The
+problems which would be shown in dialogues are written to stderr and the
+generated reports are written to stdout or to files.
+
+Several event folders can be validated concurrently in a process pool, and
+a summary of the outcome for each folder written to a file.
+
+In watch mode the mailbox and extracts folders, and the text entry file, of
+each event folder are polled.  When they change the new emails are extracted
+and the event is validated again.
+
+The exit status of main() is:
+
+0 if all event folders validated without errors.
+1 if errors were reported for at least one event folder.
+2 if at least one event folder could not be opened or processed.
+
+"""
+
+import argparse
+import concurrent.futures
+import io
+import os
+import sys
+import time
+
+from .season import Season
+from .eventreport import EventReport
+from .policy import BatchPolicy
+from .extractmanifest import EXTRACT_MANIFEST
+
+# Status of validation of an event folder, and exit status for main().
+VALID = 0
+INVALID = 1
+FAILED = 2
+
+# Names of report files written for each event folder.
+SCHEDULE_REPORT = "rep_schedule"
+RESULTS_REPORT = "rep_results"
+
+# Default seconds between polls of event folders in watch mode.
+WATCH_INTERVAL = 5.0
+
+# Names of status values in summary file.
+_STATUS_NAMES = {VALID: "valid", INVALID: "invalid", FAILED: "failed"}
+
+# Column headings in summary file.
+_SUMMARY_HEADINGS = (
+    "folder",
+    "status",
+    "errors",
+    "open seconds",
+    "generate seconds",
+    "total seconds",
+    "reports",
+)
+
+
+class ValidationResult:
+    """Outcome of validating an event folder."""
+
+    def __init__(self, folder):
+        """Initialise outcome for folder as not processed."""
+        self.folder = folder
+        self.status = FAILED
+        self.error_count = 0
+        self.messages = []
+        self.report_paths = []
+        self.schedule_lines = []
+        self.results_lines = []
+        self.open_time = 0.0
+        self.generate_time = 0.0
+        self.total_time = 0.0
+
+    def summary_line(self):
+        """Return line for summary file."""
+        return "\t".join(
+            (
+                self.folder,
+                _STATUS_NAMES.get(self.status, str(self.status)),
+                str(self.error_count),
+                format(self.open_time, ".3f"),
+                format(self.generate_time, ".3f"),
+                format(self.total_time, ".3f"),
+                ";".join(self.report_paths),
+            )
+        )
+
+
+def validate_folder(
+    folder,
+    answer=True,
+    stream=None,
+    profile_rules=False,
+    time_budget=None,
+    max_workers=None,
+    season=None,
+    extract=False,
+    loaded_limit=None,
+):
+    """Return ValidationResult for event in folder.
+
+    answer - the answer given to all questions asked while validating.
+    stream - file object for problems reported, default sys.stderr.
+    profile_rules - if True write the profile of event configuration rules
+                    to folder.
+    time_budget - seconds a rule may take on a piece of text, or None.
+    max_workers - maximum number of processes used to load and parse the
+                  event, default is number of processors on machine.
+    season - the Season instance for folder kept between validations, or
+             None to use a new one made with the other arguments.
+    extract - if True extract emails newer than the extracts into folder,
+              otherwise folder is not changed by extraction.
+    loaded_limit - if not None the number of extract texts kept in memory,
+                   loading the others when needed.
+
+    """
+    start = time.perf_counter()
+    result = ValidationResult(folder)
+    policy = BatchPolicy(stream=stream, answer=answer, extract=extract)
+    result.messages = policy.reports
+    if season is None:
+        season = Season(
+            folder,
+            max_workers=max_workers,
+            loaded_limit=loaded_limit,
+            profile_rules=profile_rules,
+            time_budget=time_budget,
+        )
+    else:
+        season.close_documents()
+    opened = season.open_documents(None, policy=policy)
+    result.open_time = time.perf_counter() - start
+    if not opened:
+        result.total_time = result.open_time
+        return result
+    report = EventReport()
+    generated = report.build_event_report(season, policy)
+    result.total_time = time.perf_counter() - start
+    result.generate_time = result.total_time - result.open_time
+    if not generated:
+        return result
+    result.error_count = (
+        len(season.extract_errors)
+        + len(season.fixture_schedule.error)
+        + len(season.collation.reports.error)
+    )
+    result.schedule_lines = report.generated_schedule_lines(
+        report.generated_schedule
+    )
+    result.results_lines = report.generated_results_lines(
+        report.generated_results
+    )
+    result.status = INVALID if result.error_count else VALID
+    return result
+
+
+def write_reports(result, output):
+    """Write reports in result to folder named for event within output."""
+    folder = os.path.join(
+        output, os.path.basename(os.path.normpath(result.folder))
+    )
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    for name, lines in (
+        (SCHEDULE_REPORT, result.schedule_lines),
+        (RESULTS_REPORT, result.results_lines),
+    ):
+        path = os.path.join(folder, name)
+        with open(path, "w", encoding="utf8") as report_file:
+            report_file.write("\n".join(lines))
+        result.report_paths.append(path)
+
+
+def _validate_folder_job(
+    folder,
+    answer,
+    output,
+    profile_rules=False,
+    time_budget=None,
+    max_workers=None,
+    season=None,
+    extract=False,
+    loaded_limit=None,
+):
+    """Return ValidationResult for folder, catching any exception.
+
+    Problems are collected in the result rather than written to stderr so
+    reports from concurrent jobs are not interleaved.  The reports are
+    written to output, if given, by the job.
+
+    """
+    try:
+        result = validate_folder(
+            folder,
+            answer=answer,
+            stream=io.StringIO(),
+            profile_rules=profile_rules,
+            time_budget=time_budget,
+            max_workers=max_workers,
+            season=season,
+            extract=extract,
+            loaded_limit=loaded_limit,
+        )
+        if output and result.status != FAILED:
+            write_reports(result, output)
+    except Exception as exc:
+        result = ValidationResult(folder)
+        result.messages.append((exc.__class__.__name__, str(exc)))
+    return result
+
+
+def run_folders(
+    folders,
+    jobs=None,
+    answer=True,
+    output=None,
+    profile_rules=False,
+    time_budget=None,
+    extract=False,
+    loaded_limit=None,
+    max_workers=None,
+):
+    """Return list of ValidationResult for folders in same order.
+
+    The folders are validated in a pool of at most jobs processes, or in
+    this process if jobs is 1.  A folder which fails does not stop the
+    validation of the other folders.
+
+    Each folder validated in a pool job shares the processors between the
+    jobs: the processes used to load and parse its event are limited to the
+    number of processors divided by the number of jobs, at least one, unless
+    max_workers is given.
+
+    """
+    if jobs == 1 or len(folders) < 2:
+        return [
+            _validate_folder_job(
+                folder,
+                answer,
+                output,
+                profile_rules,
+                time_budget,
+                max_workers=max_workers,
+                extract=extract,
+                loaded_limit=loaded_limit,
+            )
+            for folder in folders
+        ]
+    results = []
+    workers = min(jobs or os.cpu_count() or 1, len(folders))
+    season_workers = max_workers or max(1, (os.cpu_count() or 1) // workers)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        futures = [
+            executor.submit(
+                _validate_folder_job,
+                folder,
+                answer,
+                output,
+                profile_rules,
+                time_budget,
+                season_workers,
+                None,
+                extract,
+                loaded_limit,
+            )
+            for folder in folders
+        ]
+        for folder, future in zip(folders, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                result = ValidationResult(folder)
+                result.messages.append((exc.__class__.__name__, str(exc)))
+                results.append(result)
+    return results
+
+
+def write_summary(results, path):
+    """Write summary line for each of results to file at path."""
+    with open(path, "w", encoding="utf8") as summary_file:
+        summary_file.write("\t".join(_SUMMARY_HEADINGS))
+        summary_file.write("\n")
+        for result in results:
+            summary_file.write(result.summary_line())
+            summary_file.write("\n")
+
+
+def _snapshot(paths):
+    """Return sizes and modification times of files at, or in, paths."""
+    snapshot = []
+    for path in paths:
+        try:
+            if os.path.isdir(path):
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(EXTRACT_MANIFEST):
+                            continue
+                        status = entry.stat()
+                        snapshot.append(
+                            (entry.path, status.st_size, status.st_mtime_ns)
+                        )
+            else:
+                status = os.stat(path)
+                snapshot.append((path, status.st_size, status.st_mtime_ns))
+        except OSError:
+            continue
+    return frozenset(snapshot)
+
+
+def _extract_new_emails(season, stream):
+    """Return paths of extracts made for emails new in mailbox of season."""
+    try:
+        new_paths = season.extract_new_emails()
+    except Exception as exc:
+        stream.write(
+            "".join(
+                (
+                    season.folder,
+                    ": ",
+                    exc.__class__.__name__,
+                    ": new emails not extracted: ",
+                    str(exc),
+                    "\n",
+                )
+            )
+        )
+        return ()
+    if not new_paths:
+        return ()
+    stream.write(
+        "".join(
+            (
+                season.folder,
+                ": ",
+                str(len(new_paths)),
+                " new emails extracted\n",
+            )
+        )
+    )
+    return new_paths
+
+
+def watch_folders(
+    folders,
+    interval=WATCH_INTERVAL,
+    answer=True,
+    output=None,
+    summary=None,
+    cycles=None,
+    profile_rules=False,
+    time_budget=None,
+    loaded_limit=None,
+    max_workers=None,
+):
+    """Validate folders each time their source documents change.
+
+    The folders are polled every interval seconds and all are validated on
+    the first poll.  The summary file, if named, is written after each poll
+    which validates any folder.  Return the highest status of the latest
+    validations when cycles polls are done, or when interrupted.
+
+    The Season instance for each folder is kept between polls so the rules,
+    parsed records, and difference texts, of unchanged files are reused.
+
+    """
+    seasons = {}
+    snapshots = {}
+    results = {}
+    cycle = 0
+    try:
+        while True:
+            for folder in folders:
+                season = seasons.get(folder)
+                if season is None:
+                    season = Season(
+                        folder,
+                        max_workers=max_workers,
+                        loaded_limit=loaded_limit,
+                        profile_rules=profile_rules,
+                        time_budget=time_budget,
+                    )
+                    seasons[folder] = season
+                paths = season.source_paths() or ()
+
+                # Files arriving after the snapshot are seen by the next poll.
+                snapshot = _snapshot(paths)
+                if snapshots.get(folder) == snapshot:
+                    continue
+                new_paths = _extract_new_emails(season, sys.stderr)
+                snapshots[folder] = snapshot.union(_snapshot(new_paths))
+                results[folder] = _validate_folder_job(
+                    folder, answer, output, season=season
+                )
+                _report_result(results[folder], output)
+                if summary:
+                    write_summary(
+                        [results[f] for f in folders if f in results], summary
+                    )
+            cycle += 1
+            if cycles is not None and cycle >= cycles:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    return max((result.status for result in results.values()), default=VALID)
+
+
+def print_reports(result, stream=None):
+    """Print reports in result to stream, default sys.stdout."""
+    if stream is None:
+        stream = sys.stdout
+    for name, lines in (
+        (SCHEDULE_REPORT, result.schedule_lines),
+        (RESULTS_REPORT, result.results_lines),
+    ):
+        stream.write("".join(("==== ", result.folder, " ", name, "\n")))
+        stream.write("\n".join(lines))
+        stream.write("\n")
+
+
+def _argument_parser():
+    """Return parser for command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m chessvalidate.batch",
+        description="Validate event folders without a display.",
+    )
+    parser.add_argument("folders", nargs="+", help="event folders")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="write reports to a folder for each event in OUTPUT folder",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="answer 'no' to questions rather than 'yes'",
+    )
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="extract emails newer than the extracts into event folders",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="".join(
+            (
+                "number of folders validated concurrently, 0 for one per ",
+                "CPU, sharing the CPUs used to parse each folder",
+            )
+        ),
+    )
+    parser.add_argument(
+        "-s",
+        "--summary",
+        help="write summary of outcome for each folder to SUMMARY file",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        type=float,
+        nargs="?",
+        const=WATCH_INTERVAL,
+        metavar="SECONDS",
+        help="validate folders again when new emails arrive until interrupted",
+    )
+    parser.add_argument(
+        "--profile-rules",
+        action="store_true",
+        help="write time taken by each event rule to RuleProfile in folders",
+    )
+    parser.add_argument(
+        "-t",
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="drop a rule which takes longer than SECONDS on some text",
+    )
+    parser.add_argument(
+        "--loaded-limit",
+        type=int,
+        metavar="TEXTS",
+        help="keep at most TEXTS extract texts in memory for each folder",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        metavar="PROCESSES",
+        help="".join(
+            (
+                "number of processes used to parse each folder, 0 for one ",
+                "per CPU shared between the --jobs",
+            )
+        ),
+    )
+    return parser
+
+
+def _report_result(result, output):
+    """Write problems to stderr, and reports to stdout unless output."""
+    for title, message in result.messages:
+        sys.stderr.write(
+            "".join((result.folder, ": ", str(title), ": ", message, "\n"))
+        )
+    if result.status != FAILED and not output:
+        print_reports(result)
+    if result.status == FAILED:
+        summary = "not processed"
+    else:
+        summary = " ".join((str(result.error_count), "errors"))
+    sys.stderr.write("".join((result.folder, ": ", summary, "\n")))
+
+
+def main(argv=None):
+    """Validate event folders named in argv and return exit status."""
+    args = _argument_parser().parse_args(argv)
+    if args.watch is not None:
+        return watch_folders(
+            args.folders,
+            interval=args.watch,
+            answer=not args.strict,
+            output=args.output,
+            summary=args.summary,
+            profile_rules=args.profile_rules,
+            time_budget=args.time_budget,
+            loaded_limit=args.loaded_limit,
+            max_workers=args.workers or None,
+        )
+    results = run_folders(
+        args.folders,
+        jobs=args.jobs or None,
+        answer=not args.strict,
+        output=args.output,
+        profile_rules=args.profile_rules,
+        time_budget=args.time_budget,
+        extract=args.extract,
+        loaded_limit=args.loaded_limit,
+        max_workers=args.workers or None,
+    )
+    exit_status = VALID
+    for result in results:
+        _report_result(result, args.output)
+        exit_status = max(exit_status, result.status)
+    if args.summary:
+        write_summary(results, args.summary)
+    return exit_status
@@ -0,0 +1,324 @@
+# checkrules.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Check the event extraction rules in an extracted.conf file.
+
+Each regular expression in the rules is compiled, and the rules are applied
+to the sample texts supplied with the package and to any extracts named.
+Compile errors, rules which match nothing, and the lines per second processed
+by each rule, are reported so slow or broken rules can be fixed before the
+season's data is validated.
+
+The exit status of main() is:
+
+0 if all rules compiled and matched something.
+1 if at least one rule matched nothing.
+2 if at least one rule did not compile or the rules could not be parsed.
+
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+
+from .emailextractor import (
+    EmailExtractor,
+    Parser,
+    RESULTS_PREFIX,
+    SECTION_PREFIX,
+    SECTION_BODY,
+    SOURCE,
+    MATCH_FORMATS,
+    PLAYED_ON_FORMATS,
+    FIXTURE_FORMATS,
+    COMPETITION,
+)
+from .eventparser import EventParser, EventParserError, CompiledRules
+from .ruleprofile import RuleProfile, lines_per_second
+from .policy import BatchPolicy
+from .differenceformat import (
+    restore_text,
+    DIFFERENCE_HEADER,
+    DifferenceFormatError,
+)
+from .extractmanifest import EXTRACT_MANIFEST
+
+# Status of rule check, and exit status for main().
+VALID = 0
+UNMATCHED = 1
+FAILED = 2
+
+# Folder containing the sample texts supplied with the package.
+SAMPLES_FOLDER = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "help_"
+)
+
+# Names of sample text files start with this.
+_SAMPLE_PREFIX = "sample_"
+
+# Keyword and value on a line of a configuration file.
+_KEYWORD_VALUE = re.compile(r"([a-z_]+)[ =](.*)")
+
+# Parser methods which compile the value of a keyword as a regular
+# expression.
+_REGULAR_EXPRESSION_METHODS = frozenset(
+    (
+        Parser._add_event_re,
+        Parser._add_re,
+        Parser._add_match_format_re,
+        Parser._add_played_on_format_re,
+        Parser._add_fixture_format_re,
+        Parser._add_match_item_re,
+        Parser._add_played_on_item_re,
+        Parser._add_fixture_item_re,
+    )
+)
+
+# Column headings in rule table.
+_HEADINGS = (
+    "key",
+    "index",
+    "calls",
+    "matches",
+    "lines",
+    "lines per second",
+    "note",
+)
+
+
+class _RuleText:
+    """Text to which the rules are applied, as a difference item."""
+
+    def __init__(self, filename, edited_text):
+        """Initialise text read from filename."""
+        self.filename = filename
+        self.data_tag = filename
+        self.edited_text = edited_text
+        self.headers = None
+
+
+def regular_expression_keywords():
+    """Return keywords whose values are compiled as regular expressions."""
+    return frozenset(
+        keyword
+        for keyword, method in Parser().keyword_rules.items()
+        if getattr(method, "__func__", None) in _REGULAR_EXPRESSION_METHODS
+    )
+
+
+def compile_errors(configuration):
+    """Return (line number, keyword, message) for expressions in error."""
+    keywords = regular_expression_keywords()
+    errors = []
+    for number, line in enumerate(configuration.splitlines(), start=1):
+        match = _KEYWORD_VALUE.match(line)
+        if match is None or match.group(1) not in keywords:
+            continue
+        try:
+            re.compile(match.group(2), flags=re.IGNORECASE | re.DOTALL)
+        except re.error as exc:
+            errors.append((number, match.group(1), str(exc)))
+    return errors
+
+
+def rule_expressions(rules):
+    """Yield (key, index, pattern) for regular expressions in rules.
+
+    The index of an expression in a match, played on, or fixture, format is
+    the rule index and the format index joined by '.', as in the profile
+    of the rules made by EventParser.
+
+    """
+    for eitem, event in enumerate(rules):
+        for key in (RESULTS_PREFIX, SOURCE, SECTION_PREFIX, SECTION_BODY):
+            if event[key].pattern:
+                yield key, str(eitem), event[key].pattern
+        for formats in (MATCH_FORMATS, PLAYED_ON_FORMATS, FIXTURE_FORMATS):
+            for eformat, emf in enumerate(event[formats]):
+                index = ".".join((str(eitem), str(eformat)))
+                for key, expression in emf.items():
+                    yield key, index, expression.pattern
+
+
+def sample_texts(folder=SAMPLES_FOLDER):
+    """Return _RuleText instances for the sample text files in folder."""
+    texts = []
+    for name in sorted(os.listdir(folder)):
+        if not name.startswith(_SAMPLE_PREFIX) or not name.endswith(".txt"):
+            continue
+        path = os.path.join(folder, name)
+        with open(path, encoding="utf8") as sample_file:
+            texts.append(_RuleText(path, sample_file.read()))
+    return texts
+
+
+def extract_texts(paths, stream):
+    """Return _RuleText instances for the extracts at paths.
+
+    A path may be an extracts folder, whose files are difference files, or
+    a file which is a difference file or plain text.  Files which cannot be
+    read are reported on stream.
+
+    """
+    texts = []
+    for path in paths:
+        if os.path.isdir(path):
+            filepaths = [
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if not name.startswith(EXTRACT_MANIFEST)
+            ]
+        else:
+            filepaths = [path]
+        for filepath in filepaths:
+            try:
+                with open(filepath, encoding="utf8") as extract_file:
+                    lines = extract_file.readlines()
+                if filepath != path or (
+                    lines and lines[0] == DIFFERENCE_HEADER
+                ):
+                    text = restore_text(lines, 2)
+                else:
+                    text = "".join(lines)
+            except (OSError, UnicodeDecodeError, DifferenceFormatError) as exc:
+                stream.write(
+                    "".join(
+                        (filepath, ": not checked: ", str(exc), "\n")
+                    )
+                )
+                continue
+            texts.append(_RuleText(filepath, text))
+    return texts
+
+
+def check_rules(
+    configuration_path, extracts=(), samples=True, stream=None, profile=None
+):
+    """Return status after checking rules in configuration_path.
+
+    The rules are applied to the sample texts, unless samples is False, and
+    the texts in extracts.  The report is written to stream, default
+    sys.stdout, and the profile of the rules to the file named profile if
+    given.
+
+    """
+    if stream is None:
+        stream = sys.stdout
+    with open(configuration_path, encoding="utf8") as configuration_file:
+        configuration = configuration_file.read()
+    errors = compile_errors(configuration)
+    for number, keyword, message in errors:
+        stream.write(
+            "".join(
+                (
+                    configuration_path,
+                    ": line ",
+                    str(number),
+                    ": ",
+                    keyword,
+                    ": ",
+                    message,
+                    "\n",
+                )
+            )
+        )
+    if errors:
+        return FAILED
+    emc = EmailExtractor(
+        os.path.dirname(os.path.abspath(configuration_path)),
+        configuration=configuration,
+    )
+    if not emc.parse():
+        stream.write(
+            "".join((configuration_path, ": rules not accepted by parser\n"))
+        )
+        return FAILED
+    rules = emc.criteria.get(RESULTS_PREFIX, ())
+    competitions = emc.criteria.get(COMPETITION, set())
+    compiled_rules = CompiledRules(rules, competitions)
+    texts = extract_texts(extracts, stream)
+    if samples:
+        texts = sample_texts() + texts
+    rule_profile = RuleProfile()
+    for text in texts:
+        try:
+            for _ in EventParser([text]).parse_event(
+                rules,
+                competitions,
+                (None, None, None),
+                policy=BatchPolicy(stream=io.StringIO()),
+                compiled_rules=compiled_rules,
+                profile=rule_profile,
+            ):
+                pass
+        except EventParserError as exc:
+            stream.write("".join((text.filename, ": ", str(exc), "\n")))
+    status = VALID
+    stream.write("\t".join(_HEADINGS))
+    stream.write("\n")
+    for key, index, _ in rule_expressions(rules):
+        totals = rule_profile.rule_totals(key, index)
+        if totals is None:
+            totals = (0, 0.0, 0, 0)
+        calls, seconds, matches, lines = totals
+        if matches:
+            note = ""
+        else:
+            note = "no match"
+            status = UNMATCHED
+        stream.write(
+            "\t".join(
+                (
+                    key,
+                    index,
+                    str(calls),
+                    str(matches),
+                    str(lines),
+                    lines_per_second(lines, seconds),
+                    note,
+                )
+            )
+        )
+        stream.write("\n")
+    if profile:
+        rule_profile.write(profile)
+    return status
+
+
+def _argument_parser():
+    """Return parser for command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m chessvalidate.checkrules",
+        description="Check event extraction rules in an extracted.conf file.",
+    )
+    parser.add_argument("configuration", help="extracted.conf file")
+    parser.add_argument(
+        "extracts",
+        nargs="*",
+        help="extracts folders or text files to which rules are applied",
+    )
+    parser.add_argument(
+        "--no-samples",
+        action="store_true",
+        help="do not apply rules to sample texts supplied with package",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        help="write time taken by each rule and operation to PROFILE file",
+    )
+    return parser
+
+
+def main(argv=None):
+    """Check rules named in argv and return exit status."""
+    args = _argument_parser().parse_args(argv)
+    return check_rules(
+        args.configuration,
+        extracts=args.extracts,
+        samples=not args.no_samples,
+        profile=args.profile,
+    )
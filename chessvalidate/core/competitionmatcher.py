@@ -0,0 +1,109 @@
+# competitionmatcher.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Find the competition or section name in a line of event data.
+
+Competition names were found by splitting text with a regular expression
+which is an alternation of all the names, longest first, with '\\s+'
+between the words of each name.  The regular expression engine tries every
+name at every position in the text.
+
+CompetitionMatcher gives the same answer by searching a copy of the text,
+with whitespace runs replaced by a single space and letters lower case, for
+each name normalized in the same way.  The first name, in alternation
+order, found at the earliest position is the match.
+
+The regular expression is still used for texts containing non-ASCII
+letters, because some of those letters match ASCII letters when case is
+ignored, and when any name contains a character which is special in a
+regular expression.
+
+"""
+
+import re
+
+# Characters which make the words of a name a regular expression rather
+# than literal text.
+_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+class CompetitionMatcher:
+    """Split text at the first competition name found in text."""
+
+    def __init__(self, names):
+        """Build matcher for names, each a competition or section name."""
+        sorted_names = [
+            n[-1] for n in sorted([(len(c), c) for c in names], reverse=True)
+        ]
+        self.regex = re.compile(
+            "|".join([r"\s+".join(n.split()) for n in sorted_names]).join(
+                ("(", ")")
+            ),
+            flags=re.IGNORECASE | re.DOTALL,
+        )
+        self.pattern = self.regex.pattern
+        self._names = [" ".join(n.split()).lower() for n in sorted_names]
+        if not self._names:
+            self._names = None
+        else:
+            for name in sorted_names:
+                if not name.isascii() or not _METACHARACTERS.isdisjoint(name):
+                    self._names = None
+                    break
+
+    def split(self, text, maxsplit=0):
+        """Return text split at first competition name like re.split.
+
+        Only maxsplit=1 is done without the regular expression.
+
+        """
+        if self._names is None or maxsplit != 1:
+            return self.regex.split(text, maxsplit=maxsplit)
+        if not text.isascii():
+            if any(c.isalpha() for c in set(text) if not c.isascii()):
+                return self.regex.split(text, maxsplit=maxsplit)
+        words = text.split()
+        normalized = " ".join(words).lower()
+        best_start = -1
+        best_name = None
+        for name in self._names:
+            start = normalized.find(name)
+            if start < 0:
+                continue
+            if best_name is None or start < best_start:
+                best_start = start
+                best_name = name
+                if start == 0:
+                    break
+        if best_name is None:
+            return [text]
+        return _split_at(text, words, best_start, len(best_name))
+
+
+def _split_at(text, words, start, length):
+    """Return [before, match, after] for slice of normalized text in text.
+
+    start and length are the position and length of the match in the words
+    of text joined with single spaces.
+
+    """
+    end = start + length - 1
+    position = 0
+    normalized_position = 0
+    text_start = None
+    for word in words:
+        position = text.find(word, position)
+        normalized_end = normalized_position + len(word)
+        if text_start is None and start < normalized_end:
+            text_start = position + start - normalized_position
+        if end < normalized_end:
+            text_end = position + end - normalized_position + 1
+            return [
+                text[:text_start],
+                text[text_start:text_end],
+                text[text_end:],
+            ]
+        position += len(word)
+        normalized_position = normalized_end + 1
+    raise ValueError("Match is not within text")
@@ -24,6 +24,9 @@ class Configuration(configuration.Configuration):
         (constants.RECENT_EMAIL_EXTRACTION, "~"),
         (constants.RECENT_CSV_DOWNLOAD, "~"),
         (constants.RECENT_DOCUMENT, "~"),
+        (constants.RULE_TIME_BUDGET, ""),
+        (constants.PARSE_WORKERS, ""),
+        (constants.LOADED_TEXT_LIMIT, ""),
         (ecfformat.core.constants.RECENT_RESULTS_FORMAT_FILE, "~"),
         (
             ecfformat.core.constants.SHOW_VALUE_BOUNDARY,
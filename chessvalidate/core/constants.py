@@ -72,6 +72,9 @@ ECF_RESULT_D1 = "d1"
 
 # Event configuration file.
 EVENT_CONF = "event.conf"
+
+# Profile of event configuration rules written beside the error log.
+RULE_PROFILE = "RuleProfile"
 NEW_FILE_TEXT = "\n".join(
     (
         "".join((constants.FIELD_SEPARATOR, constants.NAME_EVENT_DETAILS)),
@@ -95,6 +98,24 @@ RECENT_EMAIL_EXTRACTION = "event"
 RECENT_CSV_DOWNLOAD = "csv_download"
 RECENT_DOCUMENT = "document"
 
+# Seconds a rule in the event configuration may take on a piece of text
+# before the rule is reported and not applied to the rest of an event opened
+# for editing.  There is no budget unless the configuration file value is a
+# positive number.
+RULE_TIME_BUDGET = "rule_time_budget"
+
+# Number of processes used to load and parse the texts, and split joined
+# names, of an event opened for editing.  The work is done in the process
+# which shows the event unless the configuration file value is a whole
+# number greater than 1.
+PARSE_WORKERS = "parse_workers"
+
+# Number of extract texts kept in memory for an event opened for editing.
+# The texts are shown one at a time, loaded when viewed, and the least
+# recently viewed evicted once saved.  All texts are loaded and shown at
+# once unless the configuration file value is a positive number.
+LOADED_TEXT_LIMIT = "loaded_text_limit"
+
 # Names of columns in tabular game reports generated by ChessResults.
 # These are not used by emailextractor module which defines names of entries
 # in the extract text configuration file which name the columns.
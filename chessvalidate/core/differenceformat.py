@@ -0,0 +1,127 @@
+# differenceformat.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Read and write the difference files holding original and edited texts.
+
+Version 1 difference files are the output of difflib.ndiff(original, edited)
+where every line is stored with a two character prefix.
+
+Version 2 difference files start with a version header line followed by a
+JSON object, on one line, containing the original text and a list of edits.
+Each edit is the start and end of a slice of the original lines, and the
+lines of edited text which replace the slice.
+
+Version 1 files are still read, and are migrated to version 2 when saved.
+
+"""
+
+import difflib
+import json
+
+DIFFERENCE_HEADER = "#chessvalidate difference text version 2\n"
+
+# Keys in the JSON object in version 2 difference files.
+_ORIGINAL = "original"
+_EDITS = "edits"
+
+
+class DifferenceFormatError(Exception):
+    """Exceptions raised in differenceformat module."""
+
+
+def _version_2_texts(diff_lines):
+    """Return original and edited texts from version 2 diff_lines."""
+    try:
+        content = json.loads("".join(diff_lines[1:]))
+        original = content[_ORIGINAL]
+        edits = content[_EDITS]
+    except (ValueError, TypeError, KeyError) as exc:
+        raise DifferenceFormatError(
+            "Version 2 difference text is not valid"
+        ) from exc
+    original_lines = original.splitlines(True)
+    edited_lines = []
+    position = 0
+    for start, end, lines in edits:
+        edited_lines.extend(original_lines[position:start])
+        edited_lines.extend(lines)
+        position = end
+    edited_lines.extend(original_lines[position:])
+    return original, "".join(edited_lines)
+
+
+def restore_text(diff_lines, which):
+    """Return original (which=1) or edited (which=2) text from diff_lines.
+
+    The difference format is detected from the first line: version 1 is
+    done by difflib.restore.
+
+    """
+    if diff_lines and diff_lines[0] == DIFFERENCE_HEADER:
+        return _version_2_texts(diff_lines)[which - 1]
+    return "".join(difflib.restore(diff_lines, which))
+
+
+def restore_texts(diff_lines):
+    """Return (original, edited) texts from diff_lines."""
+    if diff_lines and diff_lines[0] == DIFFERENCE_HEADER:
+        return _version_2_texts(diff_lines)
+    return (
+        "".join(difflib.restore(diff_lines, 1)),
+        "".join(difflib.restore(diff_lines, 2)),
+    )
+
+
+def _edits(original_lines, edited_lines):
+    """Return edits which change original_lines to edited_lines.
+
+    The lines common at the start and end are removed before comparing the
+    rest so the time taken for a few edited lines is linear.
+
+    """
+    start = 0
+    end = min(len(original_lines), len(edited_lines))
+    while start < end and original_lines[start] == edited_lines[start]:
+        start += 1
+    original_end = len(original_lines)
+    edited_end = len(edited_lines)
+    while (
+        original_end > start
+        and edited_end > start
+        and original_lines[original_end - 1] == edited_lines[edited_end - 1]
+    ):
+        original_end -= 1
+        edited_end -= 1
+    matcher = difflib.SequenceMatcher(
+        None,
+        original_lines[start:original_end],
+        edited_lines[start:edited_end],
+        autojunk=False,
+    )
+    return [
+        [start + i1, start + i2, edited_lines[start + j1 : start + j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def difference_lines(original, edited):
+    """Return version 2 difference file lines for original and edited."""
+    return [
+        DIFFERENCE_HEADER,
+        "".join(
+            (
+                json.dumps(
+                    {
+                        _ORIGINAL: original,
+                        _EDITS: _edits(
+                            original.splitlines(True),
+                            edited.splitlines(True),
+                        ),
+                    }
+                ),
+                "\n",
+            )
+        ),
+    ]
@@ -21,7 +21,6 @@ import urllib.parse
 import urllib.request
 import csv
 import io
-import difflib
 
 from emailextract.core.emailextractor import EXTRACTED_CONF
 
@@ -34,6 +33,7 @@ from .emailextractor import (
     REPORT_TABLE,
     TEXTENTRY,
 )
+from .differenceformat import difference_lines
 
 
 class DownloadConvertError:
@@ -345,7 +345,8 @@ class DownloadConvert:
         ):
             return False
         with open(textentry, mode="w", encoding="utf8") as file:
-            file.writelines(difflib.ndiff(tabulartextlines, tabulartextlines))
+            tabulartext = "".join(tabulartextlines)
+            file.writelines(difference_lines(tabulartext, tabulartext))
         self.most_recent_action = self.update_difference_files
         self._actions_done.add(self.update_difference_files)
         return True
@@ -13,9 +13,13 @@ Game result data is collected by type: all play all, swiss, fixtures,
 results, players, round dates, and tabular.
 
 """
-import tkinter.messagebox
+import concurrent.futures
+import itertools
+import os
+import types
 
 from . import names
+from .namesplitcache import names_digest
 from .found import Found
 
 _EVENT_IDENTITY_NONE = (None, None, None)
@@ -89,6 +93,10 @@ class EventContext:
         self._items.append(eventdata)
         return self._process.get(eventdata.found, self._exception)(eventdata)
 
+    def processed_items(self, start=0):
+        """Return event data processed after the first start items."""
+        return self._items[start:]
+
     # Event identity is set once.
     # It is composed from the event's name, and start and end dates.
     # Event name can be changed until the start and end date are set: the
@@ -371,19 +379,24 @@ class EventContext:
             ):
                 report_style.add_key(self._competition_name)
 
-    def fixture_list_names(self, team_name_lookup, truncate=None):
-        """Return True if abbreviated team name search was done.
-
-        The normal return is None.
+    def fixture_list_names(
+        self, team_name_lookup, split_cache=None, max_workers=1
+    ):
+        """Split joined team names in fixtures.
 
-        If get_names_from_joined_names() function suggested truncating the
-        search, the return is True or False depending on user choice.
+        Guessed splits are taken from, and added to, split_cache if given.
+        The competitions are done in a pool of at most max_workers processes
+        if max_workers is not 1.
 
         """
-        for k, fixtures in self._fixtures.items():
-            team_names, truncate = get_names_from_joined_names(
-                fixtures, ("teams", "teamone", "teamtwo"), truncate
-            )
+        all_fixtures = list(self._fixtures.values())
+        all_team_names = _split_joined_names(
+            all_fixtures,
+            ("teams", "teamone", "teamtwo"),
+            split_cache,
+            max_workers,
+        )
+        for fixtures, team_names in zip(all_fixtures, all_team_names):
             for nkey, nvalue in team_names.items():
                 if "teams" in fixtures[nkey].__dict__:
                     fixtures[nkey].__dict__.update(nvalue)
@@ -399,31 +412,97 @@ class EventContext:
                     fixture.teamtwo = team_name_lookup.get(
                         fixture.teamtwo.lower(), fixture.teamtwo
                     )
-        return truncate
-
-    def results_names(self, truncate=None):
-        """Return True if abbreviated player name search was done.
 
-        The normal return is None.
+    def results_names(self, split_cache=None, max_workers=1):
+        """Split joined player names in results.
 
-        If get_names_from_joined_names() function suggested truncating the
-        search, the return is True or False depending on user choice.
+        Guessed splits are taken from, and added to, split_cache if given.
+        The competitions are done in a pool of at most max_workers processes
+        if max_workers is not 1.
 
         """
-        for results in self._results.values():
-            player_names, truncate = get_names_from_joined_names(
-                results, ("names", "nameone", "nametwo"), truncate
-            )
+        all_results = list(self._results.values())
+        all_player_names = _split_joined_names(
+            all_results,
+            ("names", "nameone", "nametwo"),
+            split_cache,
+            max_workers,
+        )
+        for results, player_names in zip(all_results, all_player_names):
             for nkey, nvalue in player_names.items():
                 if "names" in results[nkey].__dict__:
                     results[nkey].__dict__.update(nvalue)
                     del results[nkey].names
-        return truncate
+
+
+def _split_joined_names(competitions, attrnames, split_cache, max_workers):
+    """Return list of split names for competitions.
+
+    competitions is a list of lists of EventData instances, one list for
+    each competition.  The competitions are done in this process if
+    max_workers is 1 or fewer than two competitions are given.  Otherwise
+    only the joined names are sent to the pool processes and only the split
+    names, and the splits added to split_cache, are sent back.
+
+    """
+    if max_workers == 1 or len(competitions) < 2:
+        all_split_names = []
+        for joined_names in competitions:
+            all_split_names.append(
+                get_names_from_joined_names(
+                    joined_names, attrnames, split_cache=split_cache
+                )
+            )
+        return all_split_names
+    jobs = [
+        [
+            types.SimpleNamespace(
+                **{n: e.__dict__[n] for n in attrnames if n in e.__dict__}
+            )
+            for e in joined_names
+        ]
+        for joined_names in competitions
+    ]
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(max_workers or os.cpu_count() or 1, len(jobs))
+    ) as executor:
+        outcomes = list(
+            executor.map(
+                _split_competition_names,
+                jobs,
+                itertools.repeat(attrnames),
+                itertools.repeat(
+                    None if split_cache is None else split_cache.worker_copy()
+                ),
+            )
+        )
+    all_split_names = []
+    for split_names, split_changes in outcomes:
+        if split_cache is not None:
+            split_cache.merge(split_changes)
+        all_split_names.append(split_names)
+    return all_split_names
+
+
+def _split_competition_names(joined_names, attrnames, split_cache):
+    """Return split names for joined_names and split_cache changes.
+
+    split_cache is an empty copy of the NameSplitCache in the parent process,
+    or None, so the pool process reads only the splits for the digest of
+    joined_names and sends back only the splits it added.
+
+    """
+    split_names = get_names_from_joined_names(
+        joined_names, attrnames, split_cache=split_cache
+    )
+    if split_cache is None:
+        return split_names, None
+    return split_names, split_cache.changes()
 
 
 # Derived from get_team_names_from_match_names method of class ConvertResults
 # in module convertresults
-def get_names_from_joined_names(joined_names, attrnames, truncate):
+def get_names_from_joined_names(joined_names, attrnames, split_cache=None):
     """Generate possible names from a set of concatenated pairs of names.
 
     Try to get names from fixture or result names using the MatchTeams class.
@@ -434,6 +513,13 @@ def get_names_from_joined_names(joined_names, attrnames, truncate):
     get names 'Team A' and 'Team B' from 'Team A - Team B' but _Names might get
     as far as names 'Team A -' and 'Team B'.
 
+    The Names class finds the best name pair without generating all pairs so
+    long joined names are split in full.
+
+    split_cache is a NameSplitCache instance holding the guessed splits from
+    earlier runs, which are used while the names they were guessed from are
+    unchanged.
+
     """
     nameone, nametwo = attrnames[1:]
     homename = set()
@@ -442,77 +528,87 @@ def get_names_from_joined_names(joined_names, attrnames, truncate):
     for item, eventdata in enumerate(joined_names):
         edict = eventdata.__dict__
         concat = [edict[n].split() for n in attrnames if n in edict]
-        if sum(len(c) for c in concat) > 50:
-            if truncate is None:
-                truncate = tkinter.messagebox.askyesno(
-                    message="".join(
-                        (
-                            "Truncate to 20 words?\n\n",
-                            "Attempting to decide how to split more than 50 ",
-                            "words into 2 names, which is unlikely to be ",
-                            "worth the time it will take.  This is probably ",
-                            "happening because you have not had chances to ",
-                            "delete text which is obviously irrelevant.\n\n",
-                            "You may have to not truncate eventually but",
-                            "saying 'No' at first may waste a lot of time.",
-                        )
-                    ),
-                    title="Calculating Names",
-                )
-            if truncate:
-                concat = [c[:10] for c in concat]
         nameset[item] = nset = names.Names(
             string=" ".join([" ".join(c) for c in concat])
         )
-        for hname, aname in nset.namepairs:
-            homename.add(hname)
-            awayname.add(aname)
+        homename.update(nset.prefixes)
+        awayname.update(nset.suffixes)
     splitnames = {}
     consistent = set()
     guesses = {}
     allnames = homename.intersection(awayname)
+    unresolved = []
     for k, gvalue in nameset.items():
-        gvalue.namepairs = tuple(
-            (h, a)
-            for h, a in gvalue.namepairs
-            if h in allnames and a in allnames
-        )
-        try:
+        namepair = gvalue.best_namepair(allnames)
+        if namepair is not None:
             nset = {}
-            nset[nameone] = gvalue.namepairs[-1][0]
-            nset[nametwo] = gvalue.namepairs[-1][-1]
+            nset[nameone] = namepair[0]
+            nset[nametwo] = namepair[-1]
             consistent.add(nset[nameone])
             consistent.add(nset[nametwo])
             splitnames[k] = nset
-        except (AttributeError, IndexError, KeyError):
-            gvalue.guess_names_from_known_names(allnames)
+        else:
+            unresolved.append(k)
+    cached_splits = {}
+    if split_cache is not None and unresolved:
+        digest = names_digest(attrnames, allnames, consistent)
+        cached_splits = split_cache.splits(digest)
+    known_names = None
+    for k in unresolved:
+        gvalue = nameset[k]
+        if gvalue.string in cached_splits:
+            split = cached_splits[gvalue.string]
+            if split is not None:
+                splitnames[k] = {nameone: split[0], nametwo: split[-1]}
+        else:
+            if known_names is None:
+                known_names = names.KnownNames(allnames)
+            gvalue.guess_names_from_known_names(known_names)
             guesses[k] = {
                 nameone: gvalue.namepairs[-1][0],
                 nametwo: gvalue.namepairs[-1][-1],
             }
-    del allnames, homename, awayname
-    prevlenguesses = 0
-    while len(guesses) != prevlenguesses:
-        prevlenguesses = len(guesses)
-        stillguesses = {}
-        while guesses:
-            k, gvalue = guesses.popitem()
-            awaywords = " ".join((gvalue[nameone], gvalue[nametwo])).split()
-            if not awaywords:
-                continue  # No names for defaulted games
-            homewords = [awaywords.pop(0)]
-            while awaywords:
-                homename = " ".join(homewords)
-                awayname = " ".join(awaywords)
-                if homename in consistent or awayname in consistent:
-                    splitnames[k] = {nameone: homename, nametwo: awayname}
-                    break
-                homewords.append(awaywords.pop(0))
-            else:
-                stillguesses[k] = gvalue
-        guesses = stillguesses
-    splitnames.update(guesses)
-    return (splitnames, truncate)
+    del allnames, homename, awayname, known_names
+
+    splitnames.update(_split_guesses(guesses, consistent, nameone, nametwo))
+    if split_cache is not None:
+        for k in unresolved:
+            if nameset[k].string not in cached_splits:
+                split = splitnames.get(k)
+                if split is not None:
+                    split = [split[nameone], split[nametwo]]
+                split_cache.add(digest, nameset[k].string, split)
+    return splitnames
+
+
+def _split_guesses(guesses, consistent, nameone, nametwo):
+    """Return split names for guesses using the consistent names.
+
+    guesses maps keys to {nameone: name, nametwo: name} guessed splits.  A
+    guess is split at the first word boundary where the words before or
+    after it are a consistent name, or kept if there is no such boundary.
+    Guesses without words, for defaulted games, are dropped.  Splitting a
+    guess does not change the consistent names, so each guess is visited
+    once.
+
+    """
+    splitnames = {}
+    for k, gvalue in guesses.items():
+        words = " ".join((gvalue[nameone], gvalue[nametwo])).split()
+        if not words:
+            continue
+        joined = " ".join(words)
+        boundary = -1
+        for word in words[:-1]:
+            boundary += len(word) + 1
+            homename = joined[:boundary]
+            awayname = joined[boundary + 1 :]
+            if homename in consistent or awayname in consistent:
+                splitnames[k] = {nameone: homename, nametwo: awayname}
+                break
+        else:
+            splitnames[k] = gvalue
+    return splitnames
 
 
 class _EventItems(dict):
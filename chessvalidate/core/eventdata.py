@@ -90,6 +90,10 @@ class EventData:
             except AttributeError:
                 self._ignore = found
                 self.found = Found.IGNORE
+        elif context is not None:
+            # The context records the instance for creation later in an
+            # EventContext instance.
+            context.record(self)
 
         # The text generated for display in the schedule and report widgets.
         # The idea is tagging information can be picked from the containing
@@ -4,9 +4,7 @@
 
 """Extract information from event configuration file."""
 import os
-import tkinter
 
-from ecfformat.core.content import HeaderContent
 from ecfformat.core import constants
 
 from .constants import EVENT_CONF
@@ -34,14 +32,40 @@ def get_text_at_value_after_name(name, widget):
 
 
 def get_event_details(folder):
-    """Return event name, start date, and end date, from event details."""
-    widget = tkinter.Text()
+    """Return event name, start date, and end date, from event details.
+
+    The fields are read from the text of the event configuration file so a
+    display is not needed.
+
+    """
     with open(os.path.join(folder, EVENT_CONF), encoding="utf8") as file_:
         text = file_.read()
-    HeaderContent(text, False, ()).parse(widget)
-    event = get_text_at_value_after_name(constants.EVENT_NAME, widget)
-    date = get_text_at_value_after_name(constants.EVENT_DATE, widget)
-    final = get_text_at_value_after_name(constants.FINAL_RESULT_DATE, widget)
+    values = get_field_values(text)
+    event = values.get(_field_name(constants.NAME_EVENT_NAME))
+    date = values.get(_field_name(constants.NAME_EVENT_DATE))
+    final = values.get(_field_name(constants.NAME_FINAL_RESULT_DATE))
     if event and date and final:
         return (event, date, final)
     return (None, None, None)
+
+
+def get_field_values(text):
+    """Return dict of field values by field name in ECF format text.
+
+    The names are upper case with single spaces between words.  The first
+    value of a field is kept and fields without a value are ignored.
+
+    """
+    values = {}
+    for field in text.split(constants.FIELD_SEPARATOR)[1:]:
+        name, separator, value = field.partition(
+            constants.NAME_VALUE_SEPARATOR
+        )
+        if separator:
+            values.setdefault(_field_name(name), value.strip())
+    return values
+
+
+def _field_name(name):
+    """Return name in upper case with single spaces between words."""
+    return " ".join(name.split()).upper()
@@ -3,7 +3,15 @@
 # Licence: See LICENCE (BSD licence)
 
 """Event parser class."""
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import multiprocessing
+import os
+import pickle
 import re
+import time
 
 from .emailextractor import (
     RESULTS_PREFIX,
@@ -45,6 +53,9 @@ from .found import (
     Found,
 )
 from .adapteventcontext import AdaptEventContext
+from .resultlexer import LineTokens
+from .competitionmatcher import CompetitionMatcher
+from .policy import DialogPolicy
 
 # The competition name used in tabular inputs if no competition name is given.
 # Usually the competition 'All Sections' is but in event's conf file if needed.
@@ -321,10 +332,462 @@ _DRAW_TOKEN = frozenset(
 )
 
 
+# The number of configuration texts whose compiled rules are kept.
+_COMPILED_RULES_LIMIT = 8
+
+# Seconds between checks of progress of a worker parsing text within a
+# time budget.
+_BUDGET_POLL_INTERVAL = 0.05
+
+# Kinds of message sent by a worker parsing text within a time budget.
+_PARSED = "parsed"
+_FAILED = "failed"
+
+# Size in bytes of the note of the rule being applied by a worker parsing
+# text within a time budget, and the number of characters of the text in
+# the note.
+_CALL_SIZE = 2048
+_CALL_TEXT_LENGTH = 301
+
+
 class EventParserError(Exception):
     """Exception class for eventparser module."""
 
 
+class CompiledRules:
+    """Regular expressions derived from event extraction rules.
+
+    The matchers for the competition names and the section names, the
+    expressions for the forwarded email markers, and the translation tables
+    for the word splitters kept, in the rules are built once for use in any
+    number of EventParser.build_event calls.  Rules with the same forwarded
+    email markers share an expression.
+
+    """
+
+    def __init__(self, rules, competitions, key=None):
+        """Compile regular expressions for rules and competitions.
+
+        key identifies the configuration text containing rules and
+        competitions, and is None if EventData records derived using
+        the rules should not be cached.
+
+        """
+        self.rules = rules
+        self.key = key
+        self.competition_lookup = {c.lower(): c for c in competitions}
+        self.re_competition = CompetitionMatcher(competitions)
+        self.re_sections = []
+        self.re_forwarded = []
+        self.keep_word_tables = []
+        forwarded = {}
+        for event in rules:
+            self.re_sections.append(
+                CompetitionMatcher(event[SECTION_NAME].values())
+            )
+            self.re_forwarded.append(None)
+            markers = event[DROP_FORWARDED_MARKERS]
+            if markers:
+                if markers not in forwarded:
+                    forwarded[markers] = re.compile(
+                        markers.join((r"(?<=\n)(?:\s*", ")+")),
+                        flags=re.IGNORECASE | re.DOTALL,
+                    )
+                self.re_forwarded[-1] = forwarded[markers]
+            self.keep_word_tables.append(
+                _keep_word_table(
+                    event[KEEP_WORD_SPLITTERS]
+                    .replace("\\t", "\t")
+                    .replace("\\n", "\n")
+                )
+            )
+
+
+class _KeepWordTable(dict):
+    """str.translate table replacing word splitters not kept by space.
+
+    Letters and digits, and the characters in keep_word_splitters, are not
+    changed.  The ASCII characters are in the table when created and other
+    characters are added when first seen.
+
+    """
+
+    def __init__(self, keep_word_splitters):
+        """Create table for ASCII characters."""
+        super().__init__()
+        self.keep_word_splitters = keep_word_splitters
+        for code in range(128):
+            self.__missing__(code)
+
+    def __missing__(self, code):
+        """Add translation of character with ordinal code and return it."""
+        character = chr(code)
+        if (
+            character.isalnum()
+            or character.isnumeric()
+            or character in self.keep_word_splitters
+        ):
+            self[code] = code
+        else:
+            self[code] = 32
+        return self[code]
+
+    def __reduce__(self):
+        """Return arguments to create table in another process."""
+        return (self.__class__, (self.keep_word_splitters,))
+
+
+@functools.lru_cache(maxsize=None)
+def _keep_word_table(keep_word_splitters):
+    """Return _KeepWordTable for keep_word_splitters."""
+    return _KeepWordTable(keep_word_splitters)
+
+
+class ParseCache:
+    """EventData records derived from the edited text of difference items.
+
+    The records are keyed by the configuration text, the difference item,
+    and a digest of the item's edited text.
+
+    """
+
+    def __init__(self):
+        """Initialise empty cache."""
+        self._records = {}
+
+    def get(self, key):
+        """Return records for key or None if not in cache."""
+        return self._records.get(key)
+
+    def replace(self, records):
+        """Replace cached records with records, a dict of records by key."""
+        self._records = records
+
+
+class _EventDataRecorder:
+    """Record the EventData instances created in an event context.
+
+    An _EventDataRecorder instance is given as context when parsing text so
+    the instances can be created again in an AdaptEventContext instance by
+    _replay.  Instances created without a context have no effect on the
+    event and are not recorded.
+
+    """
+
+    def __init__(self):
+        """Initialise empty list of records."""
+        self.records = []
+
+    def record(self, eventdata):
+        """Record class and arguments of eventdata."""
+        self.records.append((eventdata.__class__, dict(eventdata.__dict__)))
+
+    def defer(self, function, kargs):
+        """Record function to be called with context and kargs."""
+        self.records.append((function, kargs))
+
+
+def _replay(records, context, headers=None):
+    """Create EventData instances in context from records.
+
+    The headers in the records are replaced by headers if it is not None.
+
+    """
+    for function, kargs in records:
+        kargs = {
+            k: list(v) if isinstance(v, list) else v for k, v in kargs.items()
+        }
+        if headers is not None:
+            kargs["headers"] = headers
+        function(context=context, **kargs)
+
+
+def _record_text(
+    compiled_rules,
+    edited_text,
+    data_tag,
+    filename,
+    profile=None,
+    quarantine=(),
+):
+    """Return EventData records derived from edited_text.
+
+    The records have no headers: the difference item's headers are given
+    when the records are replayed.  The rules in quarantine are not applied.
+
+    """
+    recorder = _EventDataRecorder()
+    _parse_text(
+        recorder,
+        compiled_rules,
+        edited_text,
+        data_tag,
+        filename,
+        None,
+        profile=profile,
+        quarantine=quarantine,
+    )
+    return recorder.records
+
+
+# The CompiledRules instance used by _record_text in worker processes.
+_worker_compiled_rules = None
+
+
+def _initialize_worker(compiled_rules):
+    """Set CompiledRules instance for _record_text in worker process."""
+    global _worker_compiled_rules
+    _worker_compiled_rules = compiled_rules
+
+
+def _record_text_in_worker(arguments):
+    """Return _record_text for arguments in worker process."""
+    return _record_text(_worker_compiled_rules, *arguments)
+
+
+def _record_texts(compiled_rules, texts, max_workers):
+    """Yield EventData records for texts in the same order.
+
+    texts is a list of (edited_text, data_tag, filename) tuples.  The texts
+    are parsed in this process if max_workers is 1, fewer than two texts are
+    given, or the rules cannot be passed to worker processes.
+
+    """
+    if max_workers != 1 and len(texts) > 1:
+        try:
+            pickle.dumps(compiled_rules)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            max_workers = 1
+    if max_workers == 1 or len(texts) < 2:
+        for text in texts:
+            yield _record_text(compiled_rules, *text)
+        return
+    workers = min(max_workers or os.cpu_count() or 1, len(texts))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(compiled_rules,),
+    ) as executor:
+        yield from executor.map(
+            _record_text_in_worker,
+            texts,
+            chunksize=max(1, len(texts) // (workers * 4)),
+        )
+
+
+class _RuleWatch:
+    """Note progress of rule calls for the process watching a budget worker.
+
+    A _RuleWatch instance is given as profile when parsing text in a budget
+    worker.  The progress count is odd while a rule is being applied, and is
+    incremented at the start and end of each rule call.  The rule and the
+    start of its text are noted in call before the rule is applied.
+
+    """
+
+    def __init__(self, progress, call):
+        """Initialise watch reporting to progress and call."""
+        self._progress = progress
+        self._call = call
+
+    def call(self, key, index, operation, function, args, subject):
+        """Return function(*args) noting start and end of call."""
+        del operation
+        self._call.value = "\n".join(
+            (key, str(index), subject[:_CALL_TEXT_LENGTH])
+        ).encode("utf8")[:_CALL_SIZE]
+        self._progress.value += 1
+        try:
+            return function(*args)
+        finally:
+            self._progress.value += 1
+
+
+def _budget_worker(compiled_rules, connection, progress, call):
+    """Send EventData records for texts received on connection.
+
+    The texts are ((edited_text, data_tag, filename), quarantine) tuples and
+    None means stop.  Each rule and text is noted in call before the rule is
+    applied.
+
+    """
+    watch = _RuleWatch(progress, call)
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        text, quarantine = message
+        try:
+            records = _record_text(
+                compiled_rules, *text, profile=watch, quarantine=quarantine
+            )
+        except Exception as exc:
+            connection.send((_FAILED, exc))
+            break
+        connection.send((_PARSED, records))
+    connection.close()
+
+
+class _RuleTimeout(Exception):
+    """Exception raised when a rule call in a budget worker is too slow."""
+
+    def __init__(self, call):
+        """Note (key, index, text) of the slow rule call."""
+        super().__init__(call)
+        self.call = call
+
+
+class _BudgetWorker:
+    """Process which parses texts and is killed when a rule is slow."""
+
+    def __init__(self, compiled_rules):
+        """Start worker parsing texts with compiled_rules."""
+        self._connection, connection = multiprocessing.Pipe()
+        self._progress = multiprocessing.Value("Q", 0, lock=False)
+        self._call = multiprocessing.Array("c", _CALL_SIZE, lock=False)
+        self._process = multiprocessing.Process(
+            target=_budget_worker,
+            args=(compiled_rules, connection, self._progress, self._call),
+            daemon=True,
+        )
+        self._process.start()
+        connection.close()
+
+    def last_call(self):
+        """Return (key, index, text) of the rule call noted by the worker."""
+        call = self._call.value.decode("utf8", errors="replace")
+        return tuple(call.split("\n", 2))
+
+    def parse(self, text, budget, quarantine):
+        """Return EventData records for text without rules in quarantine.
+
+        text is an (edited_text, data_tag, filename) tuple.  The worker is
+        killed, and _RuleTimeout raised noting the rule call, as soon as a
+        rule call has taken longer than budget seconds.
+
+        """
+        self._connection.send((text, quarantine))
+        progress = self._progress.value
+        since = time.monotonic()
+        while True:
+            if self._connection.poll(_BUDGET_POLL_INTERVAL):
+                message = self._connection.recv()
+                if message[0] == _FAILED:
+                    raise message[1]
+                return message[1]
+            if not self._process.is_alive():
+                if self._connection.poll():
+                    continue
+                raise EventParserError(
+                    "".join(
+                        (
+                            "The process extracting event data from ",
+                            text[2],
+                            " stopped unexpectedly.",
+                        )
+                    )
+                )
+            now = time.monotonic()
+            if self._progress.value != progress:
+                progress = self._progress.value
+                since = now
+            elif progress % 2 and now - since > budget:
+                self.stop()
+                raise _RuleTimeout(self.last_call())
+
+    def stop(self):
+        """Stop worker process."""
+        if self._process.is_alive():
+            self._process.kill()
+        self._process.join()
+        self._connection.close()
+
+
+def _record_texts_within_budget(compiled_rules, texts, budget):
+    """Yield EventData records for texts in the same order.
+
+    texts is a list of (edited_text, data_tag, filename) tuples.  The texts
+    are parsed in a worker process which is killed if a rule call takes
+    longer than budget seconds.  The rule is quarantined: the text is parsed
+    again in a new worker without the rule, and the rule is not applied to
+    the remaining texts.  A Found.RULE_TIMEOUT record naming the rule and
+    the slow text is put before the records for the text.
+
+    The texts are parsed in this process, without a budget, if the rules
+    cannot be passed to a worker process.
+
+    """
+    try:
+        pickle.dumps(compiled_rules)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        for text in texts:
+            yield _record_text(compiled_rules, *text)
+        return
+    worker = None
+    quarantine = set()
+    try:
+        for text in texts:
+            timeouts = []
+            while True:
+                if worker is None:
+                    worker = _BudgetWorker(compiled_rules)
+                try:
+                    records = worker.parse(text, budget, quarantine)
+                    break
+                except _RuleTimeout as exc:
+                    worker = None
+                    quarantine.add(_rule_index(exc.call[1]))
+                    timeouts.append(
+                        (
+                            EventData,
+                            {
+                                "datatag": text[1],
+                                "found": Found.RULE_TIMEOUT,
+                                "raw": timeout_message(
+                                    exc.call, text[2], budget
+                                ),
+                            },
+                        )
+                    )
+            yield timeouts + records
+    finally:
+        if worker is not None:
+            worker.stop()
+
+
+def _rule_index(index):
+    """Return index of rule in event configuration from rule call index.
+
+    index is the rule index, or the rule index and format index separated
+    by a full stop.
+
+    """
+    return int(index.split(".")[0])
+
+
+_compiled_rules = collections.OrderedDict()
+
+
+def compile_rules(configuration, rules, competitions):
+    """Return CompiledRules for rules and competitions from configuration.
+
+    configuration is the text from which rules and competitions were taken.
+    The CompiledRules instance is reused while the configuration text is
+    unchanged.
+
+    """
+    key = hashlib.sha256(configuration.encode("utf8")).hexdigest()
+    compiled = _compiled_rules.get(key)
+    if compiled is None:
+        compiled = CompiledRules(rules, competitions, key=key)
+        _compiled_rules[key] = compiled
+        while len(_compiled_rules) > _COMPILED_RULES_LIMIT:
+            _compiled_rules.popitem(last=False)
+    else:
+        _compiled_rules.move_to_end(key)
+    return compiled
+
+
 class EventParser:
     """Extract event schedules and results from text files.
 
@@ -334,272 +797,518 @@ class EventParser:
     """
 
     def __init__(self, difference_items):
-        """Create parser to process list of _DifferenceText instances."""
+        """Create parser to process list of _DifferenceText instances.
+
+        error holds the messages about rules which exceeded the time budget.
+
+        """
         self._difference_items = difference_items
         self.error = []
+        self.event_context = None
 
     def build_event(
-        self, rules, competitions, team_name_lookup, event_identity
+        self,
+        rules,
+        competitions,
+        team_name_lookup,
+        event_identity,
+        policy=None,
+        compiled_rules=None,
+        parse_cache=None,
+        max_workers=1,
+        profile=None,
+        time_budget=None,
+        split_cache=None,
     ):
         """Return an instance of AdaptEventContext.
 
         The AdaptEventContext instance contains EventData instances arranged
         for use by the Schedule and Result classes.
 
+        policy reports problems and answers questions, default is a
+        DialogPolicy instance.
+
+        compiled_rules is a CompiledRules instance for rules and
+        competitions, which are compiled here if compiled_rules is None.
+
+        parse_cache is a ParseCache instance holding the EventData records
+        from the previous build_event call.  Difference items whose edited
+        text is unchanged are not parsed again: their records are replayed.
+
+        The difference items are parsed in a pool of at most max_workers
+        processes when more than one item needs parsing and max_workers is
+        not 1.  The records from the pool are replayed in item order so the
+        outcome is the same as parsing the items in this process.  The names
+        in each competition are resolved in a pool too.
+
+        profile is a RuleProfile instance which records the time taken by
+        each rule.  All difference items are parsed in this process, ignoring
+        parse_cache and max_workers, when profile is given.
+
+        time_budget is the number of seconds a rule may take on a piece of
+        text.  If given the difference items not in parse_cache are parsed
+        in one worker process, ignoring max_workers.  A rule which exceeds
+        the budget is not applied to the rest of the event, and the message
+        naming the rule and text is added to error.
+
+        split_cache is a NameSplitCache instance holding the guessed splits
+        of joined team and player names from earlier runs.
+
+        build_event is parse_event followed by resolve_names.
+
+        """
+        for _ in self.parse_event(
+            rules,
+            competitions,
+            event_identity,
+            policy=policy,
+            compiled_rules=compiled_rules,
+            parse_cache=parse_cache,
+            max_workers=max_workers,
+            profile=profile,
+            time_budget=time_budget,
+        ):
+            pass
+        return self.resolve_names(
+            team_name_lookup, split_cache=split_cache, max_workers=max_workers
+        )
+
+    def parse_event(
+        self,
+        rules,
+        competitions,
+        event_identity,
+        policy=None,
+        compiled_rules=None,
+        parse_cache=None,
+        max_workers=1,
+        profile=None,
+        time_budget=None,
+    ):
+        """Yield EventData instances as each difference item is parsed.
+
+        The instances are added to a new AdaptEventContext instance, bound
+        to event_context, in the same order.  The arguments are those of
+        build_event.
+
+        The team and player names in the instances are not resolved until
+        resolve_names is called after the generator is exhausted.
+
+        """
+        if policy is None:
+            policy = DialogPolicy()
+        if compiled_rules is None:
+            compiled_rules = CompiledRules(rules, competitions)
+        selected_text = AdaptEventContext(event_identity, policy=policy)
+        self.event_context = selected_text
+        start = 0
+        if profile is not None or (
+            parse_cache is None and max_workers == 1 and time_budget is None
+        ):
+            for difference_item in self._difference_items:
+                _parse_text(
+                    selected_text,
+                    compiled_rules,
+                    difference_item.edited_text,
+                    difference_item.data_tag,
+                    difference_item.filename,
+                    difference_item.headers,
+                    profile=profile,
+                )
+                items = selected_text.processed_items(start)
+                start += len(items)
+                yield from items
+        else:
+            for difference_item, records in zip(
+                self._difference_items,
+                self._get_records(
+                    compiled_rules, parse_cache, max_workers, time_budget
+                ),
+            ):
+                _replay(
+                    records, selected_text, headers=difference_item.headers
+                )
+                items = selected_text.processed_items(start)
+                start += len(items)
+                self.error.extend(
+                    item.raw
+                    for item in items
+                    if item.found == Found.RULE_TIMEOUT
+                )
+                yield from items
+
+    def resolve_names(self, team_name_lookup, split_cache=None, max_workers=1):
+        """Return event_context after resolving team and player names.
+
+        The EventData instances yielded by parse_event are updated with the
+        names found by splitting the joined names in fixtures and results.
+        Guessed splits are taken from, and added to, split_cache if given.
+        The competitions are done in a pool of at most max_workers processes
+        if max_workers is not 1.
+
         """
-        competition_lookup = {c.lower(): c for c in competitions}
-        sorted_competitions = sorted(
-            [(len(c), c) for c in competitions], reverse=True
+        selected_text = self.event_context
+
+        # This is where next batch of future code to handle tabular input files
+        # is needed. The code to populate the EventContext instance _tabular
+        # attribute is already in place.
+        selected_text.convert_tabular_data_to_sequence()
+
+        # These name calculation methods can take a long time to run.
+        # A few minutes compared with well under a minute for the rest.
+        selected_text.fixture_list_names(
+            team_name_lookup, split_cache=split_cache, max_workers=max_workers
         )
-        re_competition = re.compile(
-            "|".join(
-                [r"\s+".join(c[-1].split()) for c in sorted_competitions]
-            ).join(("(", ")")),
-            flags=re.IGNORECASE | re.DOTALL,
+        selected_text.results_names(
+            split_cache=split_cache, max_workers=max_workers
         )
-        re_sections = []
-        re_forwarded = []
-        for event in rules:
-            sorted_sections = sorted(
-                [(len(c), c) for c in event[SECTION_NAME].values()],
-                reverse=True,
+
+        return selected_text
+
+    def _get_records(
+        self, compiled_rules, parse_cache, max_workers, time_budget=None
+    ):
+        """Yield EventData records for difference items in item order.
+
+        Records are taken from parse_cache, if given, where possible and the
+        rest are derived by parsing the items, within time_budget per rule
+        call if given.  parse_cache is updated when all records have been
+        yielded, except with records derived after a rule exceeded
+        time_budget.
+
+        """
+        keys = []
+        records = []
+        unparsed = []
+        for difference_item in self._difference_items:
+            key = None
+            item_records = None
+            if parse_cache is not None and compiled_rules.key is not None:
+                key = (
+                    compiled_rules.key,
+                    difference_item.data_tag,
+                    difference_item.filename,
+                    difference_item.edited_text_digest,
+                )
+                item_records = parse_cache.get(key)
+            if item_records is None:
+                unparsed.append(len(records))
+            keys.append(key)
+            records.append(item_records)
+        texts = [
+            (
+                self._difference_items[index].edited_text,
+                self._difference_items[index].data_tag,
+                self._difference_items[index].filename,
+            )
+            for index in unparsed
+        ]
+        if time_budget is None:
+            parsed = _record_texts(compiled_rules, texts, max_workers)
+        else:
+            parsed = _record_texts_within_budget(
+                compiled_rules, texts, time_budget
             )
-            re_sections.append(
-                re.compile(
-                    "|".join(
-                        [r"\s+".join(s[-1].split()) for s in sorted_sections]
-                    ).join(("(", ")")),
-                    flags=re.IGNORECASE | re.DOTALL,
+        quarantined = False
+        for index, item_records in enumerate(records):
+            if item_records is None:
+                item_records = next(parsed)
+                records[index] = item_records
+
+                # Records derived without a quarantined rule are not kept.
+                quarantined = quarantined or any(
+                    kargs.get("found") == Found.RULE_TIMEOUT
+                    for _, kargs in item_records
                 )
+                if quarantined:
+                    keys[index] = None
+            yield item_records
+        parsed.close()
+        if parse_cache is not None:
+            parse_cache.replace(
+                {key: r for key, r in zip(keys, records) if key is not None}
             )
-            re_forwarded.append(None)
-            if event[DROP_FORWARDED_MARKERS]:
-                re_forwarded[-1] = re.compile(
-                    event[DROP_FORWARDED_MARKERS].join(
-                        (r"(?<=\n)(?:\s*", ")+")
-                    ),
-                    flags=re.IGNORECASE | re.DOTALL,
+
+
+def _parse_text(
+    context,
+    compiled_rules,
+    edited_text,
+    data_tag,
+    filename,
+    headers,
+    profile=None,
+    quarantine=(),
+):
+    """Create EventData instances in context for lines in edited_text.
+
+    data_tag, filename, and headers, are those of the difference item whose
+    edited text is edited_text.  context is the AdaptEventContext instance
+    for the event, or an _EventDataRecorder instance.
+
+    profile is a RuleProfile instance which records the time taken by each
+    rule, or None.
+
+    quarantine holds the indices of rules not applied because they took
+    too long on earlier text.  The lines of edited_text are not looked at
+    one by one if a rule is not applied.
+
+    """
+    rules = compiled_rules.rules
+    competition_lookup = compiled_rules.competition_lookup
+    re_competition = compiled_rules.re_competition
+    re_sections = compiled_rules.re_sections
+    re_forwarded = compiled_rules.re_forwarded
+    forwarded_texts = {None: edited_text}
+    found = False
+    for eitem, event in enumerate(rules):
+        if eitem in quarantine:
+            found = True
+            continue
+        text = forwarded_texts.get(re_forwarded[eitem])
+        if text is None:
+            text = "".join(
+                _call_rule(
+                    profile,
+                    DROP_FORWARDED_MARKERS,
+                    eitem,
+                    re_forwarded[eitem].split,
+                    edited_text,
                 )
-        selected_text = AdaptEventContext(event_identity)
-        for difference_item in self._difference_items:
-            found = False
-            for eitem, event in enumerate(rules):
-                if re_forwarded[eitem]:
-                    text = "".join(
-                        re_forwarded[eitem].split(difference_item.edited_text)
-                    )
-                else:
-                    text = difference_item.edited_text
-                if event[SOURCE].pattern:
-                    try:
-                        source = event[SOURCE].findall(text)
-                        source = source[0] if source else ""
-                    except RuntimeError as eee:
-                        if str(eee) == IEIREE:
-                            raise_re_error(SOURCE, text)
-                        raise
-                else:
-                    source = difference_item.filename
-                result_line_description = (
-                    selected_text,
-                    difference_item.data_tag,
-                    re_sections[eitem],
-                    source,
-                    competition_lookup,
-                    difference_item.headers,
+            )
+            forwarded_texts[re_forwarded[eitem]] = text
+        if event[SOURCE].pattern:
+            try:
+                source = _call_rule(
+                    profile, SOURCE, eitem, event[SOURCE].findall, text
+                )
+                source = source[0] if source else ""
+            except RuntimeError as eee:
+                if str(eee) == IEIREE:
+                    raise_re_error(SOURCE, text)
+                raise
+        else:
+            source = filename
+        result_line_description = (
+            context,
+            data_tag,
+            re_sections[eitem],
+            source,
+            competition_lookup,
+            headers,
+        )
+        try:
+            est = _call_rule(
+                profile,
+                RESULTS_PREFIX,
+                eitem,
+                event[RESULTS_PREFIX].split,
+                text,
+            )
+        except RuntimeError as eee:
+            if str(eee) == IEIREE:
+                raise_re_error(RESULTS_PREFIX, text)
+            raise
+        # tracer for fixing regular expressions
+        # print(data_tag, len(est)) # tracer
+        est.pop(0)
+        keep_word_table = compiled_rules.keep_word_tables[eitem]
+        for rri in est:
+            rri = rri.translate(keep_word_table)
+            try:
+                spe = _call_rule(
+                    profile,
+                    SECTION_PREFIX,
+                    eitem,
+                    event[SECTION_PREFIX].findall,
+                    rri,
                 )
+            except RuntimeError as eee:
+                if str(eee) == IEIREE:
+                    raise_re_error(SECTION_PREFIX, rri)
+                raise
+            for ski, ssi in zip(
+                spe,
+                [
+                    r
+                    for r in _call_rule(
+                        profile,
+                        SECTION_BODY,
+                        eitem,
+                        event[SECTION_BODY].split,
+                        rri,
+                    )
+                    if r
+                ],
+            ):
                 try:
-                    est = event[RESULTS_PREFIX].split(text)
+                    ski = event[SECTION_NAME].get(
+                        " ".join(ski.lower().split()), ski
+                    )
                 except RuntimeError as eee:
                     if str(eee) == IEIREE:
-                        raise_re_error(RESULTS_PREFIX, text)
+                        raise_re_error(SECTION_NAME, ski)
                     raise
-                # tracer for fixing regular expressions
-                # print(difference_item.data_tag, len(est)) # tracer
-                est.pop(0)
-                for rri in est:
-                    kws = (
-                        event[KEEP_WORD_SPLITTERS]
-                        .replace("\\t", "\t")
-                        .replace("\\n", "\n")
-                    )
-                    rri = "".join(
-                        [
-                            (
-                                s
-                                if s.isalnum() or s.isnumeric() or s in kws
-                                else " "
-                            )
-                            for s in rri
-                            if len(s)
-                        ]
-                    )
-                    try:
-                        spe = event[SECTION_PREFIX].findall(rri)
-                    except RuntimeError as eee:
-                        if str(eee) == IEIREE:
-                            raise_re_error(SECTION_PREFIX, rri)
-                        raise
-                    for ski, ssi in zip(
-                        spe, [r for r in event[SECTION_BODY].split(rri) if r]
-                    ):
+                for mfn, mbn, mdn, gbn, grn in _FIND_MATCHES:
+                    for eformat, emf in enumerate(event[mfn]):
+                        index = ".".join((str(eitem), str(eformat)))
                         try:
-                            ski = event[SECTION_NAME].get(
-                                " ".join(ski.lower().split()), ski
+                            kditems = _call_rule(
+                                profile, mbn, index, emf[mbn].findall, ssi
                             )
                         except RuntimeError as eee:
                             if str(eee) == IEIREE:
-                                raise_re_error(SECTION_NAME, ski)
+                                raise_re_error(mbn, ssi)
                             raise
-                        for mfn, mbn, mdn, gbn, grn in _FIND_MATCHES:
-                            for emf in event[mfn]:
+                        # tracer for fixing regular expressions
+                        # print(mfn, repr(ski), len(kditems), end='  ')
+                        for kdi in kditems:
+                            # tracer for fixing regular expressions
+                            # print(repr(kdi[:20]), end='  ') # tracer
+
+                            # The competition name is included in each
+                            # fixture so is not output here.
+                            # A hack perhaps, but _select_result_line
+                            # would otherwise find it difficult to
+                            # distinguish fixture list entries and
+                            # match headers without a match score.
+                            if mfn != FIXTURE_FORMATS:
+                                _select_result_line(
+                                    result_line_description,
+                                    ski,
+                                )
+
+                            for fvi in mdn:
+                                if fvi not in emf:
+                                    continue
+
+                                # Translate to text lines for calls
+                                # of _select_result_line.
+                                # The team and match date translations,
+                                # and their played on equivalents.
+                                # Match defaults here too.
                                 try:
-                                    kditems = emf[mbn].findall(ssi)
+                                    tle = list(
+                                        _call_rule(
+                                            profile,
+                                            fvi,
+                                            index,
+                                            emf[fvi].finditer,
+                                            kdi,
+                                        )
+                                    )
                                 except RuntimeError as eee:
                                     if str(eee) == IEIREE:
-                                        raise_re_error(mbn, ssi)
+                                        raise_re_error(fvi, kdi)
                                     raise
                                 # tracer for fixing regular expressions
-                                # print(mfn, repr(ski), len(kditems), end='  ')
-                                for kdi in kditems:
-                                    # tracer for fixing regular expressions
-                                    # print(repr(kdi[:20]), end='  ') # tracer
-
-                                    # The competition name is included in each
-                                    # fixture so is not output here.
-                                    # A hack perhaps, but _select_result_line
-                                    # would otherwise find it difficult to
-                                    # distinguish fixture list entries and
-                                    # match headers without a match score.
-                                    if mfn != FIXTURE_FORMATS:
-                                        _select_result_line(
-                                            result_line_description,
-                                            ski,
-                                        )
-
-                                    for fvi in mdn:
-                                        if fvi not in emf:
-                                            continue
-
-                                        # Translate to text lines for calls
-                                        # of _select_result_line.
-                                        # The team and match date translations,
-                                        # and their played on equivalents.
-                                        # Match defaults here too.
-                                        try:
-                                            tle = list(emf[fvi].finditer(kdi))
-                                        except RuntimeError as eee:
-                                            if str(eee) == IEIREE:
-                                                raise_re_error(fvi, kdi)
-                                            raise
-                                        # tracer for fixing regular expressions
-                                        # print(fvi, len(tle), end='  ')
-                                        if len(tle) != 1:
-                                            continue
-                                        gdi = tle[0].groupdict()
-
-                                        # Used only by FIXTURE_BODY fvi value.
-                                        if "competition" not in gdi:
-                                            gdi["competition"] = ski
-                                        else:
-                                            gdi["competition"] = event[
-                                                SECTION_NAME
-                                            ].get(
-                                                " ".join(
-                                                    gdi["competition"]
-                                                    .lower()
-                                                    .split()
-                                                ),
-                                                ski,
-                                            )
-
-                                        _translate(
-                                            result_line_description, fvi, gdi
-                                        )
-
-                                    # Fixture formats do not have game detail.
-                                    if gbn is None:
+                                # print(fvi, len(tle), end='  ')
+                                if len(tle) != 1:
+                                    continue
+                                gdi = tle[0].groupdict()
+
+                                # Used only by FIXTURE_BODY fvi value.
+                                if "competition" not in gdi:
+                                    gdi["competition"] = ski
+                                else:
+                                    gdi["competition"] = event[
+                                        SECTION_NAME
+                                    ].get(
+                                        " ".join(
+                                            gdi["competition"].lower().split()
+                                        ),
+                                        ski,
+                                    )
+
+                                _translate(
+                                    result_line_description,
+                                    fvi,
+                                    gdi,
+                                    profile=profile,
+                                    index=index,
+                                )
+
+                            # Fixture formats do not have game detail.
+                            if gbn is None:
+                                continue
+
+                            # Find the text containing game, or played
+                            # on game, results for each match report.
+                            vditems = [
+                                (
+                                    t.strip()
+                                    if isinstance(t, str)
+                                    else " ".join(t).strip()
+                                )
+                                for t in _call_rule(
+                                    profile, gbn, index, emf[gbn].findall, kdi
+                                )
+                            ]
+                            # tracer for fixing regular expressions
+                            # print(gbn, len(vditems), end='  ')
+                            for vdi in vditems:
+                                if not vdi:
+                                    continue
+                                # tracer for fixing regular expressions
+                                # print('.', end='') # tracer
+                                for fvi in grn:
+                                    if fvi not in emf:
                                         continue
 
-                                    # Find the text containing game, or played
-                                    # on game, results for each match report.
-                                    vditems = [
-                                        (
-                                            t.strip()
-                                            if isinstance(t, str)
-                                            else " ".join(t).strip()
-                                        )
-                                        for t in emf[gbn].findall(kdi)
-                                    ]
-                                    # tracer for fixing regular expressions
-                                    # print(gbn, len(vditems), end='  ')
-                                    for vdi in vditems:
-                                        if not vdi:
-                                            continue
-                                        # tracer for fixing regular expressions
-                                        # print('.', end='') # tracer
-                                        for fvi in grn:
-                                            if fvi not in emf:
-                                                continue
-
-                                            # Translate to text lines for calls
-                                            # of _select_result_line.
-                                            # The finished, unfinished, and
-                                            # default translations, and their
-                                            # played on equivalents.
-                                            try:
-                                                tle = list(
-                                                    emf[fvi].finditer(vdi)
-                                                )
-                                            except RuntimeError as eee:
-                                                if str(eee) == IEIREE:
-                                                    raise_re_error(fvi, vdi)
-                                                raise
-                                            if len(tle) != 1:
-                                                continue
-                                            # tracer for fixing regexes
-                                            # print(':', end='') # tracer
-                                            _translate(
-                                                result_line_description,
+                                    # Translate to text lines for calls
+                                    # of _select_result_line.
+                                    # The finished, unfinished, and
+                                    # default translations, and their
+                                    # played on equivalents.
+                                    try:
+                                        tle = list(
+                                            _call_rule(
+                                                profile,
                                                 fvi,
-                                                tle[0].groupdict(),
+                                                index,
+                                                emf[fvi].finditer,
+                                                vdi,
                                             )
-                                            break
-                                # print() # tracer for fixing regexes
-                found |= bool(est)
-                # print() # tracer for fixing regular expressions
-            if not found:
-                # tracer for fixing regular expressions
-                # print(difference_item.data_tag, found, '\n') # tracer
-
-                # Call _select_result_line for each line of text.
-                result_line_description = (
-                    selected_text,
-                    difference_item.data_tag,
-                    re_competition,
-                    difference_item.filename,
-                    competition_lookup,
-                    difference_item.headers,
-                )
-                for tle in difference_item.edited_text.splitlines():
-                    if len(tle):
-                        # tracer for fixing regular expressions
-                        # print('|', repr(tle)) # tracer
-                        _select_result_line(result_line_description, tle)
+                                        )
+                                    except RuntimeError as eee:
+                                        if str(eee) == IEIREE:
+                                            raise_re_error(fvi, vdi)
+                                        raise
+                                    if len(tle) != 1:
+                                        continue
+                                    # tracer for fixing regexes
+                                    # print(':', end='') # tracer
+                                    _translate(
+                                        result_line_description,
+                                        fvi,
+                                        tle[0].groupdict(),
+                                        profile=profile,
+                                        index=index,
+                                    )
+                                    break
+                        # print() # tracer for fixing regexes
+        found |= bool(est)
+        # print() # tracer for fixing regular expressions
+    if not found:
+        # tracer for fixing regular expressions
+        # print(data_tag, found, '\n') # tracer
+
+        # Call _select_result_line for each line of text.
+        result_line_description = (
+            context,
+            data_tag,
+            re_competition,
+            filename,
+            competition_lookup,
+            headers,
+        )
+        for tle in edited_text.splitlines():
+            if len(tle):
                 # tracer for fixing regular expressions
-                # print('') # tracer
-
-        # This is where next batch of future code to handle tabular input files
-        # is needed. The code to populate the EventContext instance _tabular
-        # attribute is already in place.
-        selected_text.convert_tabular_data_to_sequence()
-
-        # These name calculation methods can take a long time to run.
-        # A few minutes compared with well under a minute for the rest.
-        truncate = selected_text.fixture_list_names(team_name_lookup)
-        selected_text.results_names(truncate=truncate)
-
-        return selected_text
+                # print('|', repr(tle)) # tracer
+                _select_result_line(result_line_description, tle)
+        # tracer for fixing regular expressions
+        # print('') # tracer
 
 
 def _is_name_and_number_set_a_score(names, numbers):
@@ -702,13 +1411,16 @@ def _select_result_line(result_line_description, text):
                 headers=headers,
             )
 
+    # The regular expressions which cannot match text are not tried.
+    tokens = LineTokens(text)
+
     # text may have results either in all-play-all or in swiss table style.
     # Exactly one number must be present: the player's number in the table.
     # text must produce exactly one item containining none-whitespace when
     # split by the other items, which is assumed to be the player's name.
 
     # Check for swiss implying absence of all-play-all
-    split_text = RE_SWISS.split(text)
+    split_text = RE_SWISS.split(text) if tokens.swiss else [text]
     swiss = [s for s in split_text if len(s.strip())]
     if len(split_text) > 1 and len(swiss):
 
@@ -776,7 +1488,10 @@ def _select_result_line(result_line_description, text):
         )
 
     # Check for all-play-all assuming absence of swiss
-    split_text = RE_ALL_PLAY_ALL.split(text)
+    if tokens.all_play_all:
+        split_text = RE_ALL_PLAY_ALL.split(text)
+    else:
+        split_text = [text]
     if len(split_text) > 1:
         all_play_all = [s for s in split_text if len(s.strip())]
         if len(all_play_all) > 1:
@@ -832,7 +1547,10 @@ def _select_result_line(result_line_description, text):
     # results do not include enough information to identify the game.  Often
     # the date is omitted meaning it is necessary to check there is only one
     # possible corresponding unfinished game report.
-    split_text = RE_PLAYED_ON.split(text, maxsplit=1)
+    if tokens.played_on:
+        split_text = RE_PLAYED_ON.split(text, maxsplit=1)
+    else:
+        split_text = [text]
     played_on = len(split_text) == 2
     if played_on:
         text = split_text[1]
@@ -867,8 +1585,10 @@ def _select_result_line(result_line_description, text):
     # <word> <date> is valid in non-swiss tournament table context and
     # cannot be taken as 'swiss' because it is not yet known that the
     # context is 'swiss'.
-    if len(tsc) == 3:
-        if len(tsc[0].strip()) == 0:
+    # The competition name may end within a word so the rest of text is
+    # scanned again.
+    if len(tsc) == 3 and len(tsc[0].strip()) == 0:
+        if LineTokens(tsc[2]).date:
             if len("".join(RE_DATE.split(tsc[2])).strip()) == 0:
                 date = RE_DATE.findall(tsc[2])
                 if len(date) > 1:
@@ -887,7 +1607,7 @@ def _select_result_line(result_line_description, text):
     # text must contain less than three dates.
     # Use tsdate, not split_text, to keep for later if text turns out to be
     # fixture.
-    tsdate = RE_DATE.split(text)
+    tsdate = RE_DATE.split(text) if tokens.date else [text]
     if len(tsdate) > 3:
         return EventData(
             datatag=data_tag,
@@ -943,6 +1663,9 @@ def _select_result_line(result_line_description, text):
             competition_lookup, " ".join(tsc[1].split()).lower()
         )
         tsnd = " ".join((tsc[0], tsc[2]))
+
+        # The competition name may be removed from within a word.
+        tokens = LineTokens(tsnd)
     else:
         competition = None
 
@@ -950,7 +1673,10 @@ def _select_result_line(result_line_description, text):
     # which may be used to validate a set of results, such as a match score.
     # The regex is assumed to match only at end of string.
     # Remove it from string to checking validity of score.
-    split_text = RE_RESULT_ONLY.split(tsnd)
+    if tokens.result_only:
+        split_text = RE_RESULT_ONLY.split(tsnd)
+    else:
+        split_text = [tsnd]
     result_only = len(split_text) == 2
     if result_only:
         tsnro = split_text[0]
@@ -965,7 +1691,7 @@ def _select_result_line(result_line_description, text):
     # First stage checks for void unfinished and defaulted games, allowing for
     # board number to be present.  If a defaulted game is found try to decide
     # who won.
-    void = RE_VOID.findall(tsnro)
+    void = RE_VOID.findall(tsnro) if tokens.void else []
     if len(void) == 1:
         void = "".join(void[0].split()).lower()
         names = [
@@ -1404,12 +2130,16 @@ def _select_result_line(result_line_description, text):
     # separated by one or two player names and allows one board item to be
     # present.  The first points item which could be a board item is chosen as
     # the board item. Board items do not start with '0'.
-    numbers = RE_POINTS.findall(tsnro)
-    names = [
-        " ".join(n)
-        for n in [t.split() for t in RE_POINTS.split(tsnro)]
-        if len(n)
-    ]
+    if tokens.points:
+        numbers = RE_POINTS.findall(tsnro)
+        names = [
+            " ".join(n)
+            for n in [t.split() for t in RE_POINTS.split(tsnro)]
+            if len(n)
+        ]
+    else:
+        numbers = []
+        names = []
     if _is_name_and_number_set_a_score(names, numbers):
         # print('@@@@') # temporary tracer for fixing regular expressions
         # print(repr(text.replace('\xbd', '?')),
@@ -1540,7 +2270,7 @@ def _select_result_line(result_line_description, text):
     # Third stage checks for single items like ' 1-0 ' and allows one board
     # item to be present.  Items like ' draw ' and single ' 0.5 ' meaning a
     # draw are ignored in this stage.
-    score = RE_SCORE.findall(tsnro)
+    score = RE_SCORE.findall(tsnro) if tokens.score else []
     if len(score) > 1:
         return EventData(
             datatag=data_tag,
@@ -1617,7 +2347,7 @@ def _select_result_line(result_line_description, text):
     # 3 Smith 0.5 Jones is interpreted as a 3-0.5 result rather than a draw
     # on board 3 so match scores like Anytown 0.5 Toytown 3.5 are not seen
     # as a result on board 3.5.  Use ' draw ' instead of ' 0.5 '.
-    score = RE_DRAW.findall(tsnro)
+    score = RE_DRAW.findall(tsnro) if tokens.draw else []
     if len(score) == 1:
         names = [
             " ".join(n)
@@ -1701,7 +2431,10 @@ def _select_result_line(result_line_description, text):
                 day = split_text[3]
                 tsnd = split_text[-1].replace(competition, "", 1)
 
-        split_text = RE_ROUND.split(tsnd)
+            # The competition name may be removed from within a word.
+            tokens = LineTokens(tsnd)
+
+        split_text = RE_ROUND.split(tsnd) if tokens.round else [tsnd]
         if len(split_text) == 3:
             teamone, teamtwo = [
                 " ".join(t.split()) for t in (split_text[0], split_text[2])
@@ -1788,7 +2521,7 @@ def _select_result_line(result_line_description, text):
     # Absence of round and competition, but presence of date makes line the
     # date of following games in competition if rest of line is whitespace.
     if date:
-        split_text = RE_ROUND.split(tsnd)
+        split_text = RE_ROUND.split(tsnd) if tokens.round else [tsnd]
         if len(split_text) == 1:
             if len(split_text[0].strip()) == 0:
                 return EventData(
@@ -1816,7 +2549,7 @@ def _select_result_line(result_line_description, text):
     # name of following games, and also a round header if round is present,
     # provided rest of line is whitespace.
     if competition:
-        split_text = RE_ROUND.split(tsnd)
+        split_text = RE_ROUND.split(tsnd) if tokens.round else [tsnd]
         if len(split_text) == 3:
             if len(" ".join((split_text[0], split_text[2])).strip()) == 0:
                 return EventData(
@@ -1847,20 +2580,8 @@ def _select_result_line(result_line_description, text):
 
             # Text is the event name if it is followed by line with two dates
             # and event date has not already been set.
-            if context.event_start_date or context.event_end_date:
-                return EventData(
-                    datatag=data_tag,
-                    found=Found.NOT_COMPETITION_ONLY,
-                    raw=text,
-                    headers=headers,
-                )
-            return EventData(
-                datatag=data_tag,
-                found=Found.POSSIBLE_EVENT_NAME,
-                context=context,
-                eventname=" ".join(text.split()),
-                source=source,
-                headers=headers,
+            return _possible_event_name(
+                context, data_tag, text, source, headers
             )
 
         return EventData(
@@ -1872,7 +2593,7 @@ def _select_result_line(result_line_description, text):
 
     # Presence of board, and absence of date and competition makes line the
     # round of following games if rest of line is whitespace.
-    split_text = RE_ROUND.split(tsnd)
+    split_text = RE_ROUND.split(tsnd) if tokens.round else [tsnd]
     if len(split_text) == 3:
         if len(" ".join((split_text[0], split_text[2])).strip()) == 0:
             return EventData(
@@ -1903,13 +2624,71 @@ def _select_result_line(result_line_description, text):
     )
 
 
-def _translate(result_line_description, re_name, finditer_list_groupdict):
+def _possible_event_name(context, data_tag, text, source, headers):
+    """Return EventData for text, an event name if event date not set.
+
+    The decision is deferred if context is recording EventData instances
+    because it depends on the event date in the context.
+
+    """
+    if isinstance(context, _EventDataRecorder):
+        context.defer(
+            _possible_event_name,
+            {
+                "data_tag": data_tag,
+                "text": text,
+                "source": source,
+                "headers": headers,
+            },
+        )
+        return None
+    if context.event_start_date or context.event_end_date:
+        return EventData(
+            datatag=data_tag,
+            found=Found.NOT_COMPETITION_ONLY,
+            raw=text,
+            headers=headers,
+        )
+    return EventData(
+        datatag=data_tag,
+        found=Found.POSSIBLE_EVENT_NAME,
+        context=context,
+        eventname=" ".join(text.split()),
+        source=source,
+        headers=headers,
+    )
+
+
+def _call_rule(profile, key, index, function, text):
+    """Return function(text), recording time taken in profile if given.
+
+    function is a method of the regular expression for key in the rule at
+    index in the event configuration.
+
+    """
+    if profile is None:
+        return function(text)
+    return profile.call(
+        key, index, function.__name__, function, (text,), text
+    )
+
+
+def _translate(
+    result_line_description,
+    re_name,
+    finditer_list_groupdict,
+    profile=None,
+    index=None,
+):
     """Translate text from finditer_list and call _select_result_line.
 
     A sequence of _select_result_line(result_line_description, text) calls is
     done using text from the finditer_list groups generated by the re_name
     regular expression.
 
+    The time taken by _select_result_line is recorded in profile, if given,
+    for re_name in the rule at index.
+
     """
     text = []
     if re_name == FINISHED:
@@ -2038,6 +2817,15 @@ def _translate(result_line_description, re_name, finditer_list_groupdict):
         # _select_result_line returns an EventData instance at present even
         # though the instance has been added to the EventContext instance data
         # structures.
+        if profile is not None:
+            return profile.call(
+                re_name,
+                index,
+                "select",
+                _select_result_line,
+                (result_line_description, text),
+                text,
+            )
         return _select_result_line(result_line_description, text)
     # print('X', end='') # tracer for fixing regular expressions
     return None
@@ -2090,6 +2878,36 @@ def raise_re_error(name, text):
     )
 
 
+def timeout_message(call, filename, budget):
+    """Return message reporting a rule call which exceeded budget.
+
+    call is the (key, index, text) of the rule call and filename is the
+    name of the file containing the text.
+
+    """
+    name, index, rule_text = call
+    if len(rule_text) > 300:
+        rule_text = "".join((rule_text[:300], "..."))
+    return "".join(
+        (
+            "A regular expression derived from the\n\n",
+            name,
+            "\n\nentry in rule ",
+            index,
+            " of the event configuration file took longer than ",
+            str(budget),
+            " seconds processing\n\n",
+            repr(rule_text),
+            "\n\nin ",
+            filename,
+            ".\n\nThe regular expression probably backtracks too ",
+            "much on this text: change the event configuration file ",
+            "entry or edit the text.  The rule is not applied to the rest ",
+            "of the event.",
+        )
+    )
+
+
 def _convert_result_first(round_result):
     """Return lower-case result replacing leading '-=+' with trailing '-=+'."""
     if round_result[0] in "-=+":
@@ -0,0 +1,1021 @@
+# eventreport.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Generate the schedule and results reports for an event.
+
+The report lines are collected in the generated_schedule and
+generated_results lists as (text, eventdata) tuples, where eventdata is None
+or the source of text.  The lists are displayed in Text widgets by the
+SourceEdit class, or written to files when validating without a display.
+
+This class was extracted from SourceEdit in the gui package.
+
+"""
+
+import datetime
+import collections
+
+from solentware_misc.core.utilities import AppSysPersonName
+
+from .eventparser import EventParserError, IEIREE
+from .gameresults import displayresult
+from .schedule import ScheduleError
+
+
+class EventReport:
+    """Generate event schedule and results reports as lists of text."""
+
+    _months = {
+        "01": "Jan",
+        "02": "Feb",
+        "03": "Mar",
+        "04": "Apr",
+        "05": "May",
+        "06": "Jun",
+        "07": "Jul",
+        "08": "Aug",
+        "09": "Sep",
+        "10": "Oct",
+        "11": "Nov",
+        "12": "Dec",
+    }  # assumes dates held in ISO format
+
+    def __init__(self, *args, **kargs):
+        """Extend with empty generated schedule and results reports."""
+        super().__init__(*args, **kargs)
+        self.generated_schedule = []
+        self.generated_results = []
+
+    def get_schedule(self, data):
+        """Extract event schedule and prepare report of errors."""
+        data.extract_schedule()
+        fixdata = data.fixture_schedule
+        genfix = self.generated_schedule
+        del genfix[:]
+        if len(fixdata.error):
+            genfix.append(("Errors\n", None))
+            genfix.extend(fixdata.error)
+
+    def get_results(self, data):
+        """Extract event results and prepare report of errors."""
+        data.extract_results()
+        resdata = data.collation.reports
+        genres = self.generated_results
+        del genres[:]
+        if len(resdata.error):
+            genres.append(("Errors\n", None))
+            genres.extend(resdata.error)
+
+    @staticmethod
+    def _date_text(date):
+        """Return dd mmm yyyy given ISO format yyyy-mm-dd."""
+        year, month, day = date.split("-")
+        return " ".join((day, EventReport._months[month], year))
+
+    def build_event_report(self, data, policy):
+        """Generate report on data input and return True if generated.
+
+        data is the Season instance for the event and policy reports the
+        problems which prevent the report being generated.
+
+        Data can be ok and still be wrong.  ok means merely that the data
+        input is consistent.  A number of formats are acceptable and named
+        in sectiontypes below.
+
+        """
+        sectiontypes = {
+            "allplayall": self._report_allplayall,  # individuals
+            "league": lambda s, d: None,  # team all play all
+            "swiss": self._report_swiss,  # individuals
+            "fixturelist": lambda s, d: None,  # matches from fixture list
+            "individual": self._report_individual,  # games between players
+        }
+        try:
+            data.extract_event(policy=policy)
+        except EventParserError as exp:
+            policy.inform(
+                message=str(exp),
+                title="Event Extract Error",
+            )
+            return False
+        except RuntimeError as exp:
+            if str(exp) == IEIREE:
+                policy.inform(
+                    message=" ".join(
+                        (
+                            "An exception has occurred while extracting",
+                            "result information using one of the default",
+                            "regular expressions.\n\nThe latest version of",
+                            "Python, or at least a different version (change",
+                            "between 3.3.1 and 3.3.2 for example) may process",
+                            "the text correctly.\n\nAn exception will be",
+                            "raised on dismissing this dialogue.",
+                        )
+                    ),
+                    title="Regular Expression Runtime Error",
+                )
+            raise
+        try:
+            self.get_schedule(data)
+        except ScheduleError as exp:
+            policy.inform(
+                message="".join(
+                    (
+                        str(exp).join(('Exception "', '" has occurred.\n\n')),
+                        "This probably indicates an invalid combination of ",
+                        "settings in the result extraction configuration ",
+                        "file.",
+                    )
+                ),
+                title="Extract Schedule Error",
+            )
+            return False
+        # pycodestyle E722 do not use bare 'except'.
+        # pylint accepts this because of the following 'raise' statement.
+        except:
+            policy.inform(
+                message="".join(
+                    (
+                        "An exception has occured and will be reported on ",
+                        "dismissing this dialogue.\n\nPlease consider the ",
+                        "possibility text in one of the emails has been ",
+                        "misinterpreted as unexpected information about ",
+                        "a result, rather than being ignored.\n\nWords like ",
+                        "'default' and 'draw', or a sprinkling of numbers ",
+                        "like '1', '12' and '2', are likely culprits ",
+                        "because they have a place in identifying results.",
+                        "\n\nThe possibility is a consequence of not being ",
+                        "too fussy about how results are presented.",
+                    )
+                ),
+                title="Generate",
+            )
+            raise
+        self._report_fixtures(data)
+
+        # Remove the 'try' wrapping once the problem is fixed.
+        # The KeyError might be fixable but the AttributeError is a genuine
+        # problem found by accident; and probably deserves an Exception of
+        # it's own.
+        try:
+            self.get_results(data)
+        except KeyError:
+            policy.inform(
+                message="".join(
+                    (
+                        "Known causes of this exception are:\n\n",
+                        "A badly-formed entry in a swiss table: for example ",
+                        "'x' or 'w12w'.\n",
+                        "\nA well-formed entry in a swiss table refering to ",
+                        "a row which does not exist: for example 'w12+' ",
+                        "where '12' is not a player's PIN.\n",
+                        "\nAn ECF code or membership number missing the ",
+                        "single alpha character suffix or prefix.\n",
+                        "\n Edit document as workaround (or solution).",
+                    )
+                ),
+                title="Generate Report KeyError Exception",
+            )
+            return False
+        except AttributeError as exc:
+            if str(exc) != "".join(
+                ("'NoneType' object has no attribute 'authorization_delay'",)
+            ):
+                raise
+            policy.inform(
+                message="".join(
+                    (
+                        "The known cause of this exception is:\n\n",
+                        "Type a match result in the textentry area, ",
+                        "perhaps because the usual email report is ",
+                        "not available, with date, competition, ",
+                        "match score, and each game result, on their ",
+                        "own line.  This is the format accepted by ",
+                        "default without rules in configuration file.\n\n",
+                        "Copy, paste, and edit, a match result in it's ",
+                        "usual email format to the textentry area leads ",
+                        "to a normal error report expected in other ",
+                        "situations.\n\nIf the match report must be ",
+                        "typed do the copy, paste, and edit, in the ",
+                        "copied report's original email area.",
+                    )
+                ),
+                title="Generate Report AttributeError Exception",
+            )
+            return False
+
+        if (
+            len(data.collation.reports.error) == 0
+            and len(data.fixture_schedule.error) == 0
+        ):
+
+            schedule = data.collation.schedule
+            self.generated_schedule.insert(0, (schedule.es_name, None))
+            self.generated_schedule.insert(
+                1,
+                (
+                    " ".join(
+                        (
+                            "From",
+                            self._date_text(schedule.es_startdate),
+                            "to",
+                            self._date_text(schedule.es_enddate),
+                        )
+                    ),
+                    None,
+                ),
+            )
+
+            report = data.collation.reports
+            genres = self.generated_results
+            genres.append((report.er_name, None))
+            self._report_players(data)
+            league_processed = False
+            for section in data.collation.report_order:
+                process = sectiontypes.get(
+                    data.collation.section_type[section],
+                    self._section_type_unknown,
+                )
+                if not isinstance(process, collections.abc.Callable):
+                    process = self._report_not_implemented
+                process(section, data)
+                if process is sectiontypes["league"]:
+                    league_processed = True
+                elif process is sectiontypes["fixturelist"]:
+                    league_processed = True
+            if league_processed:
+                self._report_league(None, data)
+        return True
+
+    @staticmethod
+    def generated_schedule_lines(generated_schedule):
+        """Return list of lines of text in generated_schedule report."""
+        lines = []
+        for report_text, report_error in generated_schedule:
+            if report_error is None:
+                lines.append(report_text)
+            else:
+                lines.append(
+                    report_error.get_schedule_tag_and_text(report_text)[-1]
+                )
+        return lines
+
+    @staticmethod
+    def generated_results_lines(generated_results):
+        """Return list of lines of text in generated_results report."""
+        lines = []
+        for report_text, report_error in generated_results:
+            if report_error is None:
+                lines.append(report_text)
+            else:
+                lines.append(
+                    report_error.get_report_tag_and_text(report_text)[-1]
+                )
+        return lines
+
+    def _report_fixtures(self, data):
+        """Append fixtures to event schedule report."""
+        fixdata = data.fixture_schedule
+        if len(fixdata.error):
+            return
+        genfix = self.generated_schedule
+        genfix.append(("", None))
+        divisions = sorted(list(fixdata.es_summary.keys()))
+        for division in divisions:
+            genfix.append((division, None))
+            teams = sorted(list(fixdata.es_summary[division]["teams"].keys()))
+            for team in teams:
+                team_data = fixdata.es_summary[division]["teams"][team]
+                genfix.append(
+                    (
+                        "".join(
+                            (
+                                team,
+                                "   ",
+                                str(team_data["homematches"]),
+                                " home, ",
+                                str(team_data["awaymatches"]),
+                                " away matches",
+                            )
+                        ),
+                        None,
+                    )
+                )
+            genfix.append(("", None))
+        fixtures = []
+        if len(fixdata.es_fixtures):
+            for fixture in fixdata.es_fixtures:
+                fixtures.append(
+                    (
+                        (
+                            fixture.competition,
+                            "  ",
+                            fixture.hometeam,
+                            " - ",
+                            fixture.awayteam,
+                        ),
+                        len(
+                            fixtures
+                        ),  # to hide unorderable fixture.tagger from sort
+                        fixture.tagger,
+                    )
+                )
+            fixtures.sort()
+            for fixture, _, tagger in fixtures:
+                tagger.append_generated_schedule(genfix, "".join(fixture))
+            genfix.append(("", None))
+
+    def _report_fixtures_played_status(self, data):
+        """Append list of unreported fixtures to results report."""
+        if len(data.collation.reports.error):
+            return
+        genres = self.generated_results
+        fnp = data.collation.get_fixtures_not_played()
+        if len(fnp) == 0:
+            return
+        today = datetime.date.today().isoformat()
+        genres.append(
+            (
+                "".join(
+                    ("Fixtures not played or not reported at ", today, "\n")
+                ),
+                None,
+            )
+        )
+        for match in fnp:
+            if match.date > today:
+                dfnp = "          "
+            else:
+                dfnp = match.date
+            match.tagger.append_generated_report(
+                genres,
+                " ".join(
+                    (
+                        dfnp,
+                        match.competition,
+                        match.hometeam,
+                        "-",
+                        match.awayteam,
+                    )
+                ),
+            )
+        genres.append(("", None))
+
+    def _report_matches(self, data):
+        """Append list of reported fixtures to results report."""
+        resdata = data.collation
+        if len(resdata.reports.error):
+            return
+        genres = self.generated_results
+        genres.append(("Matches in event by competition\n", None))
+        for match in resdata.get_reports_by_match():
+            hts = match.homescore
+            if not hts:
+                hts = ""
+            ats = match.awayscore
+            if not ats:
+                ats = ""
+            match.tagger.append_generated_report(
+                genres,
+                " ".join(
+                    (
+                        match.hometeam,
+                        hts,
+                        "-",
+                        ats,
+                        match.awayteam,
+                        "\t\t\t\t\t",
+                        match.competition,
+                    )
+                ),  # source
+            )
+            if match.default:
+                genres.append(("    Match defaulted", None))
+            for game in match.games:
+                result, uftag, gradetag = game.get_print_result()
+                if game in resdata.gamesxref:
+                    uftag = displayresult.get(
+                        resdata.gamesxref[game].result, uftag
+                    )
+                if len(uftag) or len(gradetag):
+                    uftag = "    ".join(("", uftag, gradetag))
+                if not result:
+                    result = "     "
+                homeplayer = game.homeplayer.name
+                if not homeplayer:
+                    homeplayer = ""
+                awayplayer = game.awayplayer.name
+                if not awayplayer:
+                    awayplayer = ""
+                game.tagger.append_generated_report(
+                    genres,
+                    " ".join(
+                        (
+                            "   ",
+                            homeplayer,
+                            result,
+                            awayplayer,
+                            "       ",
+                            uftag,
+                        )
+                    ),
+                )
+            genres.append(("", None))
+
+    def _report_matches_by_source(self, data):
+        """Override, append list of fixtures by source to results report.
+
+        Source may be a file name or some kind of heading within the file.  The
+        report for each fixture may include a comment that game scores for the
+        fixture are not consistent with total score.
+
+        """
+        # The PDLEdit and SLEdit references are long since deleted, but they
+        # are why code is as is here.
+        # PDLEdit should have had some tests on source attribute according to
+        # docstring for _report_matches_by_source.
+
+        # Only SLEdit had this check.
+        if len(data.collation.reports.error):
+            return
+
+        # Part of SLEdit hack to spot matches played before fixture date when
+        # no dates reported on match results.
+        today = datetime.date.today().isoformat()
+
+        genres = self.generated_results
+        genres.append(
+            ("\nMatch reports sorted by email date and team names\n", None)
+        )
+        matches, playedongames = data.collation.get_reports_by_source()
+        if matches:
+            currtag = matches[0][0].tagger.datatag
+        for match, ufg, consistent in matches:
+            del ufg
+            if currtag != match.tagger.datatag:
+                currtag = match.tagger.datatag
+                genres.append(("", None))
+            match.tagger.append_generated_report(
+                genres,
+                " ".join((match.hometeam, "-", match.awayteam)),
+            )
+
+            # Part of SLEdit hack to spot matches played before fixture date.
+            # Need to test 'date report sent' for correct answer always.
+            try:
+                if len(today) == len(match.date):
+                    if match.date > today:
+                        match.tagger.append_generated_report(
+                            genres,
+                            "".join(("   match reported early at ", today)),
+                        )
+            except (TypeError, AttributeError):
+                pass
+
+            if not consistent:
+                genres.append(
+                    ("   match score not consistent with game reports", None)
+                )
+            for game in match.games:
+                if game.result is None:
+                    homeplayer = game.homeplayer
+                    if homeplayer:
+                        homeplayer = homeplayer.name
+                    else:
+                        homeplayer = ""
+                    awayplayer = game.awayplayer
+                    if awayplayer:
+                        awayplayer = awayplayer.name
+                    else:
+                        awayplayer = ""
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            ("   unfinished  ", homeplayer, "-", awayplayer)
+                        ),
+                    )
+        if len(playedongames):
+            genres.append(("\nPlayed-on Games in entry order\n", None))
+            currtag = playedongames[0].tagger.datatag
+            for game in playedongames:
+                if game.result is None:
+                    continue
+                if currtag != game.tagger.datatag:
+                    currtag = game.tagger.datatag
+                    genres.append(("", None))
+                game.tagger.append_generated_report(
+                    genres,
+                    " ".join(("   ", game.hometeam, "-", game.awayteam)),
+                )
+                homeplayer = game.homeplayer
+                if homeplayer:
+                    homeplayer = homeplayer.name
+                else:
+                    homeplayer = ""
+                awayplayer = game.awayplayer
+                if awayplayer:
+                    awayplayer = awayplayer.name
+                else:
+                    awayplayer = ""
+                game.tagger.append_generated_report(
+                    genres,
+                    "".join(
+                        (
+                            "        ",
+                            " ".join(
+                                (
+                                    homeplayer,
+                                    displayresult.get(game.result, "unknown"),
+                                    awayplayer,
+                                )
+                            ),
+                        )
+                    ),
+                )
+        genres.append(("", None))
+
+    def _report_non_fixtures_played(self, data):
+        """Append list of results additional to fixtures to results report."""
+        if len(data.collation.reports.error):
+            return
+        genres = self.generated_results
+        nfp = data.collation.get_non_fixtures_played()
+        if len(nfp) == 0:
+            return
+        genres.append(("Reported matches not on fixture list\n", None))
+        for match in nfp:
+            match.tagger.append_generated_report(
+                genres,
+                " ".join(
+                    (
+                        match.competition,
+                        "",
+                        match.hometeam,
+                        "-",
+                        match.awayteam,
+                    )
+                ),
+            )
+        genres.append(("", None))
+
+    def _report_players(self, data):
+        """Append list of players sorted by affiliation to schedule report."""
+        if len(data.collation.reports.error):
+            return
+        schedule = data.collation.schedule
+        genfix = self.generated_schedule
+        if len(data.collation.players):
+            genfix.append(("", None))
+            genfix.append(
+                (
+                    " ".join(
+                        (
+                            "Player identities (with club or place",
+                            "association and reported codes)",
+                        )
+                    ),
+                    None,
+                )
+            )
+            genfix.append(("", None))
+        drp = data.collation.players
+        for name, player in [
+            p[-1]
+            for p in sorted(
+                [
+                    (
+                        AppSysPersonName(drp[p].name).name,
+                        (drp[p].get_brief_identity(), p),
+                    )
+                    for p in drp
+                ]
+            )
+        ]:
+            section = drp[player].section
+            if section in schedule.es_players:
+                if name in schedule.es_players[section]:
+                    genfix.append(
+                        (
+                            "\t".join(
+                                (
+                                    drp[player].get_short_identity(),
+                                    "".join(
+                                        (
+                                            "(",
+                                            schedule.es_players[section][
+                                                name
+                                            ].affiliation,
+                                            ")",
+                                        )
+                                    ),
+                                    drp[player].get_reported_codes(),
+                                )
+                            ).strip(),
+                            None,
+                        )
+                    )
+                    continue
+            genfix.append(
+                (
+                    "\t".join(
+                        (
+                            self.get_player_brief(drp[player]),
+                            drp[player].get_reported_codes(),
+                        )
+                    ).strip(),
+                    None,
+                )
+            )
+
+    @staticmethod
+    def get_player_brief(player):
+        """Return player identity for schedule report."""
+        return player.get_short_identity()
+
+    def _report_player_matches(self, data):
+        """Append list of fixtures for each player to results report."""
+        if len(data.collation.reports.error):
+            return
+        teamplayers = data.collation.get_reports_by_player()
+        genres = self.generated_results
+        genres.append(("Player reports\n", None))
+        for player in sorted(teamplayers.keys()):
+            genres.append((player[-1][0], None))
+            match_games = []
+            for team, match in teamplayers[player]:
+                match_games.append(
+                    (match.date if match.date is not None else "", team, match)
+                )
+            for team, match in [m[-2:] for m in sorted(match_games)]:
+                hometeam = match.hometeam
+                awayteam = match.awayteam
+                if hometeam == team:
+                    hometeam = "*"
+                if awayteam == team:
+                    awayteam = "*"
+                match.tagger.append_generated_report(
+                    genres,
+                    " ".join(
+                        (
+                            "  ",
+                            team,
+                            "  ",
+                            hometeam,
+                            "-",
+                            awayteam,
+                            "    ",
+                            match.source,
+                        )
+                    ),
+                )
+            genres.append(("", None))
+
+    def report_players_by_club(self, data):
+        """Append list of players sorted by club to results report."""
+        if len(data.collation.reports.error):
+            return
+        clubs = data.collation.get_players_by_club()
+        eventname = set()
+        for club_players in clubs.values():
+            for player_name in club_players:
+                eventname.add(player_name[1:-1])
+        genres = self.generated_results
+
+        genres.append(("Players by club\n", None))
+        genres.append(
+            (
+                "".join(
+                    (
+                        "This report was generated without a database open ",
+                        "to look up grading codes.",
+                    )
+                ),
+                None,
+            )
+        )
+        genres.append(
+            (
+                "".join(
+                    (
+                        "Any reported codes, usually grading codes, follow ",
+                        "the player name.\n",
+                    )
+                ),
+                None,
+            )
+        )
+        for club_name in sorted(clubs.keys()):
+            clubplayers = data.collation.clubplayers[club_name]
+            genres.append((club_name + "\n", None))
+            for player_name in clubs[club_name]:
+                genres.append(
+                    (
+                        "\t\t\t\t".join(
+                            (
+                                player_name[0],
+                                " ".join(clubplayers[player_name]),
+                            )
+                        ),
+                        None,
+                    )
+                )
+            genres.append(("", None))
+        return
+
+    def _report_unfinished_games(self, data):
+        """Append list of unfinished reported games to results report."""
+        if len(data.collation.reports.error):
+            return
+        genres = self.generated_results
+        unfinished_games = data.collation.get_unfinished_games()
+        if len(unfinished_games) == 0:
+            return
+        genres.append(("Unfinished games\n", None))
+        for match, game in unfinished_games:
+            match.tagger.append_generated_report(
+                genres,
+                " ".join(
+                    (match.hometeam, "-", match.awayteam, "   ", match.source)
+                ),
+            )
+            game.tagger.append_generated_report(
+                genres,
+                " ".join(
+                    (
+                        "  ",
+                        game.board,
+                        game.homeplayer.name,
+                        "-",
+                        game.awayplayer.name,
+                    )
+                ),
+            )
+        genres.append(("", None))
+
+    def _report_allplayall(self, section, data):
+        """Generate results report for all play all event."""
+        schedule = data.collation.schedule
+        genres = self.generated_results
+        if section not in data.collation.games:
+            genres.append(("", None))
+            genres.append((section, None))
+            genres.append(("No games reported for this competition", None))
+            genres.append(("", None))
+            return
+        if section in data.collation.reports.er_section:
+            games = data.collation.games[section].games
+            genres.append(("", None))
+            genres.append((section, None))
+
+            # Hack round for wallcharts and swiss tournaments presented in
+            # an all-play-all format, because the deduced round is wrong or
+            # irrelevant.
+            if len(schedule.es_round_dates[section]):
+                genres.append(("Games in round order", None))
+            else:
+                genres.append(
+                    ("All-play-all format games in entry order", None)
+                )
+                round_date = None
+
+            round_ = None
+            for game in games:
+                if round_ != game.round:
+                    round_ = game.round
+                    genres.append(("", None))
+                    if round_ in schedule.es_round_dates[section]:
+                        round_date = schedule.es_round_dates[section][round_]
+                    else:
+                        round_date = schedule.es_startdate
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            (
+                                section,
+                                "Round",
+                                str(round_),
+                                "played on",
+                                self._date_text(round_date),
+                            )
+                        ),
+                    )
+                    genres.append(("", None))
+                if round_date == game.date:
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            (
+                                game.homeplayer.name,
+                                game.get_print_result()[0],
+                                game.awayplayer.name,
+                            )
+                        ),
+                    )
+                else:
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            (
+                                self._date_text(game.date),
+                                game.homeplayer.name,
+                                game.get_print_result()[0],
+                                game.awayplayer.name,
+                            )
+                        ),
+                    )
+
+    def _report_individual(self, section, data):
+        """Generate results report for collection of games for individuals."""
+        genres = self.generated_results
+        if section not in data.collation.games:
+            genres.append(("", None))
+            genres.append((section, None))
+            genres.append(("No games reported for this competition", None))
+            genres.append(("", None))
+            return
+        schedule = data.collation.schedule
+        report = data.collation.games[section]
+        if section in data.collation.reports.er_section:
+            games = report.games
+            genres.append(("", None))
+            genres.append((section, None))
+            genres.append(("Games in entry order", None))
+            event_date = schedule.es_startdate
+            for game in games:
+                if event_date == game.date:
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            (
+                                game.homeplayer.name,
+                                game.get_print_result()[0],
+                                game.awayplayer.name,
+                            )
+                        ),
+                    )
+                else:
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            (
+                                self._date_text(game.date),
+                                game.homeplayer.name,
+                                game.get_print_result()[0],
+                                game.awayplayer.name,
+                            )
+                        ),
+                    )
+
+    def _report_league(self, section, data):
+        """Generate results report for matches in a league."""
+        del section
+        self._report_matches_by_source(data)
+        self._report_fixtures_played_status(data)
+        self._report_non_fixtures_played(data)
+        self._report_unfinished_games(data)
+        self._report_matches(data)
+        self.report_players_by_club(data)
+        self._report_player_matches(data)
+
+    @staticmethod
+    def _report_not_implemented(section, data):
+        data.collation.error.append(("", None))
+        data.collation.error.append(
+            (
+                " ".join(("Support for", section, "format not implemented")),
+                None,
+            )
+        )
+        data.collation.error.append(("", None))
+
+    def _report_swiss(self, section, data):
+        """Generate results report for swiss tournament for individuals."""
+        genfix = self.generated_schedule
+        genres = self.generated_results
+        schedule = data.collation.schedule
+        report = data.collation.reports
+        if section not in data.collation.games:
+            genres.append(("", None))
+            genres.append((section, None))
+            genres.append(("No games reported for this competition", None))
+            genres.append(("", None))
+            return
+        games = data.collation.games[section].games
+        if section in schedule.es_section:
+            genfix.append(("", None))
+            genfix.append((section, None))
+            rounds = sorted(list(schedule.es_round_dates[section].keys()))
+            round_count = 0
+            for pin in report.er_swiss_table[section]:
+                round_count = max(
+                    round_count, len(report.er_swiss_table[section][pin])
+                )
+            genfix.append(("Round dates", None))
+            if len(rounds):
+                for round_ in rounds:
+                    genfix.append(
+                        (
+                            "\t".join(
+                                (
+                                    str(round_),
+                                    self._date_text(
+                                        schedule.es_round_dates[section][
+                                            round_
+                                        ]
+                                    ),
+                                )
+                            ),
+                            None,
+                        )
+                    )
+                if len(rounds) != round_count:
+                    genfix.append(
+                        (
+                            " ".join(
+                                (
+                                    "The following rounds have no specified",
+                                    "date. These are deemed played on the",
+                                    "eventstart date.",
+                                )
+                            ),
+                            None,
+                        )
+                    )
+                    for round_ in range(1, round_count + 1):
+                        if round_ not in rounds:
+                            genfix.append(
+                                (" ".join(("Round", str(round_))), None)
+                            )
+            else:
+                genfix.append(
+                    (
+                        " ".join(
+                            (
+                                "All rounds are deemed played on the event",
+                                "start date because no round dates are",
+                                "specified.",
+                            )
+                        ),
+                        None,
+                    )
+                )
+        if section in report.er_section:
+            games = data.collation.games[section].games
+            genres.append(("", None))
+            genres.append((section, None))
+            genres.append(("Games in round order", None))
+            round_ = None
+            for game in games:
+                if round_ != game.round:
+                    round_ = game.round
+                    genres.append(("", None))
+                    intr = int(round_) if round_.isdigit() else round_
+                    if intr in schedule.es_round_dates[section]:
+                        round_date = schedule.es_round_dates[section][intr]
+                    else:
+                        round_date = schedule.es_startdate
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            (
+                                section,
+                                "Round",
+                                str(round_),
+                                "played on",
+                                self._date_text(round_date),
+                            )
+                        ),
+                    )
+                    genres.append(("", None))
+                if round_date == game.date:
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            (
+                                game.homeplayer.name,
+                                game.get_print_result()[0],
+                                game.awayplayer.name,
+                            )
+                        ),
+                    )
+                else:
+                    game.tagger.append_generated_report(
+                        genres,
+                        " ".join(
+                            (
+                                self._date_text(game.date),
+                                game.homeplayer.name,
+                                game.get_print_result()[0],
+                                game.awayplayer.name,
+                            )
+                        ),
+                    )
+
+    @staticmethod
+    def _section_type_unknown(section, data):
+        data.collation.error.append(("", None))
+        data.collation.error.append(
+            (" ".join((section, "type not known")), None)
+        )
+        data.collation.error.append(("", None))
@@ -0,0 +1,131 @@
+# extractmanifest.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Record which extracts have been checked against the emails they came from.
+
+The manifest is kept in the extracted folder and has an entry for each email
+whose extracted text was found consistent with the original text of its
+extract.  The entry holds the size and modification time of the email file
+and the extract file, and digests of the email's extracted text and of the
+extract's original text.
+
+The email need not be extracted again to check an extract while the email
+file, the extract's original text, and the extraction configuration, are
+unchanged.  The extract's original text is not needed while the extract file
+is unchanged too.
+
+"""
+
+import hashlib
+import json
+import os
+
+# Name of manifest file in extracted folder.
+EXTRACT_MANIFEST = ".manifest"
+
+# Keys in manifest file.
+_CONFIGURATION = "configuration"
+_EMAILS = "emails"
+_SIZE = "size"
+_MTIME = "mtime"
+_EMAIL = "email"
+_EXTRACT = "extract"
+_EXTRACT_SIZE = "extract_size"
+_EXTRACT_MTIME = "extract_mtime"
+
+
+def text_digest(text):
+    """Return hex digest of text."""
+    return hashlib.sha256(text.encode("utf8")).hexdigest()
+
+
+def _file_status(path):
+    """Return (size, mtime) of file at path or (None, None) if no file."""
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None, None
+    return status.st_size, status.st_mtime_ns
+
+
+class ExtractManifest:
+    """Digests of email and extract texts checked as consistent."""
+
+    def __init__(self, folder, configuration):
+        """Initialise manifest in extracted folder for configuration text.
+
+        Entries recorded for a different configuration are ignored.
+
+        """
+        self._path = os.path.join(folder, EXTRACT_MANIFEST)
+        self._configuration = text_digest(configuration)
+        self._emails = {}
+        try:
+            with open(self._path, mode="r", encoding="utf8") as manifest:
+                content = json.load(manifest)
+        except (OSError, ValueError):
+            return
+        if not isinstance(content, dict):
+            return
+        if content.get(_CONFIGURATION) != self._configuration:
+            return
+        emails = content.get(_EMAILS)
+        if isinstance(emails, dict):
+            self._emails = emails
+
+    def is_unchanged(self, email_path, extract):
+        """Return True if email_path and extract are as recorded.
+
+        extract is the _DifferenceText instance for the email.  The size
+        and modification time recorded for the extract file are updated if
+        the file has changed but the extract's original text has not.
+
+        """
+        entry = self._emails.get(os.path.basename(email_path))
+        if not isinstance(entry, dict):
+            return False
+        size, mtime = _file_status(email_path)
+        if size is None:
+            return False
+        if entry.get(_SIZE) != size or entry.get(_MTIME) != mtime:
+            return False
+        size, mtime = _file_status(extract.filepath)
+        if size is not None:
+            if entry.get(_EXTRACT_SIZE) == size:
+                if entry.get(_EXTRACT_MTIME) == mtime:
+                    return True
+        if entry.get(_EXTRACT) != text_digest(extract.original_text):
+            return False
+        entry[_EXTRACT_SIZE] = size
+        entry[_EXTRACT_MTIME] = mtime
+        return True
+
+    def record(self, email_path, email_text, extract):
+        """Record email_path as consistent with extract."""
+        size, mtime = _file_status(email_path)
+        extract_size, extract_mtime = _file_status(extract.filepath)
+        self._emails[os.path.basename(email_path)] = {
+            _SIZE: size,
+            _MTIME: mtime,
+            _EMAIL: text_digest(email_text),
+            _EXTRACT: text_digest(extract.original_text),
+            _EXTRACT_SIZE: extract_size,
+            _EXTRACT_MTIME: extract_mtime,
+        }
+
+    def save(self):
+        """Write manifest file, ignoring failure to do so."""
+        new_path = "".join((self._path, "new"))
+        try:
+            with open(new_path, mode="w", encoding="utf8") as manifest:
+                json.dump(
+                    {
+                        _CONFIGURATION: self._configuration,
+                        _EMAILS: self._emails,
+                    },
+                    manifest,
+                )
+            os.replace(new_path, self._path)
+        except OSError:
+            pass
@@ -64,6 +64,7 @@ class Found:
     EXTRA_ROUNDS_COMPETITION = 66
     NOT_TWO_TEAMS = 67
     TABLE_FORMAT = 71
+    RULE_TIMEOUT = 81
 
     real_result = frozenset((RESULT_NAMES, RESULT))
 
@@ -14,6 +14,12 @@ Accurracy is essential.  Compare and contrast with the matchteams module.
 
 """
 
+import bisect
+import heapq
+
+# Key in a _Trie node marking the end of a known name.
+_END = None
+
 
 class Names:
     """All pairs of phrases with first word in one phrase and last in other.
@@ -23,12 +29,19 @@ class Names:
     original string.  Samples are (a, f) (a b, e f) (a, d e f).  But never
     reversing word order or using a word more than once in a pair.
 
+    A pair with i words in the first phrase and k words in the second is
+    scored i * k, with ties decided by i.  The pairs are generated in score
+    order when needed rather than by comparing every first phrase with every
+    second phrase.
+
     """
 
     def __init__(self, string="", split=True):
         """Initialize namepairs attribute from string argument."""
         super().__init__()
         self._namephrases = None
+        self._namepairs = None
+        self._words = None
         if not isinstance(string, str):
             if not isinstance(string, (list, tuple)):
                 sentence = ("",)
@@ -44,29 +57,105 @@ class Names:
             else:
                 self.namepairs = [(self.string, "")]
             return
-        position = set()
-        for i in range(1, len(sentence)):
-            position.add((" ".join(sentence[:i]), 0, i))
-            for j in range(i, len(sentence)):
-                position.add((" ".join(sentence[j:]), j, len(sentence) - j))
         if len(sentence) == 1:
             self.namepairs = [(self.string, "")]
+        elif not sentence:
+            self.namepairs = []
         else:
-            namepairs = []
-            for str1, pos1, len1 in position:
-                if pos1 == 0:
-                    for str2, pos2, len2 in position:
-                        if pos2 >= len1:
-                            namepairs.append((len1 * len2, len1, (str1, str2)))
-            self.namepairs = [n[-1] for n in sorted(namepairs)]
+            self._words = sentence
+            self._prefixes = [None]
+            self._suffixes = [None]
+            for i in range(1, len(sentence)):
+                self._prefixes.append(" ".join(sentence[:i]))
+                self._suffixes.append(" ".join(sentence[-i:]))
+
+    @property
+    def namepairs(self):
+        """Return list of (name1, name2) tuples, most likely pair last."""
+        if self._namepairs is None:
+            namepairs = list(self.iter_namepairs())
+            namepairs.reverse()
+            return namepairs
+        return self._namepairs
+
+    @namepairs.setter
+    def namepairs(self, value):
+        """Set namepairs to value, a sequence of (name1, name2) tuples."""
+        self._namepairs = value
+        self._namephrases = None
+
+    @property
+    def prefixes(self):
+        """Return tuple of name phrases which are first in some name pair."""
+        if self._namepairs is None:
+            return tuple(self._prefixes[1:])
+        return tuple(pair[0] for pair in self._namepairs)
+
+    @property
+    def suffixes(self):
+        """Return tuple of name phrases which are second in some name pair."""
+        if self._namepairs is None:
+            return tuple(self._suffixes[1:])
+        return tuple(pair[-1] for pair in self._namepairs)
+
+    def iter_namepairs(self):
+        """Yield (name1, name2) tuples, most likely pair first.
+
+        Each first phrase of i words starts a sequence of pairs whose second
+        phrases have fewer words, and lower scores, as the sequence goes on.
+        The sequences are merged by score.
+
+        """
+        if self._namepairs is not None:
+            yield from reversed(self._namepairs)
+            return
+        length = len(self._words)
+        heap = [(-i * (length - i), -i) for i in range(1, length)]
+        heapq.heapify(heap)
+        while heap:
+            score, i = heapq.heappop(heap)
+            i = -i
+            k = -score // i
+            yield (self._prefixes[i], self._suffixes[k])
+            if k > 1:
+                heapq.heappush(heap, (-i * (k - 1), -i))
+
+    def best_namepair(self, names):
+        """Return most likely (name1, name2) with both in names, or None.
+
+        For a first phrase of i words the best second phrase in names is the
+        longest which does not overlap the first phrase.
+
+        """
+        if self._namepairs is not None:
+            for pair in reversed(self._namepairs):
+                if pair[0] in names and pair[-1] in names:
+                    return pair
+            return None
+        length = len(self._words)
+        suffix_lengths = [
+            k for k in range(1, length) if self._suffixes[k] in names
+        ]
+        best = None
+        for i in range(1, length):
+            if self._prefixes[i] not in names:
+                continue
+            index = bisect.bisect_right(suffix_lengths, length - i)
+            if not index:
+                continue
+            k = suffix_lengths[index - 1]
+            if best is None or (i * k, i) > (best[0] * best[1], best[0]):
+                best = (i, k)
+        if best is None:
+            return None
+        return (self._prefixes[best[0]], self._suffixes[best[1]])
 
     @property
     def namephrases(self):
         """Return set of name phrases."""
         if self._namephrases is None:
-            namephrases = set()
-            for name in self.namepairs:
-                namephrases.update(name)
+            namephrases = set(self.prefixes)
+            namephrases.update(self.suffixes)
             namephrases.discard("")
             self._namephrases = namephrases
         return self._namephrases
@@ -84,17 +173,15 @@ class Names:
         delimited, are divided equally between the two names: the first name
         gets the extra odd word if necessary.
 
+        known_names may be a KnownNames instance, which should be used when
+        guessing names for many strings from the same known names.
+
         """
-        starts_with = ""
-        ends_with = ""
+        if not isinstance(known_names, KnownNames):
+            known_names = KnownNames(known_names)
         string = self.string
-        for k in known_names:
-            if string.startswith(k):
-                if len(k) > len(starts_with):
-                    starts_with = k
-            if string.endswith(k):
-                if len(k) > len(ends_with):
-                    ends_with = k
+        starts_with = known_names.longest_prefix(string)
+        ends_with = known_names.longest_suffix(string)
         if starts_with:
             ends_with = string.replace(starts_with, "").strip()
         elif ends_with:
@@ -108,3 +195,53 @@ class Names:
             ends_with = " ".join(words[(1 + len(words)) // 2 :])
 
         self.namepairs = ((starts_with, ends_with),)
+
+
+class KnownNames:
+    """Index of known names for finding the longest which start or end text.
+
+    A character trie of the names, and one of the reversed names, gives the
+    longest name for which text.startswith(name), or text.endswith(name), is
+    True by walking the characters of text once.
+
+    """
+
+    def __init__(self, known_names):
+        """Build prefix and suffix tries for known_names."""
+        self._prefix_trie = {}
+        self._suffix_trie = {}
+        for name in known_names:
+            if not name:
+                continue
+            _add_to_trie(self._prefix_trie, name)
+            _add_to_trie(self._suffix_trie, reversed(name))
+
+    def longest_prefix(self, text):
+        """Return longest known name which starts text, or ''."""
+        return text[: _longest_match(self._prefix_trie, text)]
+
+    def longest_suffix(self, text):
+        """Return longest known name which ends text, or ''."""
+        length = _longest_match(self._suffix_trie, reversed(text))
+        return text[len(text) - length :]
+
+
+def _add_to_trie(trie, characters):
+    """Add sequence of characters to trie."""
+    node = trie
+    for character in characters:
+        node = node.setdefault(character, {})
+    node[_END] = True
+
+
+def _longest_match(trie, characters):
+    """Return length of longest sequence in trie which starts characters."""
+    node = trie
+    longest = 0
+    for length, character in enumerate(characters, start=1):
+        node = node.get(character)
+        if node is None:
+            break
+        if _END in node:
+            longest = length
+    return longest
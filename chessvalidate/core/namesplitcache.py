@@ -0,0 +1,141 @@
+# namesplitcache.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Keep the splits of joined names guessed in earlier runs.
+
+Joined team or player names which are not split by the most likely name pair
+are split by guessing from the names known in the competition.  The guess for
+a joined names string depends only on the string, the names which start and
+end joined names in the competition, and the names found in confident splits.
+
+The cache folder in the event folder has a file for each digest of those sets
+of names, holding the splits guessed for each joined names string.  A digest
+file is read only when a competition has the digest.  The splits are used
+while the digest is unchanged, and are dropped when no competition in the
+latest run has the digest.
+
+"""
+
+import hashlib
+import json
+import os
+
+# Name of cache folder in event folder.
+NAME_SPLIT_CACHE = ".namesplits"
+
+
+def names_digest(attrnames, known_names, consistent_names):
+    """Return hex digest of names used to guess splits of joined names."""
+    return hashlib.sha256(
+        json.dumps(
+            [list(attrnames), sorted(known_names), sorted(consistent_names)]
+        ).encode("utf8")
+    ).hexdigest()
+
+
+class NameSplitCache:
+    """Splits of joined names by digest of the names used to guess them."""
+
+    def __init__(self, folder):
+        """Initialise cache of name splits in event folder."""
+        self._folder = folder
+        self._path = os.path.join(folder, NAME_SPLIT_CACHE)
+        self._splits = {}
+        self._added = {}
+        self._used = set()
+
+    def _load(self, digest):
+        """Return splits in digest file, ignoring an absent or invalid file."""
+        try:
+            with open(
+                os.path.join(self._path, digest), mode="r", encoding="utf8"
+            ) as cache:
+                content = json.load(cache)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(content, dict):
+            return {}
+        return content
+
+    def splits(self, digest):
+        """Return dict of [name1, name2] or None by joined names for digest.
+
+        None means the joined names string gives no names.  The caller gives
+        new splits to add rather than changing the dict.
+
+        """
+        self._used.add(digest)
+        splits = self._splits.get(digest)
+        if splits is None:
+            splits = self._splits[digest] = self._load(digest)
+        return splits
+
+    def add(self, digest, joined_names, split):
+        """Add split of joined_names guessed from names with digest."""
+        self.splits(digest)[joined_names] = split
+        self._added.setdefault(digest, {})[joined_names] = split
+
+    def worker_copy(self):
+        """Return an empty cache on the same folder for another process.
+
+        The copy reads only the digest files it is asked for, and the splits
+        it adds are given back to this cache by merge(copy.changes()).
+
+        """
+        return NameSplitCache(self._folder)
+
+    def changes(self):
+        """Return dict of splits added by digest for each digest used."""
+        return {
+            digest: self._added.get(digest, {}) for digest in self._used
+        }
+
+    def merge(self, changes):
+        """Add the splits in changes, from changes() of a worker copy.
+
+        Splits are merged by joined names string so splits added for the
+        same digest by several copies are all kept.
+
+        """
+        for digest, added in changes.items():
+            self._used.add(digest)
+            if not added:
+                continue
+            self._added.setdefault(digest, {}).update(added)
+            if digest in self._splits:
+                self._splits[digest].update(added)
+
+    def save(self):
+        """Write splits added since last save, and remove digests not used.
+
+        Failure to do so is ignored: the splits are guessed again.
+
+        """
+        if not self._used:
+            return
+        try:
+            if self._added:
+                os.makedirs(self._path, exist_ok=True)
+            for digest in os.listdir(self._path):
+                if digest not in self._used:
+                    os.remove(os.path.join(self._path, digest))
+            for digest, added in self._added.items():
+                splits = self._splits.get(digest)
+                if splits is None:
+                    splits = self._load(digest)
+                    splits.update(added)
+                path = os.path.join(self._path, digest)
+                new_path = "".join((path, "new"))
+                with open(new_path, mode="w", encoding="utf8") as cache:
+                    json.dump(splits, cache)
+                os.replace(new_path, path)
+        except OSError:
+            pass
+        self._splits = {
+            digest: splits
+            for digest, splits in self._splits.items()
+            if digest in self._used
+        }
+        self._added = {}
+        self._used = set()
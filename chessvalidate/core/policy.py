@@ -0,0 +1,86 @@
+# policy.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Report problems and decide questions met while validating an event.
+
+DialogPolicy shows tkinter dialogues and is the policy used by default.
+
+BatchPolicy writes the reports to a stream and answers questions without
+asking, so validation can be run without a display.
+
+"""
+
+import sys
+import tkinter.messagebox
+
+
+class DialogPolicy:
+    """Report and ask questions in tkinter dialogues."""
+
+    def __init__(self, parent=None):
+        """Initialise dialogue policy for parent widget."""
+        self.parent = parent
+
+    def inform(self, title=None, message=None):
+        """Show message in an information dialogue."""
+        tkinter.messagebox.showinfo(
+            parent=self.parent, title=title, message=message
+        )
+
+    def confirm(self, title=None, message=None):
+        """Return True if question in message is answered yes."""
+        return (
+            tkinter.messagebox.askquestion(
+                parent=self.parent, title=title, message=message
+            )
+            == tkinter.messagebox.YES
+        )
+
+    def confirm_extract(self, title=None, message=None):
+        """Return True if question about extracting emails is answered yes."""
+        return self.confirm(title=title, message=message)
+
+
+class BatchPolicy:
+    """Report to a stream and answer questions without asking.
+
+    stream - file object for reports, default sys.stderr.
+    answer - the answer given to all questions except whether to extract
+             new emails.
+    extract - the answer given to whether to extract new emails into the
+              event folder.
+
+    """
+
+    def __init__(self, stream=None, answer=True, extract=False):
+        """Initialise batch policy."""
+        self.stream = sys.stderr if stream is None else stream
+        self.answer = answer
+        self.extract = extract
+        self.reports = []
+
+    def inform(self, title=None, message=None):
+        """Write message to stream."""
+        self.reports.append((title, message))
+        self.stream.write("".join((str(title), ": ", str(message), "\n")))
+
+    def confirm(self, title=None, message=None):
+        """Write message to stream and return the answer given."""
+        self.inform(
+            title=title,
+            message="".join(
+                (str(message), "\n", "Answered ", str(self.answer), ".")
+            ),
+        )
+        return self.answer
+
+    def confirm_extract(self, title=None, message=None):
+        """Write message to stream and return the answer given to extract."""
+        self.inform(
+            title=title,
+            message="".join(
+                (str(message), "\n", "Answered ", str(self.extract), ".")
+            ),
+        )
+        return self.extract
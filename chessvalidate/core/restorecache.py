@@ -0,0 +1,117 @@
+# restorecache.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Cache the texts restored from difference files between sessions.
+
+The original and edited texts restored from a difference file are kept in a
+sidecar file in the restore cache folder of the event.  The sidecar is used
+while the size, modification time, and content hash, of the difference file
+are unchanged: otherwise the texts are restored from the difference file and
+the sidecar is replaced.
+
+"""
+
+import hashlib
+import json
+import os
+
+# Name of folder, within the event folder, holding the sidecar files.
+RESTORE_CACHE = "restorecache"
+
+# Sidecar file suffix and keys.
+_SIDECAR_SUFFIX = ".json"
+_KEY = "key"
+_ORIGINAL = "original"
+_EDITED = "edited"
+
+
+def cache_key(filepath, diff_lines):
+    """Return size, mtime, and content hash, key for difference file."""
+    status = os.stat(filepath)
+    return [
+        status.st_size,
+        status.st_mtime_ns,
+        hashlib.sha256("".join(diff_lines).encode("utf8")).hexdigest(),
+    ]
+
+
+class RestoreCache:
+    """Sidecar files of restored texts for the difference files of an event."""
+
+    def __init__(self, folder):
+        """Initialise restore cache for event in folder."""
+        self._folder = folder
+        self._cache_folder = os.path.join(folder, RESTORE_CACHE)
+        self._stale = {}
+
+    def _sidecar_path(self, filepath):
+        """Return path of sidecar file for difference file at filepath."""
+        return os.path.join(
+            self._cache_folder,
+            "".join(
+                (
+                    os.path.relpath(filepath, self._folder).replace(
+                        os.sep, "_"
+                    ),
+                    _SIDECAR_SUFFIX,
+                )
+            ),
+        )
+
+    def lookup(self, filepath, key):
+        """Return (original, edited) texts cached for filepath or None.
+
+        None is returned if the sidecar is missing or was not created from
+        a difference file with the same key.
+
+        """
+        try:
+            with open(
+                self._sidecar_path(filepath), mode="r", encoding="utf8"
+            ) as sidecar:
+                entry = json.load(sidecar)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get(_KEY) != key:
+            return None
+        try:
+            return entry[_ORIGINAL], entry[_EDITED]
+        except KeyError:
+            return None
+
+    def mark_stale(self, filepath, key):
+        """Note sidecar for filepath must be replaced with one for key."""
+        self._stale[filepath] = key
+
+    def is_stale(self, filepath):
+        """Return True if sidecar for filepath is marked stale."""
+        return filepath in self._stale
+
+    def put(self, filepath, original_text, edited_text):
+        """Write sidecar for filepath if marked stale.
+
+        Failure to write the sidecar is ignored: the texts will be restored
+        from the difference file next time.
+
+        """
+        key = self._stale.pop(filepath, None)
+        if key is None:
+            return
+        sidecar_path = self._sidecar_path(filepath)
+        new_path = "".join((sidecar_path, "new"))
+        try:
+            if not os.path.isdir(self._cache_folder):
+                os.mkdir(self._cache_folder)
+            with open(new_path, mode="w", encoding="utf8") as sidecar:
+                json.dump(
+                    {
+                        _KEY: key,
+                        _ORIGINAL: original_text,
+                        _EDITED: edited_text,
+                    },
+                    sidecar,
+                )
+            os.replace(new_path, sidecar_path)
+        except OSError:
+            pass
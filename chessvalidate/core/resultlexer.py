@@ -0,0 +1,201 @@
+# resultlexer.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Scan a line of event data once for the kinds of item it may contain.
+
+The _select_result_line function in the eventparser module tries a series
+of regular expressions on each line: swiss and all-play-all table entries,
+the played on prefix, dates, the result only suffix, void and default
+words, points and scores, draws, and rounds.  A LineTokens instance notes,
+from one scan of the characters and words of a line, which of those
+expressions could match so the others need not be tried.
+
+Each test is a necessary condition for a match of the expression, looking
+at the shape of the words which would form the item: a date needs a year
+of two or four digits and either a month name or three numbers separated
+only by punctuation and spaces, for example.  So an expression which is
+not tried would not have matched, and the line is classified into the
+same Found categories either way.
+
+The tests allow for whole words being removed from the line, as the date
+and the result only suffix are, but not for removal of parts of words.  A
+competition name can be removed from the middle of a word so the line is
+scanned again when that happens.
+
+All the expressions are case insensitive.  Some non-ASCII letters match
+ASCII letters when case is ignored, 'K' (Kelvin sign) matches 'k' for
+example, so all expressions are tried for lines containing a non-ASCII
+letter.
+
+"""
+
+_SIGNS = "-=+"
+
+# Month names in RE_DATE.
+_MONTH_NAMES = frozenset(
+    m.encode()
+    for m in (
+        "jan",
+        "january",
+        "feb",
+        "february",
+        "mar",
+        "march",
+        "apr",
+        "april",
+        "may",
+        "jun",
+        "june",
+        "jul",
+        "july",
+        "aug",
+        "august",
+        "sep",
+        "september",
+        "oct",
+        "october",
+        "nov",
+        "november",
+        "dec",
+        "december",
+    )
+)
+
+# Points and scores, like ' 1 ', ' 1.5 ', ' \xbd ', and ' 1-0 ', start with
+# one of these.
+_NUMBER_STARTS = frozenset("0123456789\xbd")
+_NONZERO_DIGITS = frozenset("123456789")
+
+# Words which are draws.
+_DRAWS = frozenset(("draw", "0.5", "\xbd"))
+
+# Table for bytes.translate giving '9' for digits, 'a' for other word
+# characters, and ' ' for the rest.  Non-ASCII characters are encoded as '?'
+# and are given ' ', which may join numbers but never separates them.
+_CHARACTER_CLASSES = bytes(
+    (
+        ord("9")
+        if chr(c).isdigit()
+        else ord("a") if chr(c).isalnum() or chr(c) == "_" else ord(" ")
+    )
+    for c in range(128)
+) + bytes(128 * b" ")
+
+# Table for bytes.translate giving ' ' for characters which are not word
+# characters, so the words of a date are found by split.
+_WORD_CHARACTERS = bytes(
+    c if chr(c).isalnum() or chr(c) == "_" else ord(" ") for c in range(128)
+) + bytes(128 * b" ")
+
+# Characters deleted by bytes.translate to leave the punctuation, other than
+# '.', which may separate the points in a score, like ' 1-0 '.
+_NOT_SCORE_SEPARATORS = bytes(
+    c
+    for c in range(128)
+    if chr(c).isalnum() or chr(c).isspace() or chr(c) in "._"
+)
+
+# Years in the translated text.
+_YEARS = (b"99", b"9999")
+
+
+class LineTokens:
+    """Kinds of item which may be present in a line of event data.
+
+    Each attribute is False if the corresponding regular expression in the
+    eventparser module cannot match the line, or any text derived from the
+    line by removing whole words.
+
+    """
+
+    def __init__(self, text):
+        """Scan text for items which may be present."""
+        if not text.isascii():
+            if any(c.isalpha() for c in text if not c.isascii()):
+                self._set_all()
+                return
+        lower_text = text.lower()
+        words = lower_text.split()
+        encoded_text = lower_text.encode("ascii", "replace")
+        classes = encoded_text.translate(_CHARACTER_CLASSES)
+        has_digit = b"9" in classes
+        has_sign = "-" in text or "=" in text or "+" in text
+
+        # RE_SWISS items are '*' or have a sign at one end.
+        self.swiss = (has_sign or "*" in text) and any(
+            w == "*" or (len(w) > 1 and (w[0] in _SIGNS or w[-1] in _SIGNS))
+            for w in words
+        )
+
+        # RE_ALL_PLAY_ALL items are '~', or a colour followed by a sign.
+        self.all_play_all = (has_sign or "~" in text) and any(
+            w == "~" or (len(w) == 2 and w[0] in "wb" and w[1] in _SIGNS)
+            for w in words
+        )
+
+        # RE_PLAYED_ON matches the first word.
+        self.played_on = bool(words) and words[0] == "played_on"
+
+        # RE_DATE, and RE_FIXTURE_DATE, need a year of two or four digits,
+        # and a month name or three numbers with no word characters between.
+        # RE_DAY is tried only in combination with a date.
+        self.date = False
+        if has_digit:
+            numbers = classes.replace(b"a", b" ").split()
+            if _YEARS[0] in numbers or _YEARS[1] in numbers:
+                for segment in classes.split(b"a"):
+                    numbers_in_segment = segment.split()
+                    if len(numbers_in_segment) > 2 and (
+                        _YEARS[0] in numbers_in_segment
+                        or _YEARS[1] in numbers_in_segment
+                    ):
+                        self.date = True
+                        break
+                else:
+                    self.date = len(
+                        numbers
+                    ) > 1 and not _MONTH_NAMES.isdisjoint(
+                        encoded_text.translate(_WORD_CHARACTERS).split()
+                    )
+
+        # RE_RESULT_ONLY matches ' result only' at end of text.
+        self.result_only = "result" in lower_text and "only" in lower_text
+
+        # RE_VOID items contain 'void', 'unfinished', or 'def'.
+        self.void = (
+            "def" in lower_text
+            or "void" in lower_text
+            or "unfinished" in lower_text
+        )
+
+        # RE_POINTS, RE_SCORE, and RE_NUMBERS, items start with a number.
+        self.points = (has_digit or "\xbd" in text) and any(
+            w[0] in _NUMBER_STARTS for w in words
+        )
+
+        # RE_SCORE items have punctuation, other than '.', between numbers.
+        self.score = self.points and bool(
+            encoded_text.translate(None, _NOT_SCORE_SEPARATORS)
+        )
+
+        # RE_DRAW items are 'draw', '0.5', or '\xbd'.
+        self.draw = not _DRAWS.isdisjoint(words)
+
+        # RE_ROUND items are digits starting with a non-zero digit.
+        self.round = self.points and any(
+            w[0] in _NONZERO_DIGITS and w.isdigit() for w in words
+        )
+
+    def _set_all(self):
+        """Note all items may be present."""
+        self.swiss = True
+        self.all_play_all = True
+        self.played_on = True
+        self.date = True
+        self.result_only = True
+        self.void = True
+        self.points = True
+        self.score = True
+        self.draw = True
+        self.round = True
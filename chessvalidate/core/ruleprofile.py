@@ -0,0 +1,141 @@
+# ruleprofile.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Profile the regular expressions from the event configuration file.
+
+A RuleProfile instance given to EventParser.build_event records, for each
+configuration key and rule index, the number of calls, the total time, the
+number of matches, and the slowest input, of the regular expression.  The
+time spent classifying the text translated from each rule's matches is
+recorded too.
+
+The table is written as tab separated lines, slowest rule first, so it can
+be sorted further by a spreadsheet or the sort command.
+
+"""
+
+import time
+
+# Column headings in profile table.
+_HEADINGS = (
+    "key",
+    "index",
+    "operation",
+    "calls",
+    "total seconds",
+    "matches",
+    "lines",
+    "lines per second",
+    "slowest seconds",
+    "slowest input",
+)
+
+# Longest input text shown in profile table.
+_INPUT_LENGTH = 200
+
+
+class RuleProfile:
+    """Call counts and times of regular expressions in event rules."""
+
+    def __init__(self):
+        """Initialise empty profile."""
+        self._entries = {}
+
+    def call(self, key, index, operation, function, args, subject):
+        """Return function(*args) noting time taken and matches.
+
+        key and index identify the rule, and operation is the method of the
+        regular expression or 'select' for classification of a translated
+        line.  subject is the text given to function in args: it is counted
+        in lines and kept if the call is the slowest.
+
+        """
+        start = time.perf_counter()
+        result = function(*args)
+        if operation == "finditer":
+            result = list(result)
+        elapsed = time.perf_counter() - start
+        entry = self._entries.setdefault(
+            (key, str(index), operation), [0, 0.0, 0, -1.0, "", 0]
+        )
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] += _match_count(operation, function, result)
+        if elapsed > entry[3]:
+            entry[3] = elapsed
+            entry[4] = subject
+        entry[5] += subject.count("\n") + 1
+        return result
+
+    def rule_totals(self, key, index):
+        """Return (calls, seconds, matches, lines) for rule or None.
+
+        The totals are for the regular expression for key in the rule at
+        index, excluding classification of translated lines.  None means the
+        expression was not used.
+
+        """
+        totals = None
+        index = str(index)
+        for (rule_key, rule_index, operation), entry in self._entries.items():
+            if rule_key != key or rule_index != index or operation == "select":
+                continue
+            if totals is None:
+                totals = [0, 0.0, 0, 0]
+            totals[0] += entry[0]
+            totals[1] += entry[1]
+            totals[2] += entry[2]
+            totals[3] += entry[5]
+        return None if totals is None else tuple(totals)
+
+    def lines(self):
+        """Return profile table lines, slowest rule first."""
+        lines = ["\t".join(_HEADINGS)]
+        for (key, index, operation), entry in sorted(
+            self._entries.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            slowest_input = repr(entry[4])
+            if len(slowest_input) > _INPUT_LENGTH:
+                slowest_input = "".join(
+                    (slowest_input[:_INPUT_LENGTH], "...")
+                )
+            lines.append(
+                "\t".join(
+                    (
+                        key,
+                        index,
+                        operation,
+                        str(entry[0]),
+                        format(entry[1], ".6f"),
+                        str(entry[2]),
+                        str(entry[5]),
+                        lines_per_second(entry[5], entry[1]),
+                        format(entry[3], ".6f"),
+                        slowest_input,
+                    )
+                )
+            )
+        return lines
+
+    def write(self, path):
+        """Write profile table to file at path."""
+        with open(path, "w", encoding="utf8") as profile_file:
+            profile_file.write("\n".join(self.lines()))
+            profile_file.write("\n")
+
+
+def lines_per_second(lines, seconds):
+    """Return lines processed per second as text."""
+    if seconds <= 0:
+        return "-"
+    return format(lines / seconds, ".0f")
+
+
+def _match_count(operation, function, result):
+    """Return number of matches in result of function for operation."""
+    if operation == "split":
+        return (len(result) - 1) // (function.__self__.groups + 1)
+    if operation == "select":
+        return int(result is not None and result.found < 0)
+    return len(result)
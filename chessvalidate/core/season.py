@@ -14,10 +14,12 @@ report results and have a subclass of ReportedSeason extract the data.
 
 """
 
-import difflib
+import collections
+import concurrent.futures
+import hashlib
 import os
 import re
-import tkinter.messagebox
+import shutil
 
 from emailextract.core.emailextractor import (
     COLLECTED,
@@ -39,7 +41,13 @@ from .emailextractor import (
     AUTHORIZATION_DELAY,
     DEFAULT_IF_DELAY_NOT_VALID,
 )
-from .eventparser import EventParser
+from .eventparser import EventParser, ParseCache, compile_rules
+from .ruleprofile import RuleProfile
+from .namesplitcache import NameSplitCache
+from .restorecache import RestoreCache, cache_key
+from .differenceformat import restore_text, restore_texts, difference_lines
+from .extractmanifest import ExtractManifest, EXTRACT_MANIFEST
+from .policy import DialogPolicy
 from . import constants
 from . import eventdetails
 
@@ -115,13 +123,39 @@ class Season:
 
     """
 
-    def __init__(self, folder):
+    def __init__(
+        self,
+        folder,
+        max_workers=1,
+        loaded_limit=None,
+        profile_rules=False,
+        time_budget=None,
+    ):
         """Create Season instance for event results in folder.
 
         folder - contains files of event data
+        max_workers - maximum number of processes used to load and parse
+                      difference files, and split joined names, default 1
+                      is this process, None is number of processors on
+                      machine.
+        loaded_limit - if not None the extract difference files are loaded
+                       when their text is first needed, and the least
+                       recently viewed are evicted from memory, if saved,
+                       when more than loaded_limit are in memory.
+        profile_rules - if True the time taken by each rule in the event
+                        configuration is written to the RuleProfile file in
+                        folder each time the event is extracted.
+        time_budget - if not None the number of seconds a rule in the event
+                      configuration may take on a piece of text before the
+                      rule is reported and not applied to the rest of the
+                      event.
 
         """
         self.folder = folder
+        self.max_workers = max_workers
+        self.loaded_limit = loaded_limit
+        self.profile_rules = profile_rules
+        self.time_budget = time_budget
         self.fixtures = None
         self.fixturesfile = None
         self.results = None
@@ -139,7 +173,11 @@ class Season:
         self._event_competitions = None
         self._event_team_name_lookup = None
         self._event_competitions = None
+        self._compiled_rules = None
+        self._parse_cache = ParseCache()
+        self._name_split_cache = NameSplitCache(folder)
         self._event_data = None
+        self._closed_texts = {}
 
     def get_results_from_file(self):
         """Override, create Collation object from text files.
@@ -156,20 +194,28 @@ class Season:
             results.build_results(self._event_data.get_results_text())
             self._collation = Collation(results, self.fixture_schedule)
 
-    def open_documents(self, parent):
-        """Override, extract data from text files and return True if ok."""
+    def open_documents(self, parent, policy=None):
+        """Override, extract data from text files and return True if ok.
+
+        parent - the parent widget for dialogues.
+        policy - reports problems and answers questions, default is a
+                 DialogPolicy instance for parent.
+
+        """
+        if policy is None:
+            policy = DialogPolicy(parent)
         if self._entry_text is not None:
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 message="An event folder is already open",
                 title="Open event results data",
             )
             return False
         config = os.path.join(self.folder, EXTRACTED + ".conf")
         if not os.path.exists(config):
-            if create_extract_and_event_configuration_files(config):
-                tkinter.messagebox.showinfo(
-                    parent=parent,
+            if create_extract_and_event_configuration_files(
+                config, policy=policy
+            ):
+                policy.inform(
                     message=" ".join(
                         (
                             "Configuration files\n\n",
@@ -185,14 +231,14 @@ class Season:
                 )
 
         with open(config, "r", encoding="utf8") as configfile:
-            emc = EmailExtractor(
-                self.folder,
-                configuration=configfile.read(),
-                parent=parent,
-            )
+            configuration = configfile.read()
+        emc = EmailExtractor(
+            self.folder,
+            configuration=configuration,
+            parent=parent,
+        )
         if not emc.parse():
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="Email selection rules are invalid.",
             )
@@ -201,8 +247,7 @@ class Season:
         # Create document folders and files if all specified and none exist.
         folders = {COLLECTED, EXTRACTED, TEXTENTRY}
         if not folders.issubset(emc.criteria):
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="".join(
                     (
@@ -227,22 +272,19 @@ class Season:
             ]
         )
         if fcount != 0 and fcount != len(folders):
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="Only one of Mailbox and extracts folders exist.",
             )
             return False
         if not os.path.isfile(os.path.join(self.folder, TEXTENTRY)):
             if os.path.exists(os.path.join(self.folder, TEXTENTRY)):
-                tkinter.messagebox.showinfo(
-                    parent=parent,
+                policy.inform(
                     title="Open event results data",
                     message="Textentry is not a file.",
                 )
                 return False
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="".join(
                     (
@@ -251,13 +293,13 @@ class Season:
                     )
                 ),
             )
-            empty_text = ["\n"]
+            empty_text = "\n"
             with open(
                 os.path.join(self.folder, emc.criteria[TEXTENTRY]),
                 mode="x",
                 encoding="utf8",
             ) as ofile:
-                ofile.writelines(difflib.ndiff(empty_text, empty_text))
+                ofile.writelines(difference_lines(empty_text, empty_text))
         fcount = len(
             [
                 f
@@ -266,8 +308,7 @@ class Season:
             ]
         )
         if fcount != 0 and fcount != len(folders):
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="Either or both mailbox and extracts is not a folder.",
             )
@@ -275,8 +316,7 @@ class Season:
         if fcount == 0:
             for fname in folders:
                 os.mkdir(os.path.join(self.folder, emc.criteria[fname]))
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="Mailbox and extracts folders created.",
             )
@@ -284,13 +324,20 @@ class Season:
         # Extract the event text
         # This will probably and eventually be put in season.Season which still
         # works the old way to support the takenonseason module.
+        restore_cache = RestoreCache(self.folder)
+        closed_texts = self._closed_texts
+        self._closed_texts = {}
         fpath = os.path.join(self.folder, emc.criteria[TEXTENTRY])
         try:
-            with open(fpath, mode="r", encoding="utf8") as ofile:
-                entry_text = _DifferenceText(fpath, ofile.readlines())
+            entry_text = _reuse_difference_texts(
+                self.folder,
+                [fpath],
+                restore_cache,
+                closed_texts,
+                max_workers=1,
+            )[0]
         except FileNotFoundError as exc:
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="".join(
                     (
@@ -303,67 +350,84 @@ class Season:
             )
             return None
 
+        # The text is not extracted from the emails yet because the manifest
+        # may show extracting it again is not necessary.
         email_text = []
         email_headers = {}
         for sem in emc.selected_emails:
-            email_text.append((sem.filename, "\n".join(sem.extracted_text)))
+            email_text.append((sem.filename, sem))
             email_headers[os.path.splitext(sem.filename)[0]] = _Headers(
                 dates=sem.dates,
                 authorization_delay=emc.criteria.get(AUTHORIZATION_DELAY),
             )
-        diff_text = []
-        extracted_text = []
         folder = os.path.join(self.folder, emc.criteria[EXTRACTED])
 
         # Process works without sort at this point, but the file names are
         # in date order and that is a good order for display.
-        for fname in sorted(os.listdir(folder)):
-            fpath = os.path.join(folder, fname)
-            try:
-                with open(fpath, mode="r", encoding="utf8") as ofile:
-                    diff_text.append(
-                        _DifferenceText(
-                            fpath, ofile.readlines(), headers=email_headers
-                        )
-                    )
-                    extracted_text.append((fname, diff_text[-1].original_text))
-            except FileNotFoundError as exc:
-                tkinter.messagebox.showinfo(
-                    parent=parent,
-                    title="Open event results data",
-                    message="".join(
-                        (
-                            "Open event file or directory\n\n",
-                            os.path.basename(exc.filename),
-                            "\n\nfailed.\n\nAny files in the directory which ",
-                            "do exist have been ignored.",
-                        )
-                    ),
+        fpaths = [
+            os.path.join(folder, fname)
+            for fname in sorted(os.listdir(folder))
+            if not fname.startswith(EXTRACT_MANIFEST)
+        ]
+        try:
+            if self.loaded_limit is None:
+                diff_text = _reuse_difference_texts(
+                    self.folder,
+                    fpaths,
+                    restore_cache,
+                    closed_texts,
+                    headers=email_headers,
+                    max_workers=self.max_workers,
                 )
-                return None
+            else:
+                loaded_texts = _LoadedTexts(self.loaded_limit)
+                diff_text = [
+                    _DifferenceText(
+                        fpath,
+                        None,
+                        headers=email_headers,
+                        loaded_texts=loaded_texts,
+                        event_folder=self.folder,
+                    )
+                    for fpath in fpaths
+                ]
+        except FileNotFoundError as exc:
+            policy.inform(
+                title="Open event results data",
+                message="".join(
+                    (
+                        "Open event file or directory\n\n",
+                        os.path.basename(exc.filename),
+                        "\n\nfailed.\n\nAny files in the directory which ",
+                        "do exist have been ignored.",
+                    )
+                ),
+            )
+            return None
+        extracted_text = [(dte.filename, dte) for dte in diff_text]
+        new_text = []
 
         # Extract text from all emails to make initial difference text if none
         # already exist.
         if not extracted_text:
-            for efile, etext in email_text:
+            for efile, sem in email_text:
                 epath = os.path.splitext(efile)[0]
-                etext = etext.splitlines(True)
+                etext = "\n".join(sem.extracted_text)
                 diff_text.append(
                     _DifferenceText(
                         os.path.join(folder, epath),
-                        list(difflib.ndiff(etext, etext)),
+                        difference_lines(etext, etext),
                         headers=email_headers,
                     )
                 )
-                extracted_text.append((epath, diff_text[-1].original_text))
+                extracted_text.append((epath, diff_text[-1]))
 
         # The original version from the difference files must be consistent
         # with the version extracted from the available email files.
         emt = {emi[0] for emi in email_text}
         ext = {exi[0] for exi in extracted_text}
         if len(emt) != len(email_text) or len(ext) != len(extracted_text):
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="".join(
                     (
@@ -374,8 +438,7 @@ class Season:
             )
             return False
         if len(ext) > len(emt):
-            tkinter.messagebox.showinfo(
-                parent=parent,
+            policy.inform(
                 title="Open event results data",
                 message="".join(
                     (
@@ -387,8 +450,7 @@ class Season:
             return False
         if len(ext) < len(emt):
             if not ext.issubset(emt):
-                tkinter.messagebox.showinfo(
-                    parent=parent,
+                policy.inform(
                     title="Open event results data",
                     message="".join(
                         (
@@ -399,35 +461,41 @@ class Season:
                 )
                 return False
             if sorted(ext) + sorted(emt.difference(ext)) == sorted(emt):
-                if (
-                    tkinter.messagebox.askquestion(
-                        parent=parent,
-                        title="Open event results data",
-                        message="".join(
-                            (
-                                "Emails dated after latest in extract are ",
-                                "available.\n\nDo you wish to continue ",
-                                "without including the new emails?",
-                            )
-                        ),
-                    )
-                    != tkinter.messagebox.YES
+                if policy.confirm_extract(
+                    title="Open event results data",
+                    message="".join(
+                        (
+                            "Emails dated after latest in extract are ",
+                            "available.\n\nDo you wish to extract the new ",
+                            "emails and include them?",
+                        )
+                    ),
                 ):
-                    return False
-            elif (
-                tkinter.messagebox.askquestion(
-                    parent=parent,
+                    # The difference files for the new emails are written
+                    # after the extracts are found consistent with emails.
+                    new_text = _new_email_texts(
+                        folder, email_text, ext, headers=email_headers
+                    )
+                elif not policy.confirm(
                     title="Open event results data",
                     message="".join(
                         (
-                            "Emails not in the extract are available.  Some, ",
-                            "maybe all, are dated earlier than latest in ",
-                            "extract.\n\nDo you wish to continue without ",
-                            "including the new emails?",
+                            "Do you wish to continue without including the ",
+                            "new emails?",
                         )
                     ),
-                )
-                != tkinter.messagebox.YES
+                ):
+                    return False
+            elif not policy.confirm(
+                title="Open event results data",
+                message="".join(
+                    (
+                        "Emails not in the extract are available.  Some, ",
+                        "maybe all, are dated earlier than latest in ",
+                        "extract.\n\nDo you wish to continue without ",
+                        "including the new emails?",
+                    )
+                ),
             ):
                 return False
 
@@ -435,9 +503,19 @@ class Season:
             email_text = [t for t in email_text if t[0] in ext]
 
         # Extracted text must match email text allowing for universal newlines.
+        # Emails and extracts unchanged since the last check are not compared.
+        manifest = ExtractManifest(folder, configuration)
+        collected = os.path.join(self.folder, emc.criteria[COLLECTED])
         extracted_matches_emails = False
         for ext, emt in zip(sorted(extracted_text), email_text):
+            email_path = os.path.join(collected, emt[0])
+            extract = ext[-1]
+            if manifest.is_unchanged(email_path, extract):
+                continue
+            ext = (ext[0], extract.original_text)
+            emt = (emt[0], "\n".join(emt[-1].extracted_text))
             if ext[-1] == emt[-1]:
+                manifest.record(email_path, emt[-1], extract)
                 continue
             ext_lines = ext[-1].splitlines()
             emt_lines = emt[-1].splitlines()
@@ -485,29 +563,45 @@ class Season:
                     )
                 else:
                     detail = ""
-                tkinter.messagebox.showinfo(
-                    parent=parent,
+                policy.inform(
                     title="Open event results data",
                     message="".join((preamble, detail)),
                 )
                 break
+            manifest.record(email_path, emt[-1], extract)
         else:
             extracted_matches_emails = True
         if not extracted_matches_emails:
             return False
+        manifest.save()
+        try:
+            _write_new_email_texts(new_text)
+        except OSError as exc:
+            policy.inform(
+                title="Open event results data",
+                message="".join(("Extract new emails failed.\n\n", str(exc))),
+            )
+            return False
+        diff_text.extend(new_text)
+
+        # Keep the restored texts for difference files whose restore cache
+        # entry was missing or out of date.
+        entry_text.put_in_cache(restore_cache)
+        for dte in diff_text:
+            dte.put_in_cache(restore_cache)
+
+        # Problems met editing and saving the texts are reported by policy.
+        entry_text.policy = policy
+        for dte in diff_text:
+            dte.policy = policy
 
         # The original text extracted from email is unlikely to be used again,
         # but the version of edited text currently on file will be displayed
-        # first of all and used to detect substantive edits.
+        # first of all and used to detect substantive edits.  The version of
+        # edited text on file is set when the difference file is loaded.
         entry_text.clear_original_text()
-        # pylint reports useless-statement: probable misuse of property.
-        # pylint now reports pointless-statement instead.
-        entry_text.edited_text_on_file
         for dte in diff_text:
             dte.clear_original_text()
-            # pylint reports useless-statement: probable misuse of property.
-            # pylint now reports pointless-statement instead.
-            dte.edited_text_on_file
 
         # Make the list of difference files and their source data available via
         # the difference_text property'
@@ -516,10 +610,78 @@ class Season:
         self._event_extraction_rules = emc.criteria.get(RESULTS_PREFIX, ())
         self._event_competitions = emc.criteria.get(COMPETITION, set())
         self._event_team_name_lookup = emc.criteria.get(TEAM_NAME, {})
+        self._compiled_rules = compile_rules(
+            configuration,
+            self._event_extraction_rules,
+            self._event_competitions,
+        )
         return True
 
-    def extract_event(self):
-        """Extend, specify Schedule as class used to process newfixtures."""
+    def _email_extractor(self, parent=None):
+        """Return EmailExtractor for event or None if rules are not valid."""
+        config = os.path.join(self.folder, EXTRACTED + ".conf")
+        try:
+            with open(config, "r", encoding="utf8") as configfile:
+                configuration = configfile.read()
+        except OSError:
+            return None
+        emc = EmailExtractor(
+            self.folder,
+            configuration=configuration,
+            parent=parent,
+        )
+        if not emc.parse():
+            return None
+        if not {COLLECTED, EXTRACTED, TEXTENTRY}.issubset(emc.criteria):
+            return None
+        return emc
+
+    def source_paths(self, parent=None):
+        """Return paths of mailbox and extracts folders and text entry file.
+
+        None is returned if the email selection rules are not valid.
+
+        """
+        emc = self._email_extractor(parent=parent)
+        if emc is None:
+            return None
+        return tuple(
+            os.path.join(self.folder, emc.criteria[name])
+            for name in (COLLECTED, EXTRACTED, TEXTENTRY)
+        )
+
+    def extract_new_emails(self, parent=None):
+        """Return paths of difference files created for new emails.
+
+        A difference file is created in the extracts folder for each selected
+        email in the mailbox folder which does not have one.  None is
+        returned if the email selection rules are not valid or the extracts
+        folder does not exist.
+
+        """
+        emc = self._email_extractor(parent=parent)
+        if emc is None:
+            return None
+        folder = os.path.join(self.folder, emc.criteria[EXTRACTED])
+        if not os.path.isdir(folder):
+            return None
+        new_text = _new_email_texts(
+            folder,
+            [(sem.filename, sem) for sem in emc.selected_emails],
+            set(os.listdir(folder)),
+        )
+        _write_new_email_texts(new_text)
+        return [dte.filepath for dte in new_text]
+
+    def extract_event(self, policy=None):
+        """Extend, specify Schedule as class used to process newfixtures.
+
+        policy - reports problems and answers questions, default is a
+                 DialogPolicy instance.
+
+        """
+        if policy is None:
+            policy = DialogPolicy()
         difflistcopy = self._difference_text.copy()
         difflistcopy.insert(0, self._entry_text)
 
@@ -542,14 +704,64 @@ class Season:
                 event_identity = (None, None, None)
                 break
         else:
-            event_identity = eventdetails.get_event_details(self.folder)
+            try:
+                event_identity = eventdetails.get_event_details(self.folder)
+            except (OSError, ValueError) as exc:
+                policy.inform(
+                    title="Extract event",
+                    message="".join(
+                        (
+                            "Event details in ",
+                            constants.EVENT_CONF,
+                            " not read because:\n\n",
+                            str(exc),
+                        )
+                    ),
+                )
+                event_identity = (None, None, None)
         self._event_parser = EventParser(difflistcopy)
+        profile = RuleProfile() if self.profile_rules else None
         self._event_data = self._event_parser.build_event(
             self._event_extraction_rules,
             self._event_competitions,
             self._event_team_name_lookup,
             event_identity,
+            policy=policy,
+            compiled_rules=self._compiled_rules,
+            parse_cache=self._parse_cache,
+            max_workers=self.max_workers,
+            profile=profile,
+            time_budget=self.time_budget,
+            split_cache=self._name_split_cache,
         )
+        self._name_split_cache.save()
+        if self._event_parser.error:
+            policy.inform(
+                title="Rule Time Budget",
+                message="\n\n".join(self._event_parser.error),
+            )
+        if profile is not None:
+            try:
+                profile.write(
+                    os.path.join(self.folder, constants.RULE_PROFILE)
+                )
+            except OSError as exc:
+                policy.inform(
+                    title="Extract event",
+                    message="".join(
+                        (
+                            "Rule profile not written because:\n\n",
+                            str(exc),
+                        )
+                    ),
+                )
+
+    @property
+    def extract_errors(self):
+        """Return messages about rules which exceeded the time budget."""
+        if self._event_parser is None:
+            return []
+        return self._event_parser.error
 
     @property
     def difference_text(self):
@@ -561,6 +773,52 @@ class Season:
         """Return the _DifferenceText instance for typed-in text."""
         return self._entry_text
 
+    def is_modified(self):
+        """Return True if any edited text is not the version on file."""
+        return any(dte.is_dirty for dte in self._all_difference_texts())
+
+    def _all_difference_texts(self):
+        """Return list of entry text and difference text instances."""
+        return [self._entry_text] + self._difference_text
+
+    def save_modified_texts(self):
+        """Save the modified difference texts as a batch and return them.
+
+        All modified texts are written to new files before any replace the
+        version on file.  If any write fails the new files are removed, the
+        versions on file are not changed, and the exception is raised.
+
+        The versions on file are kept while the new files replace them.  If
+        any replacement fails the versions already replaced are put back,
+        the new files are removed, and the exception is raised.  A version
+        which cannot be put back is left in its file with "old" suffix.
+
+        """
+        dirty = [dte for dte in self._all_difference_texts() if dte.is_dirty]
+        written = []
+        try:
+            for dte in dirty:
+                written.append(dte)
+                dte.save_edited_text_as_new()
+        except OSError:
+            for dte in written:
+                dte.discard_new_edited_text()
+            raise
+        renamed = []
+        try:
+            for dte in dirty:
+                dte.rename_new_edited_text()
+                renamed.append(dte)
+        except OSError:
+            for dte in reversed(renamed):
+                dte.restore_old_edited_text()
+            for dte in dirty:
+                dte.discard_new_edited_text()
+            raise
+        for dte in dirty:
+            dte.commit_new_edited_text()
+        return dirty
+
     def get_schedule_from_file(self):
         """Extract schedule from text file using getfixtures.build_schedule.
 
@@ -603,6 +861,26 @@ class Season:
         self.fixture_schedule = None
         self._collation = None
 
+    def close_documents(self):
+        """Discard the open documents so open_documents can be called again.
+
+        The compiled rules, parse cache, and name split cache, are kept.  The
+        difference texts which are not modified are kept too, and are used
+        by the next open_documents call if their files are unchanged.
+
+        """
+        self.close()
+        if self._entry_text is not None:
+            self._closed_texts = {
+                dte.filepath: dte
+                for dte in self._all_difference_texts()
+                if not dte.is_dirty
+            }
+        self._difference_text = None
+        self._entry_text = None
+        self._event_parser = None
+        self._event_data = None
+
     # Copied from PDLSeason and SLSeason
 
     def get_collated_unfinished_games(self):
@@ -613,15 +891,40 @@ class Season:
 class _DifferenceText:
     """Repreresent stages of processing text containing event information."""
 
-    def __init__(self, filepath, diff_lines, headers=None, junk_rules=None):
-        """Initialise difference texts for event data."""
+    def __init__(
+        self,
+        filepath,
+        diff_lines,
+        headers=None,
+        junk_rules=None,
+        loaded_texts=None,
+        event_folder=None,
+    ):
+        """Initialise difference texts for event data.
+
+        diff_lines is None if the difference file is loaded when the text
+        is first needed.  loaded_texts is the _LoadedTexts instance which
+        evicts the texts from memory.  The texts loaded are taken from, and
+        put in, the restore cache of the event in event_folder if given.
+
+        policy reports problems met editing and saving the text, and is a
+        DialogPolicy instance if not set.
+
+        """
         self._folder = os.path.dirname(filepath)
         self._filename = os.path.basename(filepath)
         self._diff_lines = diff_lines
         self._junk_rules = junk_rules
+        self._loaded_texts = loaded_texts
+        self._event_folder = event_folder
+        self.policy = None
         self._original_text = None
         self._edited_text = None
         self._edited_text_on_file = None
+        self._edited_text_digest = None
+        self._new_diff_lines = None
+        self._is_on_file = diff_lines is None
+        self._file_status = None
         self._data_tag = None
         self._header_tag = None
         self._trailer_tag = None
@@ -643,16 +946,58 @@ class _DifferenceText:
         """Return filenaame."""
         return self._filename
 
+    @property
+    def filepath(self):
+        """Return path of difference file."""
+        return os.path.join(self._folder, self._filename)
+
     @property
     def filename_header(self):
         """Return header text for type-in text area."""
         return "\n".join((self._filename, "Results added by typing."))
 
+    def _load(self):
+        """Load difference file if not in memory and note it is viewed."""
+        if self._diff_lines is None:
+            if self._event_folder is None:
+                with open(self.filepath, mode="r", encoding="utf8") as ofile:
+                    self._diff_lines = ofile.readlines()
+                self.set_restored_texts(*restore_texts(self._diff_lines))
+            else:
+                diff_lines, texts, key, status = _read_difference_file(
+                    self._event_folder, self.filepath
+                )
+                self._diff_lines = diff_lines
+                self.set_restored_texts(*texts)
+                self.set_file_status(status)
+                if key is not None:
+                    restore_cache = RestoreCache(self._event_folder)
+                    restore_cache.mark_stale(self.filepath, key)
+                    restore_cache.put(self.filepath, *texts)
+        if self._loaded_texts is not None:
+            self._loaded_texts.touch(self)
+
+    def evict(self):
+        """Discard texts loaded from file and return True if not modified.
+
+        Texts are not discarded if modified or if they are not loaded when
+        needed.
+
+        """
+        if self._loaded_texts is None or self.is_dirty:
+            return False
+        self._diff_lines = None
+        self._original_text = None
+        self._edited_text = None
+        self._edited_text_on_file = None
+        return True
+
     @property
     def original_text(self):
         """Return original version of text built from difference files."""
+        self._load()
         if self._original_text is None:
-            self._original_text = "".join(difflib.restore(self._diff_lines, 1))
+            self._original_text = restore_text(self._diff_lines, 1)
         return self._original_text
 
     @property
@@ -675,6 +1020,35 @@ class _DifferenceText:
         """Return headers for this _DifferenceText instance."""
         return self._headers
 
+    def reuse(self, headers):
+        """Prepare text kept when documents were closed for use again.
+
+        The headers are set from headers, and the tags are cleared so they
+        can be set for the position of the text in the reopened documents.
+
+        """
+        if headers is None:
+            self._headers = None
+        else:
+            self._headers = headers[self._filename]
+        self._data_tag = None
+        self._header_tag = None
+        self._trailer_tag = None
+
+    def set_file_status(self, file_status):
+        """Note size and modification time of file when it was read."""
+        self._file_status = file_status
+
+    def is_unchanged_on_file(self):
+        """Return True if file is unchanged since it was read."""
+        if self._file_status is None:
+            return False
+        try:
+            status = os.stat(self.filepath)
+        except OSError:
+            return False
+        return self._file_status == (status.st_size, status.st_mtime_ns)
+
     def set_tags(self, suffix):
         """Set header, data, and trailer, tags for suffix."""
         if (
@@ -689,17 +1063,21 @@ class _DifferenceText:
     @property
     def edited_text(self):
         """Return edited version of text in difference files."""
+        self._load()
         if self._edited_text is None:
-            self._edited_text = "".join(difflib.restore(self._diff_lines, 2))
+            self._edited_text = restore_text(self._diff_lines, 2)
         return self._edited_text
 
     @edited_text.setter
     def edited_text(self, value):
         """Set edited version of text to value."""
+        self._load()
         if isinstance(value, str):
+            if value != self._edited_text:
+                self._edited_text_digest = None
             self._edited_text = value
         else:
-            tkinter.messagebox.showinfo(
+            self._inform(
                 title="Save event results data",
                 message="".join(
                     (
@@ -710,13 +1088,39 @@ class _DifferenceText:
                 ),
             )
 
+    @property
+    def edited_text_digest(self):
+        """Return hex digest of edited text.
+
+        The digest is kept when the texts are evicted, so the text is not
+        loaded again to find the digest while the file is unchanged.
+
+        """
+        if self._diff_lines is None and not self.is_unchanged_on_file():
+            self._edited_text_digest = None
+        if self._edited_text_digest is None:
+            self._edited_text_digest = hashlib.sha256(
+                self.edited_text.encode("utf8")
+            ).hexdigest()
+        return self._edited_text_digest
+
     @property
     def edited_text_on_file(self):
         """Return edited version of text on file in difference files."""
+        self._load()
         if self._edited_text_on_file is None:
             self._edited_text_on_file = self._edited_text
         return self._edited_text_on_file
 
+    @property
+    def is_dirty(self):
+        """Return True if edited text is not the version on file."""
+        if not self._is_on_file:
+            return True
+        if self._diff_lines is None or self._edited_text is None:
+            return False
+        return self._edited_text != self._edited_text_on_file
+
     @property
     def sender_and_date(self):
         """Return sender and date derived from filename."""
@@ -747,41 +1151,280 @@ class _DifferenceText:
         """Clear out origial text."""
         self._original_text = None
 
+    def set_restored_texts(self, original_text, edited_text):
+        """Set original and edited texts restored from difference file."""
+        self._original_text = original_text
+        self._edited_text = edited_text
+        self._edited_text_on_file = edited_text
+        self._edited_text_digest = None
+        self._is_on_file = True
+
+    def put_in_cache(self, cache):
+        """Put original and edited texts in cache if entry is out of date."""
+        if cache.is_stale(self.filepath):
+            cache.put(self.filepath, self.original_text, self.edited_text)
+
     def save_edited_text_as_new(self):
         """Save edited text in file self._filename with "new" suffix."""
-        newdiff = list(
-            difflib.ndiff(
-                self.original_text.splitlines(True),
-                self._edited_text.splitlines(True),
-            )
-        )
+        newdiff = difference_lines(self.original_text, self._edited_text)
         with open(
             os.path.join(self._folder, "".join((self._filename, "new"))),
             mode="w",
             encoding="utf8",
         ) as newfile:
             newfile.writelines(newdiff)
-        self._edited_text_on_file = self._edited_text
+        self._new_diff_lines = newdiff
+
+    def discard_new_edited_text(self):
+        """Remove file self._filename with "new" suffix if it exists."""
+        try:
+            os.remove(
+                os.path.join(self._folder, "".join((self._filename, "new")))
+            )
+        except OSError:
+            pass
 
     def rename_new_edited_text(self):
-        """Rename self._filename removing "new"."""
+        """Rename self._filename removing "new", keeping version on file.
+
+        The version on file, if any, is copied to file self._filename with
+        "old" suffix for restore_old_edited_text.  OSError is raised, with
+        the version on file unchanged, if the rename fails.
+
+        """
+        path = os.path.join(self._folder, self._filename)
+        old_path = "".join((path, "old"))
+        if os.path.exists(path):
+            shutil.copyfile(path, old_path)
         try:
-            os.replace(
-                os.path.join(self._folder, "".join((self._filename, "new"))),
-                os.path.join(self._folder, self._filename),
+            os.replace("".join((path, "new")), path)
+        except OSError:
+            if os.path.exists(old_path):
+                os.remove(old_path)
+            raise
+
+    def restore_old_edited_text(self):
+        """Put back the version on file replaced by rename_new_edited_text.
+
+        The file is removed if there was no version on file.  The version is
+        left in file self._filename with "old" suffix if it cannot be put
+        back.
+
+        """
+        path = os.path.join(self._folder, self._filename)
+        old_path = "".join((path, "old"))
+        try:
+            if os.path.exists(old_path):
+                os.replace(old_path, path)
+            else:
+                os.remove(path)
+        except OSError:
+            pass
+
+    def commit_new_edited_text(self):
+        """Note the renamed new file is the version on file."""
+        try:
+            os.remove(
+                os.path.join(self._folder, "".join((self._filename, "old")))
             )
         except OSError:
-            tkinter.messagebox.showinfo(
-                title="Save event results data",
-                message="".join(
-                    (
-                        "Rename new file as\n\n",
-                        os.path.join(self._folder, self._filename),
-                        "\n\n fails.\n\nRenaming other new files will ",
-                        "continue on dismissing this report.",
-                    )
-                ),
+            pass
+        self._edited_text_on_file = self._edited_text
+        self._is_on_file = True
+        self._put_saved_texts_in_cache()
+
+    def _inform(self, title=None, message=None):
+        """Report message with policy."""
+        policy = DialogPolicy() if self.policy is None else self.policy
+        policy.inform(title=title, message=message)
+
+    def _put_saved_texts_in_cache(self):
+        """Note saved difference lines and put texts in restore cache.
+
+        The texts are reloaded from the restore cache if evicted.
+
+        """
+        diff_lines = self._new_diff_lines
+        self._new_diff_lines = None
+        if diff_lines is None:
+            return
+        original_text = self.original_text
+        self._diff_lines = diff_lines
+        try:
+            key = cache_key(self.filepath, diff_lines)
+        except OSError:
+            self.set_file_status(None)
+            return
+        self.set_file_status(tuple(key[:2]))
+        if self._event_folder is not None:
+            restore_cache = RestoreCache(self._event_folder)
+            restore_cache.mark_stale(self.filepath, key)
+            restore_cache.put(self.filepath, original_text, self._edited_text)
+
+
+class _LoadedTexts:
+    """Evict least recently viewed difference texts loaded when needed."""
+
+    def __init__(self, limit):
+        """Initialise with limit on number of difference texts in memory."""
+        self._limit = max(1, limit)
+        self._loaded = collections.OrderedDict()
+
+    def touch(self, difference_text):
+        """Note difference_text viewed and evict others if over limit."""
+        filepath = difference_text.filepath
+        self._loaded[filepath] = difference_text
+        self._loaded.move_to_end(filepath)
+        if len(self._loaded) <= self._limit:
+            return
+        for filepath in list(self._loaded)[:-1]:
+            if self._loaded[filepath].evict():
+                del self._loaded[filepath]
+                if len(self._loaded) <= self._limit:
+                    break
+
+
+def _read_difference_file(event_folder, filepath):
+    """Return difference lines, restored texts, stale cache key, and status.
+
+    The restored texts are taken from the restore cache of the event in
+    event_folder if the entry is up to date, and the key returned is None.
+    Otherwise the texts are restored from the difference lines and the key
+    for the new cache entry is returned.  The status is the size and
+    modification time of the file.
+
+    """
+    with open(filepath, mode="r", encoding="utf8") as ofile:
+        diff_lines = ofile.readlines()
+    key = cache_key(filepath, diff_lines)
+    status = tuple(key[:2])
+    texts = RestoreCache(event_folder).lookup(filepath, key)
+    if texts is not None:
+        return diff_lines, texts, None, status
+    return diff_lines, restore_texts(diff_lines), key, status
+
+
+def _load_difference_texts(
+    event_folder, filepaths, restore_cache, headers=None, max_workers=None
+):
+    """Return _DifferenceText instances for filepaths in the same order.
+
+    The files are read and restored in a pool of at most max_workers
+    processes when more than one file is given and max_workers is not 1.
+
+    """
+    if max_workers == 1 or len(filepaths) < 2:
+        loaded = [
+            _read_difference_file(event_folder, fpath) for fpath in filepaths
+        ]
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(filepaths))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            loaded = list(
+                executor.map(
+                    _read_difference_file,
+                    [event_folder] * len(filepaths),
+                    filepaths,
+                    chunksize=max(1, len(filepaths) // (workers * 4)),
+                )
+            )
+    difference_texts = []
+    for fpath, (diff_lines, texts, key, status) in zip(filepaths, loaded):
+        dte = _DifferenceText(fpath, diff_lines, headers=headers)
+        dte.set_restored_texts(*texts)
+        dte.set_file_status(status)
+        if key is not None:
+            restore_cache.mark_stale(fpath, key)
+        difference_texts.append(dte)
+    return difference_texts
+
+
+def _reuse_difference_texts(
+    event_folder,
+    filepaths,
+    restore_cache,
+    closed_texts,
+    headers=None,
+    max_workers=None,
+):
+    """Return _DifferenceText instances for filepaths in the same order.
+
+    The instances in closed_texts, a dict keyed by path, whose files are
+    unchanged since they were read are reused.  The other files are loaded
+    by _load_difference_texts.
+
+    """
+    reused = {}
+    for fpath in filepaths:
+        dte = closed_texts.get(fpath)
+        if dte is not None and dte.is_unchanged_on_file():
+            dte.reuse(headers)
+            reused[fpath] = dte
+    loaded = iter(
+        _load_difference_texts(
+            event_folder,
+            [fpath for fpath in filepaths if fpath not in reused],
+            restore_cache,
+            headers=headers,
+            max_workers=max_workers,
+        )
+    )
+    return [
+        reused[fpath] if fpath in reused else next(loaded)
+        for fpath in filepaths
+    ]
+
+
+def _new_email_texts(folder, email_text, extracted, headers=None):
+    """Return _DifferenceText instances for emails not extracted.
+
+    email_text is a list of (filename, email) pairs.  A _DifferenceText is
+    made for a difference file in folder for each email whose name is not
+    in extracted, with the text extracted from the email as both original
+    and edited text.  The files are written by _write_new_email_texts.
+
+    """
+    new_text = []
+    for efile, sem in email_text:
+        epath = os.path.splitext(efile)[0]
+        if epath in extracted:
+            continue
+        etext = "\n".join(sem.extracted_text)
+        new_text.append(
+            _DifferenceText(
+                os.path.join(folder, epath),
+                difference_lines(etext, etext),
+                headers=headers,
             )
+        )
+        new_text[-1].set_restored_texts(etext, etext)
+    return new_text
+
+
+def _write_new_email_texts(new_text):
+    """Write difference files for _DifferenceText instances in new_text.
+
+    The files must not exist.  If any write fails the files written are
+    removed and the exception is raised.
+
+    """
+    written = []
+    try:
+        for dte in new_text:
+            with open(dte.filepath, mode="x", encoding="utf8") as ofile:
+                written.append(dte.filepath)
+                ofile.writelines(
+                    difference_lines(dte.original_text, dte.edited_text)
+                )
+    except OSError:
+        for filepath in written:
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+        raise
 
 
 def _create_event_configuration_file(directory):
@@ -792,9 +1435,13 @@ def _create_event_configuration_file(directory):
         config_file.write(constants.NEW_FILE_TEXT)
 
 
-def create_extract_and_event_configuration_files(file_path):
-    """Create extract and event configuration files with default settings."""
-    if upgrade_configuration_files(file_path):
+def create_extract_and_event_configuration_files(file_path, policy=None):
+    """Create extract and event configuration files with default settings.
+
+    policy reports problems, default is a DialogPolicy instance.
+
+    """
+    if upgrade_configuration_files(file_path, policy=policy):
         return False
     with open(file_path, "w", encoding="utf8") as config_file:
         config_file.writelines((" ".join((COLLECTED, COLLECTED)), os.linesep))
@@ -813,13 +1460,15 @@ def create_extract_and_event_configuration_files(file_path):
     return True
 
 
-def upgrade_configuration_files(file_path):
+def upgrade_configuration_files(file_path, policy=None):
     """Upgrade conf and *.ems files to extracted.conf and collected.conf.
 
     Earlier versions of this method changes *.ems files to event.conf but
     event.conf is going to be used to hold details such as event name and
     date and time limits.
 
+    policy reports problems, default is a DialogPolicy instance.
+
     """
     directory = os.path.dirname(file_path)
     names = os.listdir(directory)
@@ -837,7 +1486,9 @@ def upgrade_configuration_files(file_path):
     if COLLECTED + ".conf" not in names:
         conflictname = EXTRACTED + ".ems"
         if conflictname in names:
-            tkinter.messagebox.showinfo(
+            if policy is None:
+                policy = DialogPolicy()
+            policy.inform(
                 title="Upgrade Event Configuration Files",
                 message="".join(
                     (
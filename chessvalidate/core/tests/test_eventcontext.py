@@ -0,0 +1,236 @@
+# test_eventcontext.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for splitting joined names in the eventcontext module."""
+
+import io
+import random
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+from .. import eventcontext
+from .. import eventparser
+from .. import names
+from ..namesplitcache import NameSplitCache
+from ..policy import BatchPolicy
+from .test_resultlexer import _sample_items, _COMPETITIONS
+
+# Names of attributes holding joined and split player names.
+_ATTRNAMES = ("names", "nameone", "nametwo")
+
+# Words in player names.
+_WORDS = (
+    "Alice",
+    "Bob",
+    "Carol",
+    "Dave",
+    "Eve",
+    "Frank",
+    "Grace",
+    "Heidi",
+    "Ivan",
+    "Judy",
+    "Smith",
+    "Jones",
+)
+
+
+def _old_split_guesses(guesses, consistent, nameone, nametwo):
+    """Return split names for guesses by repeating passes until no change.
+
+    This is the loop replaced by eventcontext._split_guesses.
+
+    """
+    splitnames = {}
+    guesses = dict(guesses)
+    prevlenguesses = 0
+    while len(guesses) != prevlenguesses:
+        prevlenguesses = len(guesses)
+        stillguesses = {}
+        while guesses:
+            k, gvalue = guesses.popitem()
+            awaywords = " ".join((gvalue[nameone], gvalue[nametwo])).split()
+            if not awaywords:
+                continue
+            homewords = [awaywords.pop(0)]
+            while awaywords:
+                homename = " ".join(homewords)
+                awayname = " ".join(awaywords)
+                if homename in consistent or awayname in consistent:
+                    splitnames[k] = {nameone: homename, nametwo: awayname}
+                    break
+                homewords.append(awaywords.pop(0))
+            else:
+                stillguesses[k] = gvalue
+        guesses = stillguesses
+    splitnames.update(guesses)
+    return splitnames
+
+
+def _resolved_names(item):
+    """Return split names of EventData instances in sample text item."""
+    parser = eventparser.EventParser([item])
+    items = list(
+        parser.parse_event(
+            [],
+            _COMPETITIONS,
+            (None, None, None),
+            policy=BatchPolicy(stream=io.StringIO()),
+        )
+    )
+    parser.resolve_names({})
+    return [
+        {
+            name: eventdata.__dict__.get(name)
+            for name in ("nameone", "nametwo", "teamone", "teamtwo")
+        }
+        for eventdata in items
+    ]
+
+
+def _competitions(seed, count):
+    """Return count lists of results with joined player names."""
+    rng = random.Random(seed)
+    competitions = []
+    for _ in range(count):
+        players = [
+            " ".join(rng.sample(_WORDS, rng.randint(1, 3)))
+            for _ in range(rng.randint(2, 6))
+        ]
+        results = []
+        for _ in range(rng.randint(1, 8)):
+            if rng.random() < 0.05:
+                joined = ""
+            else:
+                joined = " ".join(rng.sample(players, 2))
+            results.append(types.SimpleNamespace(names=joined))
+        competitions.append(results)
+    return competitions
+
+
+class SplitGuesses(unittest.TestCase):
+    """Test _split_guesses gives the same splits as the loop it replaced."""
+
+    def test_random_competitions(self):
+        """Split guesses made for random joined names both ways."""
+        calls = 0
+        with mock.patch.object(
+            eventcontext,
+            "_split_guesses",
+            wraps=eventcontext._split_guesses,
+        ) as split_guesses:
+            for joined_names in _competitions(1, 500):
+                eventcontext.get_names_from_joined_names(
+                    joined_names, _ATTRNAMES
+                )
+                for call in split_guesses.call_args_list[calls:]:
+                    self.assertEqual(
+                        eventcontext._split_guesses(*call.args),
+                        _old_split_guesses(*call.args),
+                    )
+                calls = len(split_guesses.call_args_list)
+        self.assertNotEqual(calls, 0)
+
+    def test_sample_texts(self):
+        """Names resolved in the sample texts both ways are the same."""
+        items = _sample_items()
+        self.assertNotEqual(items, [])
+        guesses = 0
+        with mock.patch.object(
+            eventcontext,
+            "_split_guesses",
+            wraps=eventcontext._split_guesses,
+        ) as split_guesses:
+            for item in items:
+                with self.subTest(sample=item.data_tag):
+                    resolved = _resolved_names(item)
+                    with mock.patch.object(
+                        eventcontext, "_split_guesses", _old_split_guesses
+                    ):
+                        self.assertEqual(_resolved_names(item), resolved)
+            for call in split_guesses.call_args_list:
+                guesses += len(call.args[0])
+        self.assertNotEqual(guesses, 0)
+
+    def test_edge_cases(self):
+        """Empty, one word, and unsplittable, guesses."""
+        guesses = {
+            0: {"nameone": "", "nametwo": ""},
+            1: {"nameone": "Alice", "nametwo": ""},
+            2: {"nameone": "Alice Bob", "nametwo": "Carol"},
+            3: {"nameone": "Dave", "nametwo": "Eve Frank"},
+            4: {"nameone": "Grace", "nametwo": "Heidi"},
+        }
+        consistent = {"Alice", "Eve Frank", "Carol"}
+        self.assertEqual(
+            eventcontext._split_guesses(
+                guesses, consistent, "nameone", "nametwo"
+            ),
+            _old_split_guesses(guesses, consistent, "nameone", "nametwo"),
+        )
+
+
+class NameSplitCacheUse(unittest.TestCase):
+    """Test guessed splits taken from a NameSplitCache are the same."""
+
+    def test_cache_hit(self):
+        """Splits are the same without cache, on cache miss, and on hit."""
+        competitions = _competitions(2, 200)
+        with tempfile.TemporaryDirectory() as folder:
+            cache = NameSplitCache(folder)
+            missed = [
+                eventcontext.get_names_from_joined_names(
+                    joined_names, _ATTRNAMES, split_cache=cache
+                )
+                for joined_names in competitions
+            ]
+            cache.save()
+
+            # All guesses are taken from the cache so the known names used
+            # to guess are never built.
+            cache = NameSplitCache(folder)
+            with mock.patch.object(
+                names, "KnownNames", side_effect=AssertionError
+            ):
+                hit = [
+                    eventcontext.get_names_from_joined_names(
+                        joined_names, _ATTRNAMES, split_cache=cache
+                    )
+                    for joined_names in competitions
+                ]
+        uncached = [
+            eventcontext.get_names_from_joined_names(joined_names, _ATTRNAMES)
+            for joined_names in competitions
+        ]
+        self.assertEqual(missed, uncached)
+        self.assertEqual(hit, uncached)
+
+    def test_merge_worker_copies(self):
+        """Splits added by copies for the same digest are all kept."""
+        with tempfile.TemporaryDirectory() as folder:
+            cache = NameSplitCache(folder)
+            cache.add("d1", "A B", ["A", "B"])
+            cache.save()
+            cache = NameSplitCache(folder)
+            first = cache.worker_copy()
+            second = cache.worker_copy()
+            self.assertEqual(first.splits("d1"), {"A B": ["A", "B"]})
+            first.add("d1", "C D", ["C", "D"])
+            second.add("d1", "E F", None)
+            second.splits("d2")
+            cache.merge(first.changes())
+            cache.merge(second.changes())
+            self.assertEqual(cache.changes()["d2"], {})
+            cache.save()
+            cache = NameSplitCache(folder)
+            self.assertEqual(
+                cache.splits("d1"),
+                {"A B": ["A", "B"], "C D": ["C", "D"], "E F": None},
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# test_eventdetails.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for reading the event configuration file without a display."""
+
+import os
+import tempfile
+import unittest
+
+from ecfformat.core import constants
+
+from .. import eventdetails
+from ..constants import EVENT_CONF
+
+
+def _field(name, value):
+    """Return ECF format field name with value."""
+    return "".join(
+        (
+            constants.FIELD_SEPARATOR,
+            name,
+            constants.NAME_VALUE_SEPARATOR,
+            value,
+        )
+    )
+
+
+class GetEventDetails(unittest.TestCase):
+    """Test event identity is read from event configuration file text."""
+
+    def _event_details(self, text):
+        """Return get_event_details for event configuration file text."""
+        with tempfile.TemporaryDirectory() as folder:
+            with open(
+                os.path.join(folder, EVENT_CONF), mode="w", encoding="utf8"
+            ) as conf:
+                conf.write(text)
+            return eventdetails.get_event_details(folder)
+
+    def test_event_details(self):
+        """The event name and dates are taken from their fields."""
+        text = "\n".join(
+            (
+                "".join(
+                    (constants.FIELD_SEPARATOR, constants.NAME_EVENT_DETAILS)
+                ),
+                _field(constants.NAME_EVENT_NAME, "Winter League "),
+                _field(constants.NAME_EVENT_DATE, "01/10/2026"),
+                _field(constants.NAME_FINAL_RESULT_DATE, "31/03/2027"),
+            )
+        )
+        self.assertEqual(
+            self._event_details(text),
+            ("Winter League", "01/10/2026", "31/03/2027"),
+        )
+
+    def test_missing_value(self):
+        """No event identity is given if a field has no value."""
+        text = "\n".join(
+            (
+                _field(constants.NAME_EVENT_NAME, "Winter League"),
+                _field(constants.NAME_EVENT_DATE, ""),
+                _field(constants.NAME_FINAL_RESULT_DATE, "31/03/2027"),
+            )
+        )
+        self.assertEqual(self._event_details(text), (None, None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# test_eventparser.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for parsing texts within a time budget in the eventparser module."""
+
+import re
+import unittest
+
+from .. import eventparser
+from ..emailextractor import (
+    SOURCE,
+    RESULTS_PREFIX,
+    SECTION_PREFIX,
+    SECTION_BODY,
+    SECTION_NAME,
+    DROP_FORWARDED_MARKERS,
+    KEEP_WORD_SPLITTERS,
+    MATCH_FORMATS,
+    PLAYED_ON_FORMATS,
+    FIXTURE_FORMATS,
+)
+from ..found import Found
+
+# A forwarded email marker which backtracks for ever on a line of 'a's.
+_SLOW_MARKER = "(?:a|a)*c"
+
+# A text with a line of 'a's.
+_SLOW_TEXT = "".join(("Forwarded\n", "a" * 40, "\n"))
+
+
+def _rule(markers):
+    """Return extraction rule, dropping markers, which finds no results."""
+    return {
+        SOURCE: re.compile(""),
+        RESULTS_PREFIX: re.compile("no results here"),
+        SECTION_PREFIX: re.compile(""),
+        SECTION_BODY: re.compile(""),
+        SECTION_NAME: {},
+        DROP_FORWARDED_MARKERS: markers,
+        KEEP_WORD_SPLITTERS: "",
+        MATCH_FORMATS: [],
+        PLAYED_ON_FORMATS: [],
+        FIXTURE_FORMATS: [],
+    }
+
+
+class RecordTextsWithinBudget(unittest.TestCase):
+    """Test a slow rule is reported and quarantined, not fatal."""
+
+    def test_slow_forwarded_marker(self):
+        """The slow rule is reported once and the texts are all parsed."""
+        compiled_rules = eventparser.CompiledRules(
+            [_rule(_SLOW_MARKER), _rule("")], set()
+        )
+        texts = [
+            (_SLOW_TEXT, "tag1", "file1"),
+            (_SLOW_TEXT, "tag2", "file2"),
+        ]
+        records = list(
+            eventparser._record_texts_within_budget(
+                compiled_rules, texts, 0.2
+            )
+        )
+        self.assertEqual(len(records), 2)
+        timeouts = [
+            kargs
+            for item_records in records
+            for _, kargs in item_records
+            if kargs.get("found") == Found.RULE_TIMEOUT
+        ]
+        self.assertEqual(len(timeouts), 1)
+        self.assertEqual(timeouts[0]["datatag"], "tag1")
+        self.assertIn(DROP_FORWARDED_MARKERS, timeouts[0]["raw"])
+        self.assertIn("file1", timeouts[0]["raw"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+# test_resultlexer.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the resultlexer module and its use in the eventparser module."""
+
+import io
+import os
+import unittest
+from unittest import mock
+
+from .. import resultlexer
+from .. import eventparser
+from ..policy import BatchPolicy
+
+# Folder containing the sample texts supplied with the package.
+_SAMPLES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "help_"
+)
+
+# Competitions named in the sample texts.
+_COMPETITIONS = {"Division 1", "Open", "Major"}
+
+
+class _AllTokens(resultlexer.LineTokens):
+    """LineTokens which allows all regular expressions to be tried."""
+
+    def __init__(self, text):
+        """Note all items may be present in text."""
+        del text
+        self._set_all()
+
+
+class _Item:
+    """Difference item for a sample text."""
+
+    def __init__(self, filename, edited_text):
+        """Initialise item for text read from filename."""
+        self.filename = filename
+        self.data_tag = os.path.basename(filename)
+        self.edited_text = edited_text
+        self.headers = None
+
+
+def _sample_items():
+    """Return _Item instances for the sample text files."""
+    items = []
+    for name in sorted(os.listdir(_SAMPLES)):
+        if not name.startswith("sample_") or not name.endswith(".txt"):
+            continue
+        path = os.path.join(_SAMPLES, name)
+        with open(path, encoding="utf8") as sample_file:
+            items.append(_Item(path, sample_file.read()))
+    return items
+
+
+def _parse(items):
+    """Return class and attributes of EventData instances parsed from items."""
+    return [
+        (eventdata.__class__, vars(eventdata))
+        for eventdata in eventparser.EventParser(items).parse_event(
+            [],
+            _COMPETITIONS,
+            (None, None, None),
+            policy=BatchPolicy(stream=io.StringIO()),
+        )
+    ]
+
+
+class LineTokens(unittest.TestCase):
+    """Test the items noted by LineTokens."""
+
+    def test_result_line(self):
+        """A game result line may have points and a round or board."""
+        tokens = resultlexer.LineTokens("3 Alice 1-0 Bob")
+        self.assertIs(tokens.points, True)
+        self.assertIs(tokens.score, True)
+        self.assertIs(tokens.round, True)
+        self.assertIs(tokens.date, False)
+        self.assertIs(tokens.draw, False)
+        self.assertIs(tokens.void, False)
+        self.assertIs(tokens.played_on, False)
+        self.assertIs(tokens.result_only, False)
+
+    def test_points_without_score(self):
+        """Points separated by names or spaces are not a score item."""
+        tokens = resultlexer.LineTokens("Alice 1 Bob 0")
+        self.assertIs(tokens.points, True)
+        self.assertIs(tokens.score, False)
+        self.assertIs(tokens.date, False)
+
+    def test_dates(self):
+        """A date needs a year and a month name or three numbers."""
+        for text, date in (
+            ("Division 1 12 Oct 2026", True),
+            ("12/10/26 Alice 1-0 Bob", True),
+            ("2026-10-12", True),
+            ("12 10 2026", True),
+            ("Jones 12 Alice 1-0 Bob", False),
+            ("12 Alice 10 Bob 2026", False),
+            ("October 2026", False),
+            ("1 2 3", False),
+        ):
+            with self.subTest(text=text):
+                self.assertIs(resultlexer.LineTokens(text).date, date)
+
+    def test_words_only(self):
+        """A line of words has no numeric items."""
+        tokens = resultlexer.LineTokens("Alice draw Bob")
+        self.assertIs(tokens.draw, True)
+        self.assertIs(tokens.points, False)
+        self.assertIs(tokens.round, False)
+        self.assertIs(tokens.date, False)
+        self.assertIs(tokens.swiss, False)
+        self.assertIs(tokens.all_play_all, False)
+
+    def test_non_ascii_letter(self):
+        """All items may be present if a non-ASCII letter is present."""
+        tokens = resultlexer.LineTokens("Alice \u212a Bob")
+        for name in (
+            "swiss",
+            "all_play_all",
+            "played_on",
+            "date",
+            "result_only",
+            "void",
+            "points",
+            "score",
+            "draw",
+            "round",
+        ):
+            self.assertIs(getattr(tokens, name), True, msg=name)
+
+
+class Gating(unittest.TestCase):
+    """Test skipping expressions which cannot match does not change output."""
+
+    def test_sample_texts(self):
+        """Gated and ungated parse of each sample text give same EventData."""
+        items = _sample_items()
+        self.assertNotEqual(items, [])
+        for item in items:
+            with self.subTest(sample=item.data_tag):
+                gated = _parse([item])
+                with mock.patch.object(eventparser, "LineTokens", _AllTokens):
+                    ungated = _parse([item])
+                self.assertNotEqual(ungated, [])
+                self.assertEqual(gated, ungated)
+
+    def test_competition_in_word(self):
+        """Lines are scanned again after removing competition from a word."""
+        for text in (
+            "Major1\n",
+            "Major1 Alice draw Bob\n",
+            "Open12/10/2026 19/10/2026\n",
+        ):
+            with self.subTest(text=text):
+                item = _Item(os.path.join(_SAMPLES, "crafted"), text)
+                gated = _parse([item])
+                with mock.patch.object(eventparser, "LineTokens", _AllTokens):
+                    ungated = _parse([item])
+                self.assertEqual(gated, ungated)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# test_ruleprofile.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the ruleprofile module."""
+
+import re
+import unittest
+
+from .. import ruleprofile
+from .. import eventparser
+from ..emailextractor import FINISHED
+
+
+class RuleProfileCall(unittest.TestCase):
+    """Test the rows recorded by RuleProfile.call."""
+
+    def setUp(self):
+        """Create an empty profile."""
+        self.profile = ruleprofile.RuleProfile()
+
+    def _row(self, operation):
+        """Return the columns of the profile table row for operation."""
+        for line in self.profile.lines()[1:]:
+            row = line.split("\t")
+            if row[2] == operation:
+                return row
+        self.fail(operation.join(("No '", "' row in profile")))
+        return None
+
+    def test_regular_expression_call(self):
+        """The text given to the expression is counted and kept."""
+        text = "Alice 1-0 Bob\nCarol 0-1 Dave"
+        matches = self.profile.call(
+            FINISHED,
+            0,
+            "findall",
+            re.compile(r"\d-\d").findall,
+            (text,),
+            text,
+        )
+        self.assertEqual(matches, ["1-0", "0-1"])
+        row = self._row("findall")
+        self.assertEqual(row[:4], [FINISHED, "0", "findall", "1"])
+        self.assertEqual(row[5], "2")
+        self.assertEqual(row[6], "2")
+        self.assertEqual(row[9], repr(text))
+
+    def test_select_call(self):
+        """The slowest input of a select row is the translated line."""
+        compiled_rules = eventparser.CompiledRules([], {"Division 1"})
+        description = (
+            eventparser._EventDataRecorder(),
+            "tag",
+            compiled_rules.re_competition,
+            "file",
+            compiled_rules.competition_lookup,
+            None,
+        )
+        eventparser._translate(
+            description,
+            FINISHED,
+            {"nameone": "Alice", "scoreone": "1-0", "nametwo": "Bob"},
+            profile=self.profile,
+            index=0,
+        )
+        row = self._row("select")
+        self.assertEqual(row[:4], [FINISHED, "0", "select", "1"])
+        self.assertEqual(row[6], "1")
+        self.assertEqual(row[9], repr("Alice 1-0 Bob"))
+        self.assertIsNone(self.profile.rule_totals(FINISHED, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
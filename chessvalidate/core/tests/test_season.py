@@ -0,0 +1,136 @@
+# test_season.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for difference texts loaded when needed in the season module."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from .. import season
+from ..differenceformat import difference_lines
+
+# Texts of the extract difference files.
+_TEXTS = ("Alice 1-0 Bob\n", "Carol 0-1 Dave\n")
+
+# Edited version of the first text.
+_EDITED = "Alice 0-1 Bob\n"
+
+
+class LoadedTextsEviction(unittest.TestCase):
+    """Test texts are evicted once saved and reloaded from restore cache."""
+
+    def setUp(self):
+        """Create event folder with extract difference files."""
+        self.folder = tempfile.TemporaryDirectory()
+        extracts = os.path.join(self.folder.name, "extracts")
+        os.mkdir(extracts)
+        loaded_texts = season._LoadedTexts(1)
+        self.texts = []
+        for name, text in zip(("a", "b"), _TEXTS):
+            path = os.path.join(extracts, name)
+            with open(path, mode="w", encoding="utf8") as extract:
+                extract.writelines(difference_lines(text, text))
+            self.texts.append(
+                season._DifferenceText(
+                    path,
+                    None,
+                    loaded_texts=loaded_texts,
+                    event_folder=self.folder.name,
+                )
+            )
+
+    def tearDown(self):
+        """Remove event folder."""
+        self.folder.cleanup()
+
+    def test_evict_after_save(self):
+        """An edited text is kept until saved, then evicted and reloaded."""
+        first, second = self.texts
+        first.edited_text = _EDITED
+        self.assertEqual(second.edited_text, _TEXTS[1])
+        self.assertIsNotNone(first._diff_lines)
+
+        first.save_edited_text_as_new()
+        first.rename_new_edited_text()
+        first.commit_new_edited_text()
+        self.assertFalse(first.is_dirty)
+        digest = first.edited_text_digest
+        self.assertEqual(second.original_text, _TEXTS[1])
+        self.assertIsNone(first._diff_lines)
+
+        # The digest of the evicted text is known without loading it, and
+        # the texts are reloaded from the restore cache.
+        with mock.patch.object(
+            season, "_read_difference_file", side_effect=AssertionError
+        ):
+            self.assertEqual(first.edited_text_digest, digest)
+        with mock.patch.object(
+            season, "restore_texts", side_effect=AssertionError
+        ):
+            self.assertEqual(first.edited_text, _EDITED)
+            self.assertEqual(first.original_text, _TEXTS[0])
+        self.assertIsNone(second._diff_lines)
+
+
+class SaveModifiedTexts(unittest.TestCase):
+    """Test a failed rename puts back the versions already replaced."""
+
+    def setUp(self):
+        """Create event folder with extract difference files, all edited."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.paths = []
+        texts = []
+        for name, text in zip(("a", "b", "c"), _TEXTS + _TEXTS[:1]):
+            path = os.path.join(self.folder.name, name)
+            with open(path, mode="w", encoding="utf8") as extract:
+                extract.writelines(difference_lines(text, text))
+            dte = season._DifferenceText(path, None)
+            dte.edited_text = _EDITED
+            texts.append(dte)
+            self.paths.append(path)
+        self.season = season.Season(self.folder.name)
+        self.season._entry_text = texts[0]
+        self.season._difference_text = texts[1:]
+
+    def tearDown(self):
+        """Remove event folder."""
+        self.folder.cleanup()
+
+    def _file_texts(self):
+        """Return dict of text by name of files in event folder."""
+        file_texts = {}
+        for name in os.listdir(self.folder.name):
+            with open(
+                os.path.join(self.folder.name, name), encoding="utf8"
+            ) as file:
+                file_texts[name] = file.read()
+        return file_texts
+
+    def test_rename_fails(self):
+        """The files are as before the save if the second rename fails."""
+        before = self._file_texts()
+        replace = os.replace
+
+        def fail_second(src, dst):
+            if dst == self.paths[1]:
+                raise OSError("rename failed")
+            replace(src, dst)
+
+        with mock.patch.object(season.os, "replace", side_effect=fail_second):
+            with self.assertRaises(OSError):
+                self.season.save_modified_texts()
+        self.assertEqual(self._file_texts(), before)
+        self.assertTrue(self.season.is_modified())
+
+    def test_save(self):
+        """Every file is replaced and no new or old files are left."""
+        self.assertEqual(len(self.season.save_modified_texts()), 3)
+        self.assertEqual(sorted(self._file_texts()), ["a", "b", "c"])
+        self.assertFalse(self.season.is_modified())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -232,7 +232,14 @@ class Leagues(threadqueue.AppSysThreadQueue):
 
     def _read_results_documents(self, title, results_folder, conf=None):
         """Read results documents from results folder: return True if ok."""
-        results_data = Season(results_folder)
+        if conf is None:
+            conf = self.make_configuration_instance()
+        results_data = Season(
+            results_folder,
+            max_workers=_parse_workers(conf),
+            loaded_limit=_loaded_text_limit(conf),
+            time_budget=_rule_time_budget(conf),
+        )
         if not os.path.exists(results_folder):
             if not tkinter.messagebox.askyesno(
                 parent=self.get_widget(),
@@ -261,8 +268,6 @@ class Leagues(threadqueue.AppSysThreadQueue):
         if results_data.open_documents(self.get_widget()):
             self.results_data = results_data
             if self._results_folder != results_folder:
-                if conf is None:
-                    conf = self.make_configuration_instance()
                 conf.set_configuration_value(
                     constants.RECENT_DOCUMENT,
                     conf.convert_home_directory_to_tilde(results_folder),
@@ -305,3 +310,52 @@ class Leagues(threadqueue.AppSysThreadQueue):
 
         """
         return configuration.Configuration()
+
+
+def _rule_time_budget(conf):
+    """Return seconds allowed for a rule in configuration conf or None.
+
+    None means there is no budget: the configuration value is absent or not
+    a positive number.
+
+    """
+    value = conf.get_configuration_value(constants.RULE_TIME_BUDGET)
+    try:
+        budget = float(value)
+    except (TypeError, ValueError):
+        return None
+    if budget > 0:
+        return budget
+    return None
+
+
+def _parse_workers(conf):
+    """Return number of processes used to parse in configuration conf.
+
+    1 means the event is parsed in this process: the configuration value is
+    absent or not a whole number greater than 1.
+
+    """
+    value = conf.get_configuration_value(constants.PARSE_WORKERS)
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        return 1
+    return max(workers, 1)
+
+
+def _loaded_text_limit(conf):
+    """Return number of texts kept in memory in configuration conf or None.
+
+    None means all texts are kept in memory: the configuration value is
+    absent or not a positive whole number.
+
+    """
+    value = conf.get_configuration_value(constants.LOADED_TEXT_LIMIT)
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        return None
+    if limit > 0:
+        return limit
+    return None
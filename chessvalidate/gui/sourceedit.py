@@ -26,12 +26,9 @@ import tkinter
 import tkinter.messagebox
 import os
 import datetime
-import collections
 
-from solentware_misc.core.utilities import AppSysPersonName
 from solentware_misc.gui import panel, textreadonly, texttab
 
-from ..core.eventparser import EventParserError, IEIREE
 from ..core.season import (
     LOCAL_SOURCE,
     HEADER_TAG,
@@ -39,8 +36,8 @@ from ..core.season import (
     TRAILER_TAG,
     SEPARATOR,
 )
-from ..core.gameresults import displayresult
-from ..core.schedule import ScheduleError
+from ..core.eventreport import EventReport
+from ..core.policy import DialogPolicy
 
 _SENDER_COLOUR = "#e0f113"  # a pale yellow
 _EDITABLE = "Editable"
@@ -60,7 +57,7 @@ class SourceEditError(Exception):
     """Exception class for sourceedit module."""
 
 
-class SourceEdit(panel.PlainPanel):
+class SourceEdit(EventReport, panel.PlainPanel):
     """The Edit panel for raw results data."""
 
     _btn_generate = "sourceedit_generate"
@@ -69,27 +66,12 @@ class SourceEdit(panel.PlainPanel):
     _btn_toggle_compare = "sourceedit_toggle_compare"
     _btn_toggle_generate = "sourceedit_toggle_generate"
     _btn_report = "sourceedit_report"
-
-    _months = {
-        "01": "Jan",
-        "02": "Feb",
-        "03": "Mar",
-        "04": "Apr",
-        "05": "May",
-        "06": "Jun",
-        "07": "Jul",
-        "08": "Aug",
-        "09": "Sep",
-        "10": "Oct",
-        "11": "Nov",
-        "12": "Dec",
-    }  # assumes dates held in ISO format
+    _btn_previous = "sourceedit_previous"
+    _btn_next = "sourceedit_next"
 
     def __init__(self, parent=None, cnf=None, **kargs):
         """Extend and define results data input panel for results database."""
         super().__init__(parent=parent, cnf=cnf, **kargs)
-        self.generated_schedule = []
-        self.generated_results = []
         self.originaltext = None
         self.editedtext = None
         self.schedulectrl = None
@@ -97,6 +79,7 @@ class SourceEdit(panel.PlainPanel):
         self.originalpane = None
         self.editpane = None
         self.generatedpane = None
+        self._viewed = 0
         self.show_buttons_for_generate()
         self.create_buttons()
         self.folder = tkinter.Label(
@@ -185,6 +168,20 @@ class SourceEdit(panel.PlainPanel):
             underline=2,
             command=self.on_report,
         )
+        self.define_button(
+            self._btn_previous,
+            text="Previous",
+            tooltip="Show the previous text of the event.",
+            underline=0,
+            command=self.on_previous,
+        )
+        self.define_button(
+            self._btn_next,
+            text="Next",
+            tooltip="Show the next text of the event.",
+            underline=0,
+            command=self.on_next,
+        )
         self.define_button(
             self.btn_closedata,
             text="Close",
@@ -198,26 +195,6 @@ class SourceEdit(panel.PlainPanel):
         """Return the data input page."""
         return self.get_appsys().get_results_context()
 
-    def get_schedule(self, data):
-        """Extract event schedule and prepare report of errors."""
-        data.extract_schedule()
-        fixdata = data.fixture_schedule
-        genfix = self.generated_schedule
-        del genfix[:]
-        if len(fixdata.error):
-            genfix.append(("Errors\n", None))
-            genfix.extend(fixdata.error)
-
-    def get_results(self, data):
-        """Extract event results and prepare report of errors."""
-        data.extract_results()
-        resdata = data.collation.reports
-        genres = self.generated_results
-        del genres[:]
-        if len(resdata.error):
-            genres.append(("Errors\n", None))
-            genres.extend(resdata.error)
-
     def on_close_data(self, event=None):
         """Close the source document."""
         del event
@@ -231,6 +208,16 @@ class SourceEdit(panel.PlainPanel):
             self.show_buttons_for_update()
             self.create_buttons()
 
+    def on_next(self, event=None):
+        """Show the next text of the event."""
+        del event
+        self._view_entry(self._viewed + 1)
+
+    def on_previous(self, event=None):
+        """Show the previous text of the event."""
+        del event
+        self._view_entry(self._viewed - 1)
+
     def on_report(self, event=None):
         """Save validation report."""
         del event
@@ -270,24 +257,8 @@ class SourceEdit(panel.PlainPanel):
             ):
                 return
         results_data = self.get_context().results_data
-        entry_text = results_data.entry_text
-
-        # Ensure edited_text_on_file is set to initial value of edited_text
-        # before updating edited_text from widget.
-        # Perhaps this should be done earlier?
-        etof = entry_text.edited_text_on_file
         self._copy_data_from_widget()
-
-        modified = entry_text.edited_text != etof
-        if not modified:
-            for difference_text in results_data.difference_text:
-                if (
-                    difference_text.edited_text
-                    != difference_text.edited_text_on_file
-                ):
-                    modified = True
-                    break
-        if not modified:
+        if not results_data.is_modified():
             if self.is_report_modified():
                 if not tkinter.messagebox.askyesno(
                     parent=self.get_widget(),
@@ -311,12 +282,21 @@ class SourceEdit(panel.PlainPanel):
             ),
             title="Save",
         ):
-            results_data.entry_text.save_edited_text_as_new()
-            for difference_text in results_data.difference_text:
-                difference_text.save_edited_text_as_new()
-            results_data.entry_text.rename_new_edited_text()
-            for difference_text in results_data.difference_text:
-                difference_text.rename_new_edited_text()
+            try:
+                results_data.save_modified_texts()
+            except OSError as exc:
+                tkinter.messagebox.showinfo(
+                    parent=self.get_widget(),
+                    message="".join(
+                        (
+                            "Save event data failed.\n\n",
+                            str(exc),
+                            "\n\nData on file has not been changed.",
+                        )
+                    ),
+                    title="Save",
+                )
+                return
             self.editedtext.edit_modified(False)
             tkinter.messagebox.showinfo(
                 parent=self.get_widget(),
@@ -373,6 +353,7 @@ class SourceEdit(panel.PlainPanel):
         self.hide_panel_buttons()
         self.show_panel_buttons(
             (self._btn_toggle_generate, self.btn_closedata, self._btn_save)
+            + self._entry_buttons()
         )
 
     def show_buttons_for_generate(self):
@@ -386,6 +367,7 @@ class SourceEdit(panel.PlainPanel):
                 self._btn_save,
                 self._btn_report,
             )
+            + self._entry_buttons()
         )
 
     def show_buttons_for_update(self):
@@ -399,8 +381,15 @@ class SourceEdit(panel.PlainPanel):
                 self._btn_save,
                 self._btn_report,
             )
+            + self._entry_buttons()
         )
 
+    def _entry_buttons(self):
+        """Return buttons for moving between texts shown one at a time."""
+        if self._is_viewed_one_at_a_time():
+            return (self._btn_previous, self._btn_next)
+        return ()
+
     def _show_edits_and_generated(self):
         """Display widgets showing current data and generated reports."""
         self._hide_panes()
@@ -493,12 +482,6 @@ class SourceEdit(panel.PlainPanel):
         # self._populate_originaltext()
         # self._populate_editedtext()
 
-    @staticmethod
-    def _date_text(date):
-        """Return dd mmm yyyy given ISO format yyyy-mm-dd."""
-        year, month, day = date.split("-")
-        return " ".join((day, SourceEdit._months[month], year))
-
     def _hide_panes(self):
         """Forget the configuration of PanedWindows on data input page."""
         for pane in (
@@ -727,80 +710,108 @@ class SourceEdit(panel.PlainPanel):
         widget.tag_add(trailer, start, widget.index(tkinter.INSERT))
         widget.tag_add(_NOT_EDITABLE, start, widget.index(tkinter.INSERT))
 
+    def _is_viewed_one_at_a_time(self):
+        """Return True if the texts are loaded, and shown, one at a time."""
+        return self.get_context().results_data.loaded_limit is not None
+
+    def _entries(self):
+        """Return list of (tag suffix, entry) for the texts of the event."""
+        results_data = self.get_context().results_data
+        entries = [(LOCAL_SOURCE, results_data.entry_text)]
+        entries.extend(
+            (str(i), difference_text)
+            for i, difference_text in enumerate(results_data.difference_text)
+        )
+        return entries
+
+    def _shown_entries(self):
+        """Return list of (tag suffix, entry) for the texts in the widgets.
+
+        All texts are shown unless they are loaded when needed, when only
+        the text being viewed is shown.  The tags of the texts not shown are
+        set so the data generated from them can refer to them.
+
+        """
+        entries = self._entries()
+        if not self._is_viewed_one_at_a_time():
+            return entries
+        for tagsuffix, entry in entries:
+            entry.set_tags(tagsuffix)
+        self._viewed = max(0, min(self._viewed, len(entries) - 1))
+        return entries[self._viewed : self._viewed + 1]
+
+    def _view_entry(self, index):
+        """Show the text at index after keeping edits to the text shown."""
+        if not 0 <= index < len(self._entries()):
+            return
+        self._copy_data_from_widget()
+        modified = self.is_report_modified()
+        self._viewed = index
+        self._populate_editedtext()
+        if self.originaltext is not None:
+            self._populate_originaltext()
+        self.editedtext.edit_modified(modified)
+
+    def _see_data_tag(self, tag):
+        """Scroll edited document to tag, showing its text if necessary."""
+        wedit = self.editedtext
+        if not wedit.tag_ranges(tag) and self._is_viewed_one_at_a_time():
+            for index, (_, entry) in enumerate(self._entries()):
+                if entry.data_tag == tag:
+                    self._view_entry(index)
+                    break
+        tredit = wedit.tag_ranges(tag)
+        if tredit:
+            wedit.see(tredit[0])
+            return True
+        return False
+
     def _populate_editedtext(self):
         """Put edited document in it's Text widget for display."""
         wedit = self.editedtext
         wedit.delete("1.0", tkinter.END)
-        entry_text = self.get_context().results_data.entry_text
-        self._insert_entry(
-            wedit, LOCAL_SOURCE, entry_text, entry_text.edited_text
-        )
-        for i, difference_text in enumerate(
-            self.get_context().results_data.difference_text
-        ):
-            self._insert_entry(
-                wedit, str(i), difference_text, difference_text.edited_text
-            )
+        for tagsuffix, entry in self._shown_entries():
+            self._insert_entry(wedit, tagsuffix, entry, entry.edited_text)
 
     def _populate_originaltext(self):
         """Put original document in it's Text widget for display."""
         worig = self.originaltext
         worig.delete("1.0", tkinter.END)
-        entry_text = self.get_context().results_data.entry_text
-        self._insert_entry(
-            worig, LOCAL_SOURCE, entry_text, entry_text.original_text
-        )
-        for i, difference_text in enumerate(
-            self.get_context().results_data.difference_text
-        ):
-            self._insert_entry(
-                worig, str(i), difference_text, difference_text.original_text
-            )
+        for tagsuffix, entry in self._shown_entries():
+            self._insert_entry(worig, tagsuffix, entry, entry.original_text)
 
     def _copy_data_from_widget(self):
         """Copy current widget data to season's event data attributes."""
         wedit = self.editedtext
-        results_data = self.get_context().results_data
 
         # Strip off the place-holder newline characters returned by get.
         # These were added by insert when the data was displayed.
-        for difference_text in results_data.difference_text:
-            start, end = wedit.tag_ranges(difference_text.data_tag)
-            difference_text.edited_text = wedit.get(
+        for _, entry in self._shown_entries():
+            start, end = wedit.tag_ranges(entry.data_tag)
+            entry.edited_text = wedit.get(
                 wedit.index(start) + " +1 char", wedit.index(end) + " -1 char"
             )
-        entry_text = results_data.entry_text
-        start, end = wedit.tag_ranges(entry_text.data_tag)
-        entry_text.edited_text = wedit.get(
-            wedit.index(start) + " +1 char", wedit.index(end) + " -1 char"
-        )
 
     def _results_popup(self, event=None):
         """Scroll edited document to selected text in result report."""
-        wedit = self.editedtext
         wresults = self.resultsctrl
         tags = wresults.tag_names(
             wresults.index("".join(("@", str(event.x), ",", str(event.y))))
         )
         for tag in tags:
             if tag.startswith(_SELECT_FROM_GENERATED):
-                tredit = wedit.tag_ranges(tag)
-                if tredit:
-                    wedit.see(tredit[0])
+                if self._see_data_tag(tag):
                     return
 
     def _schedule_popup(self, event=None):
         """Scroll edited document to selected text in schedule report."""
-        wedit = self.editedtext
         wschedule = self.schedulectrl
         tags = wschedule.tag_names(
             wschedule.index("".join(("@", str(event.x), ",", str(event.y))))
         )
         for tag in tags:
             if tag.startswith(_SELECT_FROM_GENERATED):
-                tredit = wedit.tag_ranges(tag)
-                if tredit:
-                    wedit.see(tredit[0])
+                if self._see_data_tag(tag):
                     return
 
     def _editedtext_popup(self, event=None):
@@ -822,180 +833,15 @@ class SourceEdit(panel.PlainPanel):
         """Generate report on data input and return True if data is ok.
 
         Data can be ok and still be wrong.  ok means merely that the data
-        input is consistent.  A number of formats are acceptable and named
-        in sectiontypes below.
+        input is consistent.
 
         """
-        sectiontypes = {
-            "allplayall": self._report_allplayall,  # individuals
-            "league": lambda s, d: None,  # team all play all
-            "swiss": self._report_swiss,  # individuals
-            "fixturelist": lambda s, d: None,  # matches from fixture list
-            "individual": self._report_individual,  # games between players
-        }
         self._copy_data_from_widget()
         data = self.get_context().results_data
-        try:
-            data.extract_event()
-        except EventParserError as exp:
-            tkinter.messagebox.showinfo(
-                parent=self.get_widget(),
-                message=str(exp),
-                title="Event Extract Error",
-            )
-            return False
-        except RuntimeError as exp:
-            if str(exp) == IEIREE:
-                tkinter.messagebox.showinfo(
-                    parent=self.get_widget(),
-                    message=" ".join(
-                        (
-                            "An exception has occurred while extracting",
-                            "result information using one of the default",
-                            "regular expressions.\n\nThe latest version of",
-                            "Python, or at least a different version (change",
-                            "between 3.3.1 and 3.3.2 for example) may process",
-                            "the text correctly.\n\nAn exception will be",
-                            "raised on dismissing this dialogue.",
-                        )
-                    ),
-                    title="Regular Expression Runtime Error",
-                )
-            raise
-        try:
-            self.get_schedule(data)
-        except ScheduleError as exp:
-            tkinter.messagebox.showinfo(
-                parent=self.get_widget(),
-                message="".join(
-                    (
-                        str(exp).join(('Exception "', '" has occurred.\n\n')),
-                        "This probably indicates an invalid combination of ",
-                        "settings in the result extraction configuration ",
-                        "file.",
-                    )
-                ),
-                title="Extract Schedule Error",
-            )
-            return False
-        # pycodestyle E722 do not use bare 'except'.
-        # pylint accepts this because of the following 'raise' statement.
-        except:
-            tkinter.messagebox.showinfo(
-                parent=self.get_widget(),
-                message="".join(
-                    (
-                        "An exception has occured and will be reported on ",
-                        "dismissing this dialogue.\n\nPlease consider the ",
-                        "possibility text in one of the emails has been ",
-                        "misinterpreted as unexpected information about ",
-                        "a result, rather than being ignored.\n\nWords like ",
-                        "'default' and 'draw', or a sprinkling of numbers ",
-                        "like '1', '12' and '2', are likely culprits ",
-                        "because they have a place in identifying results.",
-                        "\n\nThe possibility is a consequence of not being ",
-                        "too fussy about how results are presented.",
-                    )
-                ),
-                title="Generate",
-            )
-            raise
-        self._report_fixtures(data)
-
-        # Remove the 'try' wrapping once the problem is fixed.
-        # The KeyError might be fixable but the AttributeError is a genuine
-        # problem found by accident; and probably deserves an Exception of
-        # it's own.
-        try:
-            self.get_results(data)
-        except KeyError:
-            tkinter.messagebox.showinfo(
-                parent=self.get_widget(),
-                message="".join(
-                    (
-                        "Known causes of this exception are:\n\n",
-                        "A badly-formed entry in a swiss table: for example ",
-                        "'x' or 'w12w'.\n",
-                        "\nA well-formed entry in a swiss table refering to ",
-                        "a row which does not exist: for example 'w12+' ",
-                        "where '12' is not a player's PIN.\n",
-                        "\nAn ECF code or membership number missing the ",
-                        "single alpha character suffix or prefix.\n",
-                        "\n Edit document as workaround (or solution).",
-                    )
-                ),
-                title="Generate Report KeyError Exception",
-            )
-            return False
-        except AttributeError as exc:
-            if str(exc) != "".join(
-                ("'NoneType' object has no attribute 'authorization_delay'",)
-            ):
-                raise
-            tkinter.messagebox.showinfo(
-                parent=self.get_widget(),
-                message="".join(
-                    (
-                        "The known cause of this exception is:\n\n",
-                        "Type a match result in the textentry area, ",
-                        "perhaps because the usual email report is ",
-                        "not available, with date, competition, ",
-                        "match score, and each game result, on their ",
-                        "own line.  This is the format accepted by ",
-                        "default without rules in configuration file.\n\n",
-                        "Copy, paste, and edit, a match result in it's ",
-                        "usual email format to the textentry area leads ",
-                        "to a normal error report expected in other ",
-                        "situations.\n\nIf the match report must be ",
-                        "typed do the copy, paste, and edit, in the ",
-                        "copied report's original email area.",
-                    )
-                ),
-                title="Generate Report AttributeError Exception",
-            )
-            return False
-
-        if (
-            len(data.collation.reports.error) == 0
-            and len(data.fixture_schedule.error) == 0
+        if not self.build_event_report(
+            data, DialogPolicy(self.get_widget())
         ):
-
-            schedule = data.collation.schedule
-            self.generated_schedule.insert(0, (schedule.es_name, None))
-            self.generated_schedule.insert(
-                1,
-                (
-                    " ".join(
-                        (
-                            "From",
-                            self._date_text(schedule.es_startdate),
-                            "to",
-                            self._date_text(schedule.es_enddate),
-                        )
-                    ),
-                    None,
-                ),
-            )
-
-            report = data.collation.reports
-            genres = self.generated_results
-            genres.append((report.er_name, None))
-            self._report_players(data)
-            league_processed = False
-            for section in data.collation.report_order:
-                process = sectiontypes.get(
-                    data.collation.section_type[section],
-                    self._section_type_unknown,
-                )
-                if not isinstance(process, collections.abc.Callable):
-                    process = self._report_not_implemented
-                process(section, data)
-                if process is sectiontypes["league"]:
-                    league_processed = True
-                elif process is sectiontypes["fixturelist"]:
-                    league_processed = True
-            if league_processed:
-                self._report_league(None, data)
+            return False
         self.schedulectrl.delete("1.0", tkinter.END)
 
         widget = self.schedulectrl
@@ -1032,485 +878,6 @@ class SourceEdit(panel.PlainPanel):
 
         return len(data.collation.reports.error) == 0
 
-    def _report_fixtures(self, data):
-        """Append fixtures to event schedule report."""
-        fixdata = data.fixture_schedule
-        if len(fixdata.error):
-            return
-        genfix = self.generated_schedule
-        genfix.append(("", None))
-        divisions = sorted(list(fixdata.es_summary.keys()))
-        for division in divisions:
-            genfix.append((division, None))
-            teams = sorted(list(fixdata.es_summary[division]["teams"].keys()))
-            for team in teams:
-                team_data = fixdata.es_summary[division]["teams"][team]
-                genfix.append(
-                    (
-                        "".join(
-                            (
-                                team,
-                                "   ",
-                                str(team_data["homematches"]),
-                                " home, ",
-                                str(team_data["awaymatches"]),
-                                " away matches",
-                            )
-                        ),
-                        None,
-                    )
-                )
-            genfix.append(("", None))
-        fixtures = []
-        if len(fixdata.es_fixtures):
-            for fixture in fixdata.es_fixtures:
-                fixtures.append(
-                    (
-                        (
-                            fixture.competition,
-                            "  ",
-                            fixture.hometeam,
-                            " - ",
-                            fixture.awayteam,
-                        ),
-                        len(
-                            fixtures
-                        ),  # to hide unorderable fixture.tagger from sort
-                        fixture.tagger,
-                    )
-                )
-            fixtures.sort()
-            for fixture, _, tagger in fixtures:
-                tagger.append_generated_schedule(genfix, "".join(fixture))
-            genfix.append(("", None))
-
-    def _report_fixtures_played_status(self, data):
-        """Append list of unreported fixtures to results report."""
-        if len(data.collation.reports.error):
-            return
-        genres = self.generated_results
-        fnp = data.collation.get_fixtures_not_played()
-        if len(fnp) == 0:
-            return
-        today = datetime.date.today().isoformat()
-        genres.append(
-            (
-                "".join(
-                    ("Fixtures not played or not reported at ", today, "\n")
-                ),
-                None,
-            )
-        )
-        for match in fnp:
-            if match.date > today:
-                dfnp = "          "
-            else:
-                dfnp = match.date
-            match.tagger.append_generated_report(
-                genres,
-                " ".join(
-                    (
-                        dfnp,
-                        match.competition,
-                        match.hometeam,
-                        "-",
-                        match.awayteam,
-                    )
-                ),
-            )
-        genres.append(("", None))
-
-    def _report_matches(self, data):
-        """Append list of reported fixtures to results report."""
-        resdata = data.collation
-        if len(resdata.reports.error):
-            return
-        genres = self.generated_results
-        genres.append(("Matches in event by competition\n", None))
-        for match in resdata.get_reports_by_match():
-            hts = match.homescore
-            if not hts:
-                hts = ""
-            ats = match.awayscore
-            if not ats:
-                ats = ""
-            match.tagger.append_generated_report(
-                genres,
-                " ".join(
-                    (
-                        match.hometeam,
-                        hts,
-                        "-",
-                        ats,
-                        match.awayteam,
-                        "\t\t\t\t\t",
-                        match.competition,
-                    )
-                ),  # source
-            )
-            if match.default:
-                genres.append(("    Match defaulted", None))
-            for game in match.games:
-                result, uftag, gradetag = game.get_print_result()
-                if game in resdata.gamesxref:
-                    uftag = displayresult.get(
-                        resdata.gamesxref[game].result, uftag
-                    )
-                if len(uftag) or len(gradetag):
-                    uftag = "    ".join(("", uftag, gradetag))
-                if not result:
-                    result = "     "
-                homeplayer = game.homeplayer.name
-                if not homeplayer:
-                    homeplayer = ""
-                awayplayer = game.awayplayer.name
-                if not awayplayer:
-                    awayplayer = ""
-                game.tagger.append_generated_report(
-                    genres,
-                    " ".join(
-                        (
-                            "   ",
-                            homeplayer,
-                            result,
-                            awayplayer,
-                            "       ",
-                            uftag,
-                        )
-                    ),
-                )
-            genres.append(("", None))
-
-    def _report_matches_by_source(self, data):
-        """Override, append list of fixtures by source to results report.
-
-        Source may be a file name or some kind of heading within the file.  The
-        report for each fixture may include a comment that game scores for the
-        fixture are not consistent with total score.
-
-        """
-        # The PDLEdit and SLEdit references are long since deleted, but they
-        # are why code is as is here.
-        # PDLEdit should have had some tests on source attribute according to
-        # docstring for _report_matches_by_source.
-
-        # Only SLEdit had this check.
-        if len(data.collation.reports.error):
-            return
-
-        # Part of SLEdit hack to spot matches played before fixture date when
-        # no dates reported on match results.
-        today = datetime.date.today().isoformat()
-
-        genres = self.generated_results
-        genres.append(
-            ("\nMatch reports sorted by email date and team names\n", None)
-        )
-        matches, playedongames = data.collation.get_reports_by_source()
-        if matches:
-            currtag = matches[0][0].tagger.datatag
-        for match, ufg, consistent in matches:
-            del ufg
-            if currtag != match.tagger.datatag:
-                currtag = match.tagger.datatag
-                genres.append(("", None))
-            match.tagger.append_generated_report(
-                genres,
-                " ".join((match.hometeam, "-", match.awayteam)),
-            )
-
-            # Part of SLEdit hack to spot matches played before fixture date.
-            # Need to test 'date report sent' for correct answer always.
-            try:
-                if len(today) == len(match.date):
-                    if match.date > today:
-                        match.tagger.append_generated_report(
-                            genres,
-                            "".join(("   match reported early at ", today)),
-                        )
-            except (TypeError, AttributeError):
-                pass
-
-            if not consistent:
-                genres.append(
-                    ("   match score not consistent with game reports", None)
-                )
-            for game in match.games:
-                if game.result is None:
-                    homeplayer = game.homeplayer
-                    if homeplayer:
-                        homeplayer = homeplayer.name
-                    else:
-                        homeplayer = ""
-                    awayplayer = game.awayplayer
-                    if awayplayer:
-                        awayplayer = awayplayer.name
-                    else:
-                        awayplayer = ""
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            ("   unfinished  ", homeplayer, "-", awayplayer)
-                        ),
-                    )
-        if len(playedongames):
-            genres.append(("\nPlayed-on Games in entry order\n", None))
-            currtag = playedongames[0].tagger.datatag
-            for game in playedongames:
-                if game.result is None:
-                    continue
-                if currtag != game.tagger.datatag:
-                    currtag = game.tagger.datatag
-                    genres.append(("", None))
-                game.tagger.append_generated_report(
-                    genres,
-                    " ".join(("   ", game.hometeam, "-", game.awayteam)),
-                )
-                homeplayer = game.homeplayer
-                if homeplayer:
-                    homeplayer = homeplayer.name
-                else:
-                    homeplayer = ""
-                awayplayer = game.awayplayer
-                if awayplayer:
-                    awayplayer = awayplayer.name
-                else:
-                    awayplayer = ""
-                game.tagger.append_generated_report(
-                    genres,
-                    "".join(
-                        (
-                            "        ",
-                            " ".join(
-                                (
-                                    homeplayer,
-                                    displayresult.get(game.result, "unknown"),
-                                    awayplayer,
-                                )
-                            ),
-                        )
-                    ),
-                )
-        genres.append(("", None))
-
-    def _report_non_fixtures_played(self, data):
-        """Append list of results additional to fixtures to results report."""
-        if len(data.collation.reports.error):
-            return
-        genres = self.generated_results
-        nfp = data.collation.get_non_fixtures_played()
-        if len(nfp) == 0:
-            return
-        genres.append(("Reported matches not on fixture list\n", None))
-        for match in nfp:
-            match.tagger.append_generated_report(
-                genres,
-                " ".join(
-                    (
-                        match.competition,
-                        "",
-                        match.hometeam,
-                        "-",
-                        match.awayteam,
-                    )
-                ),
-            )
-        genres.append(("", None))
-
-    def _report_players(self, data):
-        """Append list of players sorted by affiliation to schedule report."""
-        if len(data.collation.reports.error):
-            return
-        schedule = data.collation.schedule
-        genfix = self.generated_schedule
-        if len(data.collation.players):
-            genfix.append(("", None))
-            genfix.append(
-                (
-                    " ".join(
-                        (
-                            "Player identities (with club or place",
-                            "association and reported codes)",
-                        )
-                    ),
-                    None,
-                )
-            )
-            genfix.append(("", None))
-        drp = data.collation.players
-        for name, player in [
-            p[-1]
-            for p in sorted(
-                [
-                    (
-                        AppSysPersonName(drp[p].name).name,
-                        (drp[p].get_brief_identity(), p),
-                    )
-                    for p in drp
-                ]
-            )
-        ]:
-            section = drp[player].section
-            if section in schedule.es_players:
-                if name in schedule.es_players[section]:
-                    genfix.append(
-                        (
-                            "\t".join(
-                                (
-                                    drp[player].get_short_identity(),
-                                    "".join(
-                                        (
-                                            "(",
-                                            schedule.es_players[section][
-                                                name
-                                            ].affiliation,
-                                            ")",
-                                        )
-                                    ),
-                                    drp[player].get_reported_codes(),
-                                )
-                            ).strip(),
-                            None,
-                        )
-                    )
-                    continue
-            genfix.append(
-                (
-                    "\t".join(
-                        (
-                            self.get_player_brief(drp[player]),
-                            drp[player].get_reported_codes(),
-                        )
-                    ).strip(),
-                    None,
-                )
-            )
-
-    @staticmethod
-    def get_player_brief(player):
-        """Return player identity for schedule report."""
-        return player.get_short_identity()
-
-    def _report_player_matches(self, data):
-        """Append list of fixtures for each player to results report."""
-        if len(data.collation.reports.error):
-            return
-        teamplayers = data.collation.get_reports_by_player()
-        genres = self.generated_results
-        genres.append(("Player reports\n", None))
-        for player in sorted(teamplayers.keys()):
-            genres.append((player[-1][0], None))
-            match_games = []
-            for team, match in teamplayers[player]:
-                match_games.append(
-                    (match.date if match.date is not None else "", team, match)
-                )
-            for team, match in [m[-2:] for m in sorted(match_games)]:
-                hometeam = match.hometeam
-                awayteam = match.awayteam
-                if hometeam == team:
-                    hometeam = "*"
-                if awayteam == team:
-                    awayteam = "*"
-                match.tagger.append_generated_report(
-                    genres,
-                    " ".join(
-                        (
-                            "  ",
-                            team,
-                            "  ",
-                            hometeam,
-                            "-",
-                            awayteam,
-                            "    ",
-                            match.source,
-                        )
-                    ),
-                )
-            genres.append(("", None))
-
-    def report_players_by_club(self, data):
-        """Append list of players sorted by club to results report."""
-        if len(data.collation.reports.error):
-            return
-        clubs = data.collation.get_players_by_club()
-        eventname = set()
-        for club_players in clubs.values():
-            for player_name in club_players:
-                eventname.add(player_name[1:-1])
-        genres = self.generated_results
-
-        genres.append(("Players by club\n", None))
-        genres.append(
-            (
-                "".join(
-                    (
-                        "This report was generated without a database open ",
-                        "to look up grading codes.",
-                    )
-                ),
-                None,
-            )
-        )
-        genres.append(
-            (
-                "".join(
-                    (
-                        "Any reported codes, usually grading codes, follow ",
-                        "the player name.\n",
-                    )
-                ),
-                None,
-            )
-        )
-        for club_name in sorted(clubs.keys()):
-            clubplayers = data.collation.clubplayers[club_name]
-            genres.append((club_name + "\n", None))
-            for player_name in clubs[club_name]:
-                genres.append(
-                    (
-                        "\t\t\t\t".join(
-                            (
-                                player_name[0],
-                                " ".join(clubplayers[player_name]),
-                            )
-                        ),
-                        None,
-                    )
-                )
-            genres.append(("", None))
-        return
-
-    def _report_unfinished_games(self, data):
-        """Append list of unfinished reported games to results report."""
-        if len(data.collation.reports.error):
-            return
-        genres = self.generated_results
-        unfinished_games = data.collation.get_unfinished_games()
-        if len(unfinished_games) == 0:
-            return
-        genres.append(("Unfinished games\n", None))
-        for match, game in unfinished_games:
-            match.tagger.append_generated_report(
-                genres,
-                " ".join(
-                    (match.hometeam, "-", match.awayteam, "   ", match.source)
-                ),
-            )
-            game.tagger.append_generated_report(
-                genres,
-                " ".join(
-                    (
-                        "  ",
-                        game.board,
-                        game.homeplayer.name,
-                        "-",
-                        game.awayplayer.name,
-                    )
-                ),
-            )
-        genres.append(("", None))
-
     # Method used in three subclasses but not this class.
     # Code originally in update_event_results() method of ChessResults
     # version of SourceEdit class (when it was only version).
@@ -1529,270 +896,3 @@ class SourceEdit(panel.PlainPanel):
 
     # Preserve original method name for a while.
     _collate_unfinished_games = collate_unfinished_games
-
-    def _report_allplayall(self, section, data):
-        """Generate results report for all play all event."""
-        schedule = data.collation.schedule
-        genres = self.generated_results
-        if section not in data.collation.games:
-            genres.append(("", None))
-            genres.append((section, None))
-            genres.append(("No games reported for this competition", None))
-            genres.append(("", None))
-            return
-        if section in data.collation.reports.er_section:
-            games = data.collation.games[section].games
-            genres.append(("", None))
-            genres.append((section, None))
-
-            # Hack round for wallcharts and swiss tournaments presented in
-            # an all-play-all format, because the deduced round is wrong or
-            # irrelevant.
-            if len(schedule.es_round_dates[section]):
-                genres.append(("Games in round order", None))
-            else:
-                genres.append(
-                    ("All-play-all format games in entry order", None)
-                )
-                round_date = None
-
-            round_ = None
-            for game in games:
-                if round_ != game.round:
-                    round_ = game.round
-                    genres.append(("", None))
-                    if round_ in schedule.es_round_dates[section]:
-                        round_date = schedule.es_round_dates[section][round_]
-                    else:
-                        round_date = schedule.es_startdate
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            (
-                                section,
-                                "Round",
-                                str(round_),
-                                "played on",
-                                self._date_text(round_date),
-                            )
-                        ),
-                    )
-                    genres.append(("", None))
-                if round_date == game.date:
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            (
-                                game.homeplayer.name,
-                                game.get_print_result()[0],
-                                game.awayplayer.name,
-                            )
-                        ),
-                    )
-                else:
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            (
-                                self._date_text(game.date),
-                                game.homeplayer.name,
-                                game.get_print_result()[0],
-                                game.awayplayer.name,
-                            )
-                        ),
-                    )
-
-    def _report_individual(self, section, data):
-        """Generate results report for collection of games for individuals."""
-        genres = self.generated_results
-        if section not in data.collation.games:
-            genres.append(("", None))
-            genres.append((section, None))
-            genres.append(("No games reported for this competition", None))
-            genres.append(("", None))
-            return
-        schedule = data.collation.schedule
-        report = data.collation.games[section]
-        if section in data.collation.reports.er_section:
-            games = report.games
-            genres.append(("", None))
-            genres.append((section, None))
-            genres.append(("Games in entry order", None))
-            event_date = schedule.es_startdate
-            for game in games:
-                if event_date == game.date:
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            (
-                                game.homeplayer.name,
-                                game.get_print_result()[0],
-                                game.awayplayer.name,
-                            )
-                        ),
-                    )
-                else:
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            (
-                                self._date_text(game.date),
-                                game.homeplayer.name,
-                                game.get_print_result()[0],
-                                game.awayplayer.name,
-                            )
-                        ),
-                    )
-
-    def _report_league(self, section, data):
-        """Generate results report for matches in a league."""
-        del section
-        self._report_matches_by_source(data)
-        self._report_fixtures_played_status(data)
-        self._report_non_fixtures_played(data)
-        self._report_unfinished_games(data)
-        self._report_matches(data)
-        self.report_players_by_club(data)
-        self._report_player_matches(data)
-
-    @staticmethod
-    def _report_not_implemented(section, data):
-        data.collation.error.append(("", None))
-        data.collation.error.append(
-            (
-                " ".join(("Support for", section, "format not implemented")),
-                None,
-            )
-        )
-        data.collation.error.append(("", None))
-
-    def _report_swiss(self, section, data):
-        """Generate results report for swiss tournament for individuals."""
-        genfix = self.generated_schedule
-        genres = self.generated_results
-        schedule = data.collation.schedule
-        report = data.collation.reports
-        if section not in data.collation.games:
-            genres.append(("", None))
-            genres.append((section, None))
-            genres.append(("No games reported for this competition", None))
-            genres.append(("", None))
-            return
-        games = data.collation.games[section].games
-        if section in schedule.es_section:
-            genfix.append(("", None))
-            genfix.append((section, None))
-            rounds = sorted(list(schedule.es_round_dates[section].keys()))
-            round_count = 0
-            for pin in report.er_swiss_table[section]:
-                round_count = max(
-                    round_count, len(report.er_swiss_table[section][pin])
-                )
-            genfix.append(("Round dates", None))
-            if len(rounds):
-                for round_ in rounds:
-                    genfix.append(
-                        (
-                            "\t".join(
-                                (
-                                    str(round_),
-                                    self._date_text(
-                                        schedule.es_round_dates[section][
-                                            round_
-                                        ]
-                                    ),
-                                )
-                            ),
-                            None,
-                        )
-                    )
-                if len(rounds) != round_count:
-                    genfix.append(
-                        (
-                            " ".join(
-                                (
-                                    "The following rounds have no specified",
-                                    "date. These are deemed played on the",
-                                    "eventstart date.",
-                                )
-                            ),
-                            None,
-                        )
-                    )
-                    for round_ in range(1, round_count + 1):
-                        if round_ not in rounds:
-                            genfix.append(
-                                (" ".join(("Round", str(round_))), None)
-                            )
-            else:
-                genfix.append(
-                    (
-                        " ".join(
-                            (
-                                "All rounds are deemed played on the event",
-                                "start date because no round dates are",
-                                "specified.",
-                            )
-                        ),
-                        None,
-                    )
-                )
-        if section in report.er_section:
-            games = data.collation.games[section].games
-            genres.append(("", None))
-            genres.append((section, None))
-            genres.append(("Games in round order", None))
-            round_ = None
-            for game in games:
-                if round_ != game.round:
-                    round_ = game.round
-                    genres.append(("", None))
-                    intr = int(round_) if round_.isdigit() else round_
-                    if intr in schedule.es_round_dates[section]:
-                        round_date = schedule.es_round_dates[section][intr]
-                    else:
-                        round_date = schedule.es_startdate
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            (
-                                section,
-                                "Round",
-                                str(round_),
-                                "played on",
-                                self._date_text(round_date),
-                            )
-                        ),
-                    )
-                    genres.append(("", None))
-                if round_date == game.date:
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            (
-                                game.homeplayer.name,
-                                game.get_print_result()[0],
-                                game.awayplayer.name,
-                            )
-                        ),
-                    )
-                else:
-                    game.tagger.append_generated_report(
-                        genres,
-                        " ".join(
-                            (
-                                self._date_text(game.date),
-                                game.homeplayer.name,
-                                game.get_print_result()[0],
-                                game.awayplayer.name,
-                            )
-                        ),
-                    )
-
-    @staticmethod
-    def _section_type_unknown(section, data):
-        data.collation.error.append(("", None))
-        data.collation.error.append(
-            (" ".join((section, "type not known")), None)
-        )
-        data.collation.error.append(("", None))